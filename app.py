@@ -1,5 +1,12 @@
 # file: app.py
-from gui.gui_main import run_app
+
+
+def main():
+    # Tk and the widget tree are only imported when the app is launched
+    from gui.gui_main import run_app
+
+    run_app()
+
 
 if __name__ == "__main__":
-    run_app()
\ No newline at end of file
+    main()
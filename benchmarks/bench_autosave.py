@@ -0,0 +1,60 @@
+# file: benchmarks/bench_autosave.py
+"""
+Autosave cost by map size: rewriting the whole map (JSON / .hexmap)
+versus appending the edited hexes to the MapJournal.
+
+    python -m benchmarks.bench_autosave [edits] [radius ...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from core import json_stream, map_format
+from core.grid import HexGrid
+from core.map_journal import MapJournal
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(edits: int, radii):
+    rng = random.Random(3)
+    print(f"{'hexes':>9}  {'full json':>10}  {'full hexmap':>11}  {'journal ' + str(edits):>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for radius in radii:
+            grid = HexGrid()
+            grid.generate_hex_radius(radius)
+            coords = list(grid.tiles)
+
+            json_path = os.path.join(tmp, "map.json")
+            bin_path = os.path.join(tmp, "map" + map_format.SUFFIX)
+            full_json = timed(json_stream.save_grid, grid, json_path)
+            full_bin = timed(map_format.save, grid, bin_path)
+
+            journal = MapJournal(json_path)
+            journal.reset()
+
+            def autosave():
+                dirty = rng.sample(coords, edits)
+                for c in dirty:
+                    grid.set_biome(c, "forest")
+                journal.append(grid, dirty)
+
+            append = timed(autosave, repeat=10)
+            print(f"{len(coords):>9,}  {full_json * 1000:8.1f}ms  {full_bin * 1000:9.1f}ms  "
+                  f"{append * 1000:10.2f}ms")
+
+            assert MapJournal(json_path).load().tiles == grid.tiles
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(args[0] if args else 25, args[1:] or [25, 100, 250])
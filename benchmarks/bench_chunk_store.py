@@ -0,0 +1,73 @@
+# file: benchmarks/bench_chunk_store.py
+"""
+Chunked map store: open time by map size, and the cost of drawing a
+screen-sized viewport while panning across a giant map.
+
+    python -m benchmarks.bench_chunk_store [hexes ...]
+
+Each map is a square of about `hexes` (default 1M, 10M, 50M) built
+straight from chunk records. Open time should not grow with the map;
+a pan step should fault in only the chunks newly under the viewport.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from core import chunk_store
+from core.grid import HexTile
+
+VIEW_Q, VIEW_R = 48, 32         # a full-screen viewport at the default hex size
+PAN_STEPS = 200
+BIOMES = ("plains", "forest", "hills")
+
+
+def build(path, hexes: int) -> float:
+    """Square map of about `hexes`, every chunk a copy of one template record."""
+    c = chunk_store.CHUNK
+    side = -(-int(hexes ** 0.5) // c) * c
+    t0 = time.perf_counter()
+    store = chunk_store.ChunkStore.create(path, (0, side - 1, 0, side - 1), c)
+    template = store.encode((0, 0), {
+        (q, r): HexTile(BIOMES[(q // 8 + r // 5) % len(BIOMES)])
+        for q in range(c) for r in range(c)
+    })
+    for cq in range(side // c):
+        for cr in range(side // c):
+            store.put_raw((cq, cr), template)
+    store.tiles = side * side
+    store.close()
+    return time.perf_counter() - t0
+
+
+def main(sizes):
+    print(f"{'hexes':>12}  {'file':>8}  {'build':>7}  {'open':>8}  "
+          f"{'pan step':>9}  {'faults/step':>11}  {'loaded':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for hexes in sizes:
+            path = os.path.join(tmp, "map" + chunk_store.SUFFIX)
+            built = build(path, hexes)
+
+            t0 = time.perf_counter()
+            grid = chunk_store.open_grid(path, max_chunks=64)
+            opened = time.perf_counter() - t0
+
+            # pan diagonally one hex per step, drawing the viewport each time
+            tiles = grid.tiles
+            start = grid.bounds()[1] // 4
+            t0 = time.perf_counter()
+            for step in range(PAN_STEPS):
+                q, r = start + step, start + step // 2
+                drawn = sum(1 for _ in grid.region(q, q + VIEW_Q, r, r + VIEW_R))
+                assert drawn == (VIEW_Q + 1) * (VIEW_R + 1)
+            pan = (time.perf_counter() - t0) / PAN_STEPS
+
+            print(f"{len(tiles):>12,}  {os.path.getsize(path) / 1e6:6.0f}MB  {built:6.1f}s  "
+                  f"{opened * 1000:6.2f}ms  {pan * 1000:7.2f}ms  "
+                  f"{tiles.faults / PAN_STEPS:11.2f}  {tiles.loaded:>6}")
+            tiles.close()
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000_000, 10_000_000, 50_000_000])
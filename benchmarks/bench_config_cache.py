@@ -0,0 +1,81 @@
+# file: benchmarks/bench_config_cache.py
+"""
+Library loading: parsing the CSVs versus the compiled cache, on the
+shipped config and on generated configs with thousands of rows.
+
+    python -m benchmarks.bench_config_cache [rows ...]
+"""
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core import config_cache
+
+
+def make_config(base: Path, rows: int):
+    """Copy config/ and pad every library with `rows` generated entries."""
+    shutil.copytree("config", base, dirs_exist_ok=True)
+    padding = {
+        "biomes.csv": lambda i: {"id": f"biome_{i}", "name": f"Biome {i}", "base_cost": 1 + i % 4,
+                                 "danger": 0.1 * (i % 9), "move_difficulty": i % 3,
+                                 "color": f"#{i * 2654435761 % 0xFFFFFF:06x}",
+                                 "stealth_dc": 10 + i % 8, "description": "generated",
+                                 "occlusion": i % 2},
+        "trails.csv": lambda i: {"id": f"trail_{i}", "name": f"Trail {i}", "cost_mod": -(i % 2),
+                                 "color": "#a9742a", "width": 1 + i % 4, "description": "generated"},
+        "travel_modes.csv": lambda i: {"id": f"mode_{i}", "name": f"Mode {i}", "speed_mod": i % 3 - 1,
+                                       "description": "generated", "stealth_dc_mod": i % 5,
+                                       "trail_type": ""},
+        "modifiers.csv": lambda i: {"id": f"weather_{i}", "name": f"Weather {i}",
+                                    "start_day": i % 360, "end_day": i % 360 + 30,
+                                    "period_days": 360, "add": i % 3, "mul": 1,
+                                    "biomes": "forest;hills", "region": "", "description": "generated"},
+    }
+    for filename, row in padding.items():
+        path = base / filename
+        with path.open(newline="", encoding="utf-8") as f:
+            fields = csv.DictReader(f).fieldnames
+        with path.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            for i in range(rows):
+                writer.writerow(row(i))
+
+
+def timed(fn, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(sizes):
+    print(f"{'rows':>7}  {'parse csv':>9}  {'compile':>8}  {'cached':>8}  "
+          f"{'verified':>8}  {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            base = Path(tmp) / f"config_{rows}"
+            make_config(base, rows)
+            # files last edited well before the cache was built, as at any
+            # normal startup (fresh edits are always re-hashed)
+            for filename in config_cache.SOURCES.values():
+                st = (base / filename).stat()
+                os.utime(base / filename, ns=(st.st_atime_ns, st.st_mtime_ns - 10 * config_cache.RACY_NS))
+            config_cache.compile_libraries(base)
+
+            parse = timed(config_cache.parse_libraries, base)
+            compile_ = timed(config_cache.compile_libraries, base)
+            cached = timed(config_cache.read_cache, base)
+            verified = timed(config_cache.read_cache, base, None, True)
+            n = len(config_cache.read_cache(base).biomes.biomes)
+            print(f"{n:>7,}  {parse * 1000:7.2f}ms  {compile_ * 1000:6.2f}ms  "
+                  f"{cached * 1000:6.2f}ms  {verified * 1000:6.2f}ms  {parse / cached:6.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [0, 1000, 10000])
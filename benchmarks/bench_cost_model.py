@@ -0,0 +1,72 @@
+# file: benchmarks/bench_cost_model.py
+"""
+Per-step travel cost: live evaluation versus the compiled CostModel
+(scalar, batch over every edge, and along a path).
+
+    python -m benchmarks.bench_cost_model [radius]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import load_world
+from core.movement import AXIAL_DIRECTIONS
+
+
+def per_call(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def main(radius: int):
+    engine = load_world(radius=radius)
+    grid = engine.grid
+    model = engine.cost_model
+    mode = engine.travel_modes.get("normal")
+    rng = random.Random(5)
+
+    coords = list(grid.tiles)
+    edges = []
+    while len(edges) < 20000:
+        src = rng.choice(coords)
+        d = rng.randrange(6)
+        dq, dr = AXIAL_DIRECTIONS[d]
+        dst = (src[0] + dq, src[1] + dr)
+        if dst in grid.tiles:
+            edges.append((src, d, dst))
+
+    t0 = time.perf_counter()
+    model.invalidate()
+    model.set_day(engine.get_time())
+    compile_ms = (time.perf_counter() - t0) * 1000
+
+    # a long walk for path evaluation
+    path = [engine.party.position]
+    while len(path) < 5000:
+        q, r = path[-1]
+        dq, dr = AXIAL_DIRECTIONS[rng.randrange(6)]
+        if (q + dq, r + dr) in grid.tiles:
+            path.append((q + dq, r + dr))
+
+    n = len(edges)
+    rows = [
+        ("live (uncompiled)", per_call(
+            lambda: [model.cost_between(s, t, "normal") for s, _, t in edges], n)),
+        ("engine._move_cost", per_call(
+            lambda: [engine._move_cost(s, t, mode, d) for s, d, t in edges], n)),
+        ("compiled scalar", per_call(
+            lambda: [model.cost(s, d, "normal") for s, d, _ in edges], n)),
+        ("compiled batch", per_call(
+            lambda: model.costs("normal"), len(model.neighbors))),
+        ("compiled path", per_call(
+            lambda: model.path_costs(path, "normal"), len(path) - 1)),
+    ]
+
+    print(f"{len(coords):,} hexes  compile {compile_ms:.1f} ms")
+    for label, us in rows:
+        print(f"  {label:<20} {us:6.2f} us/step")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
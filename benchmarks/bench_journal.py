@@ -0,0 +1,57 @@
+# file: benchmarks/bench_journal.py
+"""
+Restore cost for a journaled 10,000-step campaign: nearest checkpoint +
+tail replay versus replaying from the very first record.
+
+    python -m benchmarks.bench_journal [steps]
+"""
+import itertools
+import random
+import sys
+import time
+
+from benchmarks.common import load_world
+from simulation.engine import RestRules
+from simulation.journal import Journal
+
+
+def record_campaign(n_steps: int, checkpoint_every: int):
+    engine = load_world(radius=12)
+    engine.rng.seed(1)
+    journal = Journal(engine, checkpoint_every=checkpoint_every)
+
+    route = itertools.cycle([0] * 10 + [1] * 2 + [3] * 10 + [4] * 2)
+    rest = RestRules(stop_exhaustion=float("inf"))
+    modes = itertools.cycle(["normal", "cautious", "trailblazing", "reckless"])
+
+    done = 0
+    while done < n_steps:
+        chunk = min(250, n_steps - done)
+        steps = engine.iter_steps(route, next(modes), rest=rest)
+        done += sum(1 for _ in itertools.islice(steps, chunk))
+        steps.close()
+    return engine, journal
+
+
+def bench(journal: Journal, targets, label: str):
+    t0 = time.perf_counter()
+    for seq in targets:
+        journal.restore(seq)
+    elapsed = (time.perf_counter() - t0) / len(targets)
+    print(f"{label:<28} {elapsed * 1000:8.3f} ms per restore")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    _, fast = record_campaign(n, checkpoint_every=500)
+    _, slow = record_campaign(n, checkpoint_every=10 ** 9)
+    print(f"{n:,} steps -> {len(fast):,} records, "
+          f"{len(fast._checkpoints)} checkpoints")
+
+    head = len(slow) - 1
+    rng = random.Random(2)
+    targets = [rng.randrange(head) for _ in range(50)]
+
+    bench(fast, targets, "nearest checkpoint + tail")
+    bench(slow, targets, "replay from start")
@@ -0,0 +1,31 @@
+# file: benchmarks/bench_journey.py
+"""
+Fast-forward a long expedition with SimulationEngine.simulate_journey.
+
+    python -m benchmarks.bench_journey [days]
+"""
+import itertools
+import sys
+import time
+
+from benchmarks.common import load_world
+
+
+def main(days: float):
+    for mode_id in ("reckless", "normal", "cautious", "exploring"):
+        engine = load_world(radius=12)
+
+        # patrol back and forth across the map
+        route = itertools.cycle([0] * 10 + [3] * 10)
+
+        t0 = time.perf_counter()
+        result = engine.simulate_journey(route, mode_id, until=days)
+        elapsed = time.perf_counter() - t0
+
+        print(f"{mode_id:<10} {result.days:6.1f} days  {result.steps:6,} steps  "
+              f"{result.camps:5,} camps  stop={result.stop_reason:<9} "
+              f"{elapsed * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 200.0)
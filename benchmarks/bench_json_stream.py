@@ -0,0 +1,127 @@
+# file: benchmarks/bench_json_stream.py
+"""
+Peak memory of JSON map save/load: whole-document json.dumps/json.load
+versus core.json_stream. Every measurement runs in a fresh process and
+reports its peak RSS (ru_maxrss) above what it held beforehand.
+
+    python -m benchmarks.bench_json_stream [stream_tiles] [compare_tiles]
+
+First a `stream_tiles` map (default 2M) is streamed from a generator to
+disk and read back record by record, neither side ever holding the map.
+Then both approaches save and load a `compare_tiles` grid (default 250k).
+"""
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from core import json_stream
+from core.grid import HexGrid, HexTile
+
+BIOMES = ("plains", "forest", "hills", "swamp", "mountains")
+
+
+def synthetic_tiles(n: int):
+    width = int(n ** 0.5) + 1
+    for i in range(n):
+        q, r = divmod(i, width)
+        trails = ["none"] * 6
+        if i % 17 == 0:
+            trails[i % 6] = "footpath"
+        yield (q, r), HexTile(BIOMES[(q // 9 + r // 7) % len(BIOMES)], (q // 15) % 4, trails)
+
+
+def _peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _run(job, args, out):
+    if job in ("dumps", "stream_save"):
+        # the grid being saved is not part of the measurement
+        grid = HexGrid()
+        grid.tiles = dict(synthetic_tiles(args[0]))
+        args = (grid,) + args[1:]
+    before = _peak_mb()
+    t0 = time.perf_counter()
+    result = JOBS[job](*args)
+    out.put((result, time.perf_counter() - t0, _peak_mb() - before))
+
+
+def _stream_write(n, path):
+    with open(path, "w", encoding="utf-8") as f:
+        return json_stream.write_tiles(synthetic_tiles(n), f)
+
+
+def _stream_count(path):
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in json_stream.iter_records(f))
+
+
+def _dumps(grid, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(grid.to_dict(), indent=2))
+    return len(grid.tiles)
+
+
+def _stream_save(grid, path):
+    return json_stream.save_grid(grid, path)
+
+
+def _json_load(path):
+    with open(path, encoding="utf-8") as f:
+        return len(HexGrid.from_dict(json.load(f)).tiles)
+
+
+def _stream_load(path):
+    return len(json_stream.load_grid(path).tiles)
+
+
+JOBS = {
+    "stream_write": _stream_write,
+    "stream_count": _stream_count,
+    "dumps": _dumps,
+    "stream_save": _stream_save,
+    "json_load": _json_load,
+    "stream_load": _stream_load,
+}
+
+
+def measure(job, *args):
+    ctx = multiprocessing.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_run, args=(job, args, out))
+    proc.start()
+    result = out.get()
+    proc.join()
+    return result
+
+
+def report(label, job, *args):
+    count, seconds, peak = measure(job, *args)
+    print(f"  {label:<34} {count:>10,} tiles  {seconds:6.2f} s  peak +{peak:7.1f} MB")
+
+
+def main(stream_tiles: int, compare_tiles: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        big = os.path.join(tmp, "big.json")
+        print(f"streaming only, {stream_tiles:,} tiles:")
+        report("write from generator", "stream_write", stream_tiles, big)
+        print(f"  {'file size':<34} {os.path.getsize(big) / 1e6:10.1f} MB")
+        report("read record by record", "stream_count", big)
+        os.remove(big)
+
+        path = os.path.join(tmp, "map.json")
+        print(f"save/load a {compare_tiles:,}-tile grid "
+              f"(save excludes the grid being saved; load includes the grid built):")
+        report("save: to_dict + json.dumps", "dumps", compare_tiles, path)
+        report("save: json_stream.save_grid", "stream_save", compare_tiles, path)
+        report("load: json.load + from_dict", "json_load", path)
+        report("load: json_stream.load_grid", "stream_load", path)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [2_000_000, 250_000][len(args):]))
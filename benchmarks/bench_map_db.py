@@ -0,0 +1,95 @@
+# file: benchmarks/bench_map_db.py
+"""
+SQLite map storage throughput: bulk import, region loads, attribute
+queries and bulk updates.
+
+    python -m benchmarks.bench_map_db [radius] [queries]
+
+Imports a radius-`radius` map (default 400, ~480k hexes) with batched
+transactions, and a small sample one row per transaction for contrast.
+Then runs `queries` (default 200) random screen-sized region loads and
+"forest in this box" queries.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from core.grid import HexGrid
+from core.map_db import MapDB
+
+VIEW_Q, VIEW_R = 48, 32
+BIOMES = ("plains", "forest", "hills", "swamp", "tundra")
+UNBATCHED_SAMPLE = 2_000
+
+
+def make_grid(radius: int) -> HexGrid:
+    grid = HexGrid()
+    grid.generate_hex_radius(radius)
+    rng = random.Random(5)
+    for (q, r), tile in grid.tiles.items():
+        tile.biome_id = BIOMES[(q // 11 + r // 7) % len(BIOMES)]
+        tile.elevation = (q * q + r) % 9
+        if rng.random() < 0.05:
+            grid.set_trail((q, r), rng.randrange(6), "footpath")
+    return grid
+
+
+def rate(n: int, seconds: float) -> str:
+    return f"{n / seconds:>12,.0f}/s"
+
+
+def main(radius: int, queries: int):
+    grid = make_grid(radius)
+    n = len(grid.tiles)
+    rng = random.Random(9)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = MapDB(os.path.join(tmp, "map.db"))
+
+        t0 = time.perf_counter()
+        db.import_grid(grid)
+        batched = time.perf_counter() - t0
+        print(f"import {n:,} hexes, batched ({db.batch:,}/txn): {batched:6.2f} s {rate(n, batched)}")
+
+        sample = list(grid.tiles.items())[:UNBATCHED_SAMPLE]
+        db.batch = 1
+        t0 = time.perf_counter()
+        db.write_tiles(sample)
+        single = time.perf_counter() - t0
+        print(f"upsert {len(sample):,} hexes, one per txn:        {single:6.2f} s {rate(len(sample), single)}")
+
+        boxes = []
+        for _ in range(queries):
+            q = rng.randrange(-radius // 2, radius // 2)
+            r = rng.randrange(-radius // 2, radius // 2)
+            boxes.append((q, q + VIEW_Q, r, r + VIEW_R))
+
+        t0 = time.perf_counter()
+        loaded = sum(len(db.load_region(*box).tiles) for box in boxes)
+        regions = time.perf_counter() - t0
+        print(f"load_region {VIEW_Q + 1}x{VIEW_R + 1} x{queries}: "
+              f"{regions / queries * 1000:6.2f} ms each {rate(loaded, regions)} hexes")
+
+        t0 = time.perf_counter()
+        found = sum(len(db.coords_where(biome="forest", bounds=box)) for box in boxes)
+        where = time.perf_counter() - t0
+        print(f"coords_where(forest, box) x{queries}: "
+              f"{where / queries * 1000:6.2f} ms each ({found:,} hexes)")
+
+        t0 = time.perf_counter()
+        changed = db.set_biome_where("tundra", "snow")
+        update = time.perf_counter() - t0
+        print(f"set_biome_where(tundra -> snow): {changed:,} hexes in {update * 1000:.1f} ms")
+
+        t0 = time.perf_counter()
+        whole = len(db.load().tiles)
+        full = time.perf_counter() - t0
+        print(f"load whole map: {whole:,} hexes in {full:.2f} s {rate(whole, full)}")
+        db.close()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [400, 200][len(args):]))
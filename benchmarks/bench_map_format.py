@@ -0,0 +1,63 @@
+# file: benchmarks/bench_map_format.py
+"""
+Map file size and save/load time: the JSON written by Save Map
+(indent=2) versus .hexmap binary with each compression.
+
+    python -m benchmarks.bench_map_format [radius]
+
+radius 577 is about 1M hexes.
+"""
+import json
+import random
+import sys
+import time
+
+from core import map_format
+from core.biome import BiomeLibrary
+from core.grid import HexGrid
+
+
+def build_map(radius: int) -> HexGrid:
+    """Biome patches, a few roads and gentle hills, like a painted map."""
+    biome_lib = BiomeLibrary()
+    biome_lib.load_from_csv("config/biomes.csv")
+    ids = biome_lib.ids()
+    rng = random.Random(5)
+
+    grid = HexGrid()
+    grid.generate_hex_radius(radius=radius, default_biome="plains")
+    for (q, r), tile in grid.tiles.items():
+        tile.biome_id = ids[(q // 9 + r // 7) % len(ids)]
+        tile.elevation = (q // 15) % 4
+    coords = list(grid.tiles)
+    for _ in range(len(coords) // 50):
+        grid.set_trail(rng.choice(coords), rng.randrange(6), "footpath")
+    return grid
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main(radius: int):
+    grid = build_map(radius)
+    print(f"{len(grid.tiles):,} hexes")
+
+    text, save_s = timed(lambda g: json.dumps(g.to_dict(), indent=2), grid)
+    loaded, load_s = timed(lambda t: HexGrid.from_dict(json.loads(t)), text)
+    assert loaded.tiles == grid.tiles
+    size = len(text.encode("utf-8"))
+    print(f"  {'json indent=2':<16} {size / 1e6:8.2f} MB  save {save_s:6.2f} s  load {load_s:6.2f} s")
+
+    for compression in map_format.COMPRESSION:
+        data, save_s = timed(map_format.dumps, grid, compression)
+        loaded, load_s = timed(map_format.loads, data)
+        assert loaded.tiles == grid.tiles
+        print(f"  {'hexmap ' + compression:<16} {len(data) / 1e6:8.2f} MB  "
+              f"save {save_s:6.2f} s  load {load_s:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 150)
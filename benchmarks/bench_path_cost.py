@@ -0,0 +1,57 @@
+# file: benchmarks/bench_path_cost.py
+"""
+Scoring candidate routes: SimulationEngine.cost_of_paths versus one
+_move_cost call per step.
+
+    python -m benchmarks.bench_path_cost [routes] [steps]
+"""
+import random
+import sys
+import time
+
+from benchmarks.common import load_world
+from core.movement import AXIAL_DIRECTIONS
+
+
+def random_path(grid, start, steps, rng):
+    path = [start]
+    while len(path) <= steps:
+        q, r = path[-1]
+        dq, dr = AXIAL_DIRECTIONS[rng.randrange(6)]
+        if (q + dq, r + dr) in grid.tiles:
+            path.append((q + dq, r + dr))
+    return path
+
+
+def main(routes: int, steps: int):
+    engine = load_world(radius=30)
+    grid = engine.grid
+    rng = random.Random(11)
+    coords = list(grid.tiles)
+    paths = [random_path(grid, rng.choice(coords), steps, rng) for _ in range(routes)]
+    mode = engine.travel_modes.get("normal")
+    engine.cost_of_path(paths[0], "normal")     # compile outside the timing
+
+    t0 = time.perf_counter()
+    scored = engine.cost_of_paths(paths, "normal")
+    batch = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    totals = []
+    for path in paths:
+        total = 0
+        for a, b in zip(path, path[1:]):
+            d = AXIAL_DIRECTIONS.index((b[0] - a[0], b[1] - a[1]))
+            total += engine._move_cost(a, b, mode, d)[0]
+        totals.append(total)
+    stepwise = time.perf_counter() - t0
+
+    assert totals == [p.total for p in scored]
+    best = min(scored, key=lambda p: p.total)
+    print(f"{routes:,} routes x {steps} steps: cost_of_paths {batch * 1000:7.1f} ms  "
+          f"per-step calls {stepwise * 1000:7.1f} ms  best total {best.total:g}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [5000, 20][len(args):]))
@@ -0,0 +1,44 @@
+# file: benchmarks/bench_risk.py
+"""
+Monte Carlo risk sampling throughput, and how long the Tk thread would
+be starved while a RiskJob runs beside it.
+
+    python -m benchmarks.bench_risk [walks]
+"""
+import sys
+import time
+
+from benchmarks.common import load_world
+from simulation.risk import RiskJob, RiskModel
+
+
+def main(walks: int):
+    for radius in (7, 20):
+        engine = load_world(radius=radius)
+
+        t0 = time.perf_counter()
+        model = RiskModel.from_engine(engine, "normal")
+        build = time.perf_counter() - t0
+
+        job = RiskJob(model, engine.party.position, total_walks=walks, seed=1)
+        t0 = time.perf_counter()
+        job.start()
+
+        # stand-in for the Tk loop: how late does a 10 ms tick fire?
+        worst = 0.0
+        while not job.done:
+            tick = time.perf_counter()
+            time.sleep(0.01)
+            worst = max(worst, time.perf_counter() - tick - 0.01)
+        elapsed = time.perf_counter() - t0
+
+        version, estimate = job.latest()
+        hottest = max(estimate.values()) if estimate else 0.0
+        print(f"radius {radius:<3} model {build * 1000:6.1f} ms  "
+              f"{walks:,} walks {elapsed:6.2f} s ({walks / elapsed:8,.0f}/s)  "
+              f"{version} refinements  {len(estimate):,} hexes  max risk {hottest:.2f}  "
+              f"worst tick delay {worst * 1000:5.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
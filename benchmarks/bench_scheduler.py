@@ -0,0 +1,95 @@
+# file: benchmarks/bench_scheduler.py
+"""
+Throughput of the discrete-event world scheduler.
+
+    python -m benchmarks.bench_scheduler [n_events]
+"""
+import random
+import sys
+import time
+
+from simulation.scheduler import EventScheduler, Scheduler, TICKS_PER_DAY
+
+
+def bench_one_shot(n: int):
+    sched = EventScheduler()
+    rng = random.Random(1)
+    horizon = 365 * TICKS_PER_DAY
+    fired = [0]
+
+    def cb():
+        fired[0] += 1
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        sched.schedule_at(rng.randrange(horizon), cb)
+    t1 = time.perf_counter()
+    sched.run_until(horizon)
+    t2 = time.perf_counter()
+
+    assert fired[0] == n
+    print(f"one-shot   queue {n:>9,} events: {t1 - t0:6.2f}s "
+          f"({n / (t1 - t0):>12,.0f}/s)")
+    print(f"one-shot   run   {n:>9,} events: {t2 - t1:6.2f}s "
+          f"({n / (t2 - t1):>12,.0f}/s)")
+
+
+def bench_cancel(n: int):
+    sched = EventScheduler()
+    events = [sched.schedule_at(i, lambda: None) for i in range(n)]
+
+    t0 = time.perf_counter()
+    for ev in events[::2]:
+        ev.cancel()
+    fired = sched.run_until(n)
+    t1 = time.perf_counter()
+
+    assert fired == n - len(events[::2])
+    print(f"cancel+run       {n:>9,} events: {t1 - t0:6.2f}s "
+          f"({n / (t1 - t0):>12,.0f}/s)")
+
+
+def bench_recurring(n: int):
+    sched = EventScheduler()
+    actors = 1000
+    fired = [0]
+
+    def cb():
+        fired[0] += 1
+
+    for i in range(actors):
+        sched.every(TICKS_PER_DAY, cb, start=i % TICKS_PER_DAY)
+
+    days = n // actors
+    t0 = time.perf_counter()
+    sched.run_until(days * TICKS_PER_DAY - 1)
+    t1 = time.perf_counter()
+
+    print(f"recurring  {actors} actors × {days} days "
+          f"({fired[0]:,} events): {t1 - t0:6.2f}s "
+          f"({fired[0] / (t1 - t0):>12,.0f}/s)")
+
+
+def bench_facade_drift(n: int):
+    """The old float counter drifted; integer ticks do not."""
+    sched = Scheduler()
+    float_days = 0.0
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        sched.advance(0.1)
+        float_days += 0.1 / 6.0
+    t1 = time.perf_counter()
+
+    exact = n * 0.1 / 6.0
+    print(f"facade advance   {n:>9,} steps: {t1 - t0:6.2f}s  "
+          f"tick error {sched.time_days - exact:+.3e} days, "
+          f"float error {float_days - exact:+.3e} days")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bench_one_shot(n)
+    bench_cancel(n)
+    bench_recurring(n)
+    bench_facade_drift(n)
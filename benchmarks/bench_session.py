@@ -0,0 +1,84 @@
+# file: benchmarks/bench_session.py
+"""
+Resuming a campaign: one .hexsession file versus the separate JSON map
+and party files (which leave clock, dice and travel mode to be redone
+by hand).
+
+    python -m benchmarks.bench_session [radius ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from core import serializer
+from core.biome import BiomeLibrary
+from core.cost_modifiers import ModifierLibrary
+from core.grid import HexGrid
+from core.party import load_party_from_csv
+from core.trail_type import TrailLibrary
+from core.travel_modes import TravelModeLibrary
+from simulation import session
+from simulation.engine import SimulationEngine
+
+
+def make_engine(radius: int) -> SimulationEngine:
+    biomes = BiomeLibrary()
+    biomes.load_from_csv("config/biomes.csv")
+    trails = TrailLibrary()
+    trails.load_from_csv("config/trails.csv")
+    modes = TravelModeLibrary()
+    modes.load_from_csv("config/travel_modes.csv")
+    modifiers = ModifierLibrary()
+    modifiers.load_from_csv("config/modifiers.csv")
+
+    grid = HexGrid()
+    grid.biome_lib, grid.trail_lib = biomes, trails
+    grid.generate_hex_radius(radius)
+    for (q, r), tile in grid.tiles.items():
+        tile.biome_id = ("plains", "forest", "hills")[(q // 9 + r // 7) % 3]
+
+    engine = SimulationEngine(grid, load_party_from_csv("config/party.csv"), modes, seed=1)
+    engine.modifiers = modifiers
+    engine.simulate_journey([0, 1, 2, 3, 4, 5] * 5)
+    return engine
+
+
+def timed(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(radii):
+    print(f"{'hexes':>9}  {'session':>9}  {'save':>8}  {'resume':>8}  "
+          f"{'json map+party':>14}  {'load json':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for radius in radii:
+            engine = make_engine(radius)
+            sess = os.path.join(tmp, "s" + session.SUFFIX)
+            grid_json = os.path.join(tmp, "map.json")
+            party_json = os.path.join(tmp, "party.json")
+
+            save = timed(session.save_session, sess, engine)
+            resume = timed(session.resume, sess, make_engine(1))
+
+            serializer.save_grid(engine.grid, grid_json)
+            serializer.save_party(engine.party, party_json)
+
+            def load_json():
+                serializer.load_grid(grid_json, engine.grid.biome_lib)
+                serializer.load_party(party_json)
+
+            load = timed(load_json)
+            json_size = os.path.getsize(grid_json) + os.path.getsize(party_json)
+            print(f"{len(engine.grid.tiles):>9,}  {os.path.getsize(sess) / 1e3:7.1f}kB  "
+                  f"{save * 1000:6.1f}ms  {resume * 1000:6.1f}ms  "
+                  f"{json_size / 1e3:12.1f}kB  {load * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [50, 150, 300])
@@ -0,0 +1,118 @@
+# file: benchmarks/bench_startup.py
+"""
+Cold start: import time of each entry point (fresh interpreter, from
+`python -X importtime`), the slowest modules under it, whether core and
+simulation import with tkinter unavailable, and, when a display is
+available, the time until the GUI draws its first frame.
+
+    python -m benchmarks.bench_startup [top_n]
+"""
+import os
+import subprocess
+import sys
+
+ENTRY_POINTS = [
+    "core.grid",
+    "core.config_cache",
+    "simulation.engine",
+    "simulation.sweep",
+    "simulation.session",
+    "gui.gui_main",
+]
+
+HEADLESS = [
+    "core.grid", "core.config_cache", "core.cost_model", "core.visibility",
+    "core.map_journal", "core.chunk_store", "core.map_db",
+    "simulation.engine", "simulation.risk", "simulation.routes",
+    "simulation.session", "simulation.sweep",
+    "gui.app_state", "gui.job_service", "gui.task_runner", "gui.library_watcher",
+]
+
+# stops the app as soon as the first full frame has been drawn
+_FIRST_FRAME = """
+import time
+t0 = time.perf_counter()
+from gui.renderers import layered_renderer
+draw = layered_renderer.LayeredRenderer.draw
+def first_draw(self, *args):
+    draw(self, *args)
+    print(f"FIRST_FRAME {time.perf_counter() - t0:.4f}", flush=True)
+    self.canvas.winfo_toplevel().destroy()
+layered_renderer.LayeredRenderer.draw = first_draw
+from gui.gui_main import run_app
+run_app()
+"""
+
+
+def python(*args, env=None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                          env=env, cwd=os.getcwd())
+
+
+def import_times(module: str):
+    """(total ms, [(cumulative ms, name)] of the modules it imports directly)."""
+    proc = python("-X", "importtime", "-c", f"import {module}")
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, int(cumulative) / 1000, name.strip()))
+
+    # children are listed before their parent; the entry point is depth 0
+    end = max(i for i, (d, _, n) in enumerate(rows) if d == 0 and n == module)
+    children = []
+    for depth, ms, name in reversed(rows[:end]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((ms, name))
+    return rows[end][1], sorted(children, reverse=True)
+
+
+def headless_ok(module: str) -> bool:
+    proc = python("-c", f"import sys; sys.modules['tkinter'] = None; import {module}")
+    return proc.returncode == 0
+
+
+def first_frame():
+    """Seconds to the first drawn frame, or None without a display."""
+    try:
+        import tkinter
+        tkinter.Tk().destroy()
+    except Exception:
+        return None
+    proc = python("-c", _FIRST_FRAME)
+    for line in proc.stdout.splitlines():
+        if line.startswith("FIRST_FRAME"):
+            return float(line.split()[1])
+    raise RuntimeError(proc.stderr.strip()[-500:])
+
+
+def main(top_n: int):
+    print(f"{'entry point':<22} {'import':>9}   slowest (cumulative)")
+    for module in ENTRY_POINTS:
+        try:
+            total, children = import_times(module)
+        except RuntimeError as exc:
+            print(f"{module:<22} {'failed':>9}   {exc}")
+            continue
+        slowest = ", ".join(f"{name} {ms:.1f}" for ms, name in children[:top_n])
+        print(f"{module:<22} {total:7.1f}ms   {slowest}")
+
+    failed = [m for m in HEADLESS if not headless_ok(m)]
+    print(f"\nimportable without tkinter: {len(HEADLESS) - len(failed)}/{len(HEADLESS)}"
+          + (f"  (fails: {', '.join(failed)})" if failed else ""))
+
+    frame = first_frame()
+    if frame is None:
+        print("first frame: no display")
+    else:
+        print(f"first frame: {frame * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4)
@@ -0,0 +1,50 @@
+# file: benchmarks/bench_step_stream.py
+"""
+Memory profile of a long streamed journey.
+
+Streams SimulationEngine.iter_steps straight into a CSV writer at
+increasing run lengths and reports how much the process peak RSS grew
+during each run. Growth should stay flat as the step count goes up.
+(tracemalloc would give exact numbers but slows the loop ~8x.)
+
+    python -m benchmarks.bench_step_stream [max_steps]
+"""
+import itertools
+import os
+import resource
+import sys
+import time
+
+from benchmarks.common import load_world
+from simulation.engine import RestRules
+from simulation.step_log import write_steps_csv
+
+
+def run(n_steps: int):
+    engine = load_world(radius=12)
+    names = [m.name for m in engine.party.members]
+    route = itertools.cycle([0] * 10 + [3] * 10)
+
+    # never give up: we want exactly n_steps records
+    rest = RestRules(stop_exhaustion=float("inf"))
+    steps = engine.iter_steps(route, "cautious", rest=rest)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    with open(os.devnull, "w", newline="") as out:
+        written = write_steps_csv(steps, out, names, limit=n_steps)
+    elapsed = time.perf_counter() - t0
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"{written:>10,} steps  {elapsed:6.2f}s  "
+          f"({written / elapsed:>9,.0f} steps/s)  "
+          f"peak RSS {rss_after / 1024:7.1f} MiB (+{(rss_after - rss_before) / 1024:.1f})")
+
+
+if __name__ == "__main__":
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n = 1_000
+    while n < top:
+        run(n)
+        n *= 10
+    run(top)
@@ -0,0 +1,71 @@
+# file: benchmarks/bench_trail_network.py
+"""
+Trail connectivity: incremental TrailNetwork updates and queries versus
+answering connected(a, b) by walking every tile's trails.
+
+    python -m benchmarks.bench_trail_network [radius]
+"""
+import random
+import sys
+import time
+from collections import deque
+
+from benchmarks.common import load_world
+from core.movement import AXIAL_DIRECTIONS
+from core.trail_network import TrailNetwork
+
+
+def scan_connected(grid, a, b) -> bool:
+    seen = {a}
+    todo = deque([a])
+    while todo:
+        q, r = todo.popleft()
+        if (q, r) == b:
+            return True
+        for d, (dq, dr) in enumerate(AXIAL_DIRECTIONS):
+            nbr = (q + dq, r + dr)
+            trail = grid.tiles[(q, r)].trails[d]
+            if trail and trail != "none" and nbr in grid.tiles and nbr not in seen:
+                seen.add(nbr)
+                todo.append(nbr)
+    return False
+
+
+def main(radius: int):
+    grid = load_world(radius=radius).grid
+    coords = list(grid.tiles)
+    rng = random.Random(7)
+
+    # lay a long winding road network
+    for _ in range(len(coords)):
+        grid.set_trail(rng.choice(coords), rng.randrange(6), "road")
+
+    t0 = time.perf_counter()
+    net = TrailNetwork(grid)
+    build = time.perf_counter() - t0
+
+    edits = [(rng.choice(coords), rng.randrange(6), rng.choice(["road", None]))
+             for _ in range(2000)]
+    t0 = time.perf_counter()
+    for coord, d, value in edits:
+        grid.set_trail(coord, d, value)
+        net.update(coord, d)
+    per_edit = (time.perf_counter() - t0) / len(edits)
+
+    pairs = [(rng.choice(coords), rng.choice(coords)) for _ in range(2000)]
+    t0 = time.perf_counter()
+    fast = [net.connected(a, b) for a, b in pairs]
+    per_query = (time.perf_counter() - t0) / len(pairs)
+
+    t0 = time.perf_counter()
+    slow = [scan_connected(grid, a, b) for a, b in pairs[:200]]
+    per_scan = (time.perf_counter() - t0) / 200
+    assert fast[:200] == slow
+
+    print(f"{len(coords):,} hexes  build {build * 1000:.1f} ms  "
+          f"edit {per_edit * 1e6:.1f} us  connected() {per_query * 1e6:.2f} us  "
+          f"trail scan {per_scan * 1e6:,.0f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,39 @@
+# file: benchmarks/common.py
+"""Shared world setup for the benchmark scripts (mirrors gui_main.run_app)."""
+from core.biome import BiomeLibrary
+from core.cost_modifiers import ModifierLibrary
+from core.grid import HexGrid
+from core.party import load_party_from_csv
+from core.trail_type import TrailLibrary
+from core.travel_modes import TravelModeLibrary
+
+from simulation.engine import SimulationEngine
+
+
+def load_world(radius: int = 7, mixed_biomes: bool = True) -> SimulationEngine:
+    biome_lib = BiomeLibrary()
+    biome_lib.load_from_csv("config/biomes.csv")
+
+    trail_lib = TrailLibrary()
+    trail_lib.load_from_csv("config/trails.csv")
+
+    travel_modes = TravelModeLibrary()
+    travel_modes.load_from_csv("config/travel_modes.csv")
+
+    grid = HexGrid()
+    grid.biome_lib = biome_lib
+    grid.trail_lib = trail_lib
+    grid.generate_hex_radius(radius=radius, default_biome="plains")
+
+    if mixed_biomes:
+        ids = biome_lib.ids()
+        for i, coord in enumerate(sorted(grid.coords())):
+            grid.set_biome(coord, ids[(i * 7) % len(ids)])
+
+    modifiers = ModifierLibrary()
+    modifiers.load_from_csv("config/modifiers.csv")
+
+    party = load_party_from_csv("config/party.csv", leader_index=0, start_pos=(0, 0))
+    engine = SimulationEngine(grid, party, travel_modes)
+    engine.modifiers = modifiers
+    return engine
@@ -15,6 +15,7 @@ class Biome:
     color: str = "#cccccc"
     stealth_dc: float = 12.0          # NEW: default stealth DC
     description: str = ""
+    occlusion: float = 0.0            # extra sight-blocking height (canopy etc.)
 
 
 class BiomeLibrary:
@@ -22,7 +23,7 @@ class BiomeLibrary:
     Loads biome definitions from config/biomes.csv.
 
     Expected CSV columns (extra columns ignored):
-      id,name,base_cost,danger,move_difficulty,color[,stealth_dc,description]
+      id,name,base_cost,danger,move_difficulty,color[,stealth_dc,description,occlusion]
     """
 
     def __init__(self):
@@ -33,8 +34,8 @@ class BiomeLibrary:
         if not path.exists():
             # fallback defaults with colors and rough stealth DCs
             self.add(Biome("plains", "Plains", 1.0, 0.2, 0, "#d9e86c", 12))
-            self.add(Biome("forest", "Forest", 2.0, 0.8, 1, "#3a6b32", 14))
-            self.add(Biome("mountain", "Mountain", 3.0, 1.5, 2, "#8d8c8c", 15))
+            self.add(Biome("forest", "Forest", 2.0, 0.8, 1, "#3a6b32", 14, occlusion=1))
+            self.add(Biome("mountain", "Mountain", 3.0, 1.5, 2, "#8d8c8c", 15, occlusion=2))
             self.add(Biome("swamp", "Swamp", 3.0, 1.0, 1, "#4f5b2a", 13))
             return
 
@@ -57,6 +58,7 @@ class BiomeLibrary:
                     color=row.get("color", "#cccccc"),
                     stealth_dc=stealth_dc,
                     description=row.get("description", ""),
+                    occlusion=float(row.get("occlusion") or 0),
                 )
                 self.add(biome)
 
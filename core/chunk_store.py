@@ -0,0 +1,555 @@
+# file: core/chunk_store.py
+"""
+Chunked, memory-mapped map store for maps larger than memory (.hexchunks).
+
+The map is cut into CHUNK x CHUNK blocks of axial coords, each stored as
+a fixed-size record in one memory-mapped file:
+
+    header    b"HEXCHUNK" | version u16 | chunk side u16 | slot size u16 |
+              chunk bounds cq0, cr0, columns, rows i32 |
+              record count u32 | tile count u64 | meta length u32
+    meta      JSON {"biomes": [...], "trails": [...]} palettes, in a
+              fixed META_BYTES area
+    index     columns * rows u32, one per chunk: record number + 1, 0 = none
+    records   CHUNK * CHUNK slots per chunk, slot (q, r) at
+              (q - q0) * CHUNK + (r - r0):
+                  flags u8 | biome u16 | elevation i32 | trails 6 * u8
+
+Opening reads the header and the palettes only, so it takes the same
+time whatever the map size; chunks are decoded on first access.
+ChunkedTiles puts a dict face on the store for HexGrid.tiles, keeps at
+most `max_chunks` chunks decoded (least recently used evicted first) and
+writes edited chunks back on eviction and on flush().
+
+HexTile.data does not fit a fixed slot: tiles that have any are flagged
+and their dicts kept in a JSON sidecar (map.hexchunks.data), read at open.
+Like HexGrid itself, a chunked grid is for the Tk thread only.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from core.grid import HexGrid, HexTile
+
+Coord = Tuple[int, int]
+ChunkKey = Tuple[int, int]
+
+MAGIC = b"HEXCHUNK"
+VERSION = 2
+
+SUFFIX = ".hexchunks"
+DATA_SUFFIX = ".data"
+
+CHUNK = 32
+HEADER_BYTES = 64
+META_BYTES = 64 * 1024
+
+# chunks added around the bounds when an edit lands outside them
+GROW_MARGIN = 4
+
+_HEADER = struct.Struct("<8sHHHiiiiIQI")
+_SLOT = struct.Struct("<BHi6B")
+_INDEX = struct.Struct("<I")
+
+PRESENT = 1
+HAS_DATA = 2
+
+_SWAP = sys.byteorder != "little"
+
+
+def is_chunk_store(path) -> bool:
+    """True if the file starts with the .hexchunks magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class ChunkStore:
+    """The file: chunk index, raw records and palettes. Use create()/open()."""
+
+    def __init__(self, path, readonly: bool = False):
+        self.path = Path(path)
+        self.data_path = self.path.with_name(self.path.name + DATA_SUFFIX)
+        self.readonly = readonly
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._open_file()
+
+        self.data: Dict[Coord, dict] = {}
+        if self.data_path.exists():
+            with self.data_path.open(encoding="utf-8") as f:
+                for key, value in json.load(f).items():
+                    q, r = key.split(",")
+                    self.data[(int(q), int(r))] = value
+        self._data_dirty = False
+
+    # ---------------------------------------------------------
+    # Opening / creating
+    # ---------------------------------------------------------
+    @classmethod
+    def create(cls, path, bounds: Tuple[int, int, int, int], chunk: int = CHUNK) -> "ChunkStore":
+        """Empty store sized for hexes within bounds (q_min, q_max, r_min, r_max)."""
+        q_min, q_max, r_min, r_max = bounds
+        cq0, cr0 = q_min // chunk, r_min // chunk
+        cols, rows = q_max // chunk - cq0 + 1, r_max // chunk - cr0 + 1
+        meta = _meta_bytes([], [])
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, chunk, _SLOT.size,
+                                 cq0, cr0, cols, rows, 0, 0, len(meta)))
+            f.seek(HEADER_BYTES)
+            f.write(meta)
+            f.truncate(HEADER_BYTES + META_BYTES + _INDEX.size * cols * rows)
+        Path(str(path) + DATA_SUFFIX).unlink(missing_ok=True)
+        return cls(path)
+
+    @classmethod
+    def open(cls, path, readonly: bool = False) -> "ChunkStore":
+        """readonly: the file is mapped for reading and close() leaves it as is."""
+        return cls(path, readonly)
+
+    def _open_file(self):
+        if self.readonly:
+            self._file = open(self.path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._file = open(self.path, "r+b")
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+
+        (magic, version, self.chunk, slot_size, self.cq0, self.cr0, self.cols,
+         self.rows, self.records, self.tiles, meta_len) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a chunked map file")
+        if version != VERSION or slot_size != _SLOT.size:
+            raise ValueError(f"{self.path}: unsupported chunked map version {version}")
+
+        meta = json.loads(self._mm[HEADER_BYTES:HEADER_BYTES + meta_len])
+        self.biomes = meta["biomes"]
+        self.trails = meta["trails"]
+        self._biome_index = {name: i for i, name in enumerate(self.biomes)}
+        self._trail_index = {name: i for i, name in enumerate(self.trails)}
+
+        self.record_bytes = self.chunk * self.chunk * _SLOT.size
+        self.index_offset = HEADER_BYTES + META_BYTES
+        self.records_offset = self.index_offset + _INDEX.size * self.cols * self.rows
+
+    def close(self):
+        if self._mm is None:
+            return
+        if self.readonly:
+            self._mm.close()
+            self._file.close()
+            self._mm = None
+            return
+        self.flush()
+        self._mm.close()
+        self._file.truncate(self.records_offset + self.records * self.record_bytes)
+        self._file.close()
+        self._mm = None
+
+    def flush(self):
+        """Header, palettes and data sidecar to disk; records are synced too."""
+        meta = _meta_bytes(self.biomes, self.trails)
+        self._mm[0:_HEADER.size] = _HEADER.pack(
+            MAGIC, VERSION, self.chunk, _SLOT.size, self.cq0, self.cr0,
+            self.cols, self.rows, self.records, self.tiles, len(meta))
+        self._mm[HEADER_BYTES:HEADER_BYTES + len(meta)] = meta
+        self._mm.flush()
+
+        if self._data_dirty:
+            tmp = self.data_path.with_name(self.data_path.name + ".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump({f"{q},{r}": d for (q, r), d in self.data.items()}, f)
+            os.replace(tmp, self.data_path)
+            self._data_dirty = False
+
+    # ---------------------------------------------------------
+    # Chunk index
+    # ---------------------------------------------------------
+    def key_of(self, coord: Coord) -> ChunkKey:
+        return coord[0] // self.chunk, coord[1] // self.chunk
+
+    def _index_pos(self, key: ChunkKey) -> Optional[int]:
+        i, j = key[0] - self.cq0, key[1] - self.cr0
+        if 0 <= i < self.cols and 0 <= j < self.rows:
+            return self.index_offset + _INDEX.size * (i * self.rows + j)
+        return None
+
+    def _record(self, key: ChunkKey) -> int:
+        pos = self._index_pos(key)
+        return 0 if pos is None else _INDEX.unpack_from(self._mm, pos)[0]
+
+    def has(self, key: ChunkKey) -> bool:
+        return self._record(key) != 0
+
+    def chunk_keys(self) -> Iterator[ChunkKey]:
+        """Keys of the stored chunks, in file index order."""
+        index = array("I", self._mm[self.index_offset:self.records_offset])
+        if _SWAP:
+            index.byteswap()
+        rows = self.rows
+        for n, record in enumerate(index):
+            if record:
+                i, j = divmod(n, rows)
+                yield self.cq0 + i, self.cr0 + j
+
+    def bounds(self) -> Tuple[int, int, int, int]:
+        """Hex bounds of the index, rounded out to whole chunks."""
+        c = self.chunk
+        return (self.cq0 * c, (self.cq0 + self.cols) * c - 1,
+                self.cr0 * c, (self.cr0 + self.rows) * c - 1)
+
+    # ---------------------------------------------------------
+    # Raw records
+    # ---------------------------------------------------------
+    def get_raw(self, key: ChunkKey) -> Optional[bytes]:
+        record = self._record(key)
+        if not record:
+            return None
+        start = self.records_offset + (record - 1) * self.record_bytes
+        return self._mm[start:start + self.record_bytes]
+
+    def put_raw(self, key: ChunkKey, payload: bytes):
+        """Write one chunk record, adding it (and growing the file) if new."""
+        pos = self._index_pos(key)
+        if pos is None:
+            self._grow(key)
+            pos = self._index_pos(key)
+        record = _INDEX.unpack_from(self._mm, pos)[0]
+        if not record:
+            record = self._add_record()
+            _INDEX.pack_into(self._mm, pos, record)
+        start = self.records_offset + (record - 1) * self.record_bytes
+        self._mm[start:start + self.record_bytes] = payload
+
+    def _add_record(self) -> int:
+        self.records += 1
+        needed = self.records_offset + self.records * self.record_bytes
+        if needed > len(self._mm):
+            capacity = (len(self._mm) - self.records_offset) // self.record_bytes
+            self._resize(self.records_offset + max(self.records, 2 * capacity, 16) * self.record_bytes)
+        return self.records
+
+    def _resize(self, size: int):
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def _grow(self, key: ChunkKey):
+        """
+        Widen the index to take `key`. Record numbers don't change, so the
+        records move as one block behind the bigger index; costs a copy
+        of the file, and only happens when editing past the map's edge.
+        """
+        cq0 = min(self.cq0, key[0] - GROW_MARGIN)
+        cr0 = min(self.cr0, key[1] - GROW_MARGIN)
+        cols = max(self.cq0 + self.cols, key[0] + GROW_MARGIN + 1) - cq0
+        rows = max(self.cr0 + self.rows, key[1] + GROW_MARGIN + 1) - cr0
+
+        index = array("I", bytes(_INDEX.size * cols * rows))
+        for cq, cr in self.chunk_keys():
+            index[(cq - cq0) * rows + (cr - cr0)] = self._record((cq, cr))
+
+        self.flush()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.chunk, _SLOT.size, cq0, cr0,
+                                 cols, rows, self.records, self.tiles,
+                                 len(_meta_bytes(self.biomes, self.trails))))
+            f.write(self._mm[_HEADER.size:self.index_offset])
+            f.write(index.tobytes() if not _SWAP else _swapped(index))
+            end = self.records_offset + self.records * self.record_bytes
+            for start in range(self.records_offset, end, 1 << 24):
+                f.write(self._mm[start:min(start + (1 << 24), end)])
+        self._mm.close()
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._open_file()
+
+    def clear(self):
+        """Drop every chunk (the index is zeroed; the file keeps its size)."""
+        self._mm[self.index_offset:self.records_offset] = bytes(self.records_offset - self.index_offset)
+        self.records = 0
+        self.tiles = 0
+        if self.data:
+            self.data.clear()
+            self._data_dirty = True
+
+    # ---------------------------------------------------------
+    # Chunk <-> tiles
+    # ---------------------------------------------------------
+    def _biome_id(self, name: str) -> int:
+        idx = self._biome_index.get(name)
+        if idx is None:
+            idx = self._add_name(self.biomes, self._biome_index, name, 0xFFFF)
+        return idx
+
+    def _trail_id(self, name: str) -> int:
+        idx = self._trail_index.get(name)
+        if idx is None:
+            idx = self._add_name(self.trails, self._trail_index, name, 0xFF)
+        return idx
+
+    def _add_name(self, palette, index, name: str, limit: int) -> int:
+        if len(palette) > limit:
+            raise ValueError(f"{self.path}: too many names for palette entry {name!r}")
+        palette.append(name)
+        if len(_meta_bytes(self.biomes, self.trails)) > META_BYTES:
+            palette.pop()
+            raise ValueError(f"{self.path}: palettes exceed {META_BYTES} bytes")
+        index[name] = len(palette) - 1
+        return index[name]
+
+    def encode(self, key: ChunkKey, tiles: Dict[Coord, HexTile]) -> bytes:
+        c = self.chunk
+        q0, r0 = key[0] * c, key[1] * c
+        buf = bytearray(self.record_bytes)
+        data = self.data
+
+        if data:
+            for coord in [k for k in data if self.key_of(k) == key and k not in tiles]:
+                del data[coord]
+                self._data_dirty = True
+
+        pack, trail_id = _SLOT.pack_into, self._trail_id
+        for (q, r), tile in tiles.items():
+            flags = PRESENT
+            if tile.data:
+                flags |= HAS_DATA
+                data[(q, r)] = tile.data
+                self._data_dirty = True
+            elif (q, r) in data:
+                del data[(q, r)]
+                self._data_dirty = True
+            pack(buf, ((q - q0) * c + (r - r0)) * _SLOT.size, flags,
+                 self._biome_id(tile.biome_id), tile.elevation,
+                 *[trail_id(t) for t in tile.trails])
+        return bytes(buf)
+
+    def decode(self, key: ChunkKey, raw: bytes) -> Dict[Coord, HexTile]:
+        c = self.chunk
+        q0, r0 = key[0] * c, key[1] * c
+        biomes, trails, data = self.biomes, self.trails, self.data
+        tiles = {}
+        for slot, (flags, biome, elevation, *trail) in enumerate(_SLOT.iter_unpack(raw)):
+            if not flags:
+                continue
+            i, j = divmod(slot, c)
+            coord = (q0 + i, r0 + j)
+            tiles[coord] = HexTile(biomes[biome], elevation, [trails[t] for t in trail],
+                                   data.get(coord) if flags & HAS_DATA else None)
+        return tiles
+
+
+def _swapped(values: array) -> bytes:
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values.tobytes()
+
+
+def _meta_bytes(biomes, trails) -> bytes:
+    return json.dumps({"biomes": biomes, "trails": trails}, separators=(",", ":")).encode("utf-8")
+
+
+# ---------------------------------------------------------
+# Dict face for HexGrid.tiles
+# ---------------------------------------------------------
+class ChunkedTiles(MutableMapping):
+    """
+    HexGrid.tiles backed by a ChunkStore. Any lookup faults its chunk in;
+    at most `max_chunks` chunks stay decoded. HexGrid mutators mark the
+    chunk they are about to change dirty (through grid._watchers), and
+    dirty chunks are written back when evicted or on flush(). A tile
+    object changed by hand after its chunk was evicted is not saved.
+
+    Iterating walks the whole store chunk by chunk (memory stays within
+    the budget); region() touches only the chunks under a rectangle.
+
+    Between hold_writes() and release_writes() nothing is written to the
+    file: dirty chunks stay decoded (over budget if need be), so another
+    reader (a save on a worker) sees the file as it was when held.
+    """
+
+    def __init__(self, store: ChunkStore, max_chunks: int = 256):
+        self.store = store
+        self.max_chunks = max(1, max_chunks)
+        self._chunks: "OrderedDict[ChunkKey, Dict[Coord, HexTile]]" = OrderedDict()
+        self._dirty: Set[ChunkKey] = set()
+        self._held = 0
+
+        self.faults = 0
+        self.evictions = 0
+        self.writes = 0
+
+    # ---------------------------------------------------------
+    # Chunk cache
+    # ---------------------------------------------------------
+    def _load(self, key: ChunkKey) -> Dict[Coord, HexTile]:
+        tiles = self._chunks.get(key)
+        if tiles is not None:
+            self._chunks.move_to_end(key)
+            return tiles
+
+        raw = self.store.get_raw(key)
+        tiles = {} if raw is None else self.store.decode(key, raw)
+        self.faults += 1
+        self._chunks[key] = tiles
+        while len(self._chunks) > self.max_chunks:
+            if self._held:
+                # the least recently used clean chunk; if all are dirty, stay over budget
+                old_key = next((k for k in self._chunks if k not in self._dirty and k != key), None)
+                if old_key is None:
+                    break
+                old_tiles = self._chunks.pop(old_key)
+            else:
+                old_key, old_tiles = self._chunks.popitem(last=False)
+            self.evictions += 1
+            if old_key in self._dirty:
+                self._write(old_key, old_tiles)
+        return tiles
+
+    def _write(self, key: ChunkKey, tiles: Dict[Coord, HexTile]):
+        self._dirty.discard(key)
+        if tiles or self.store.has(key):
+            self.store.put_raw(key, self.store.encode(key, tiles))
+            self.writes += 1
+
+    def _write_dirty(self):
+        if self._held:
+            return
+        for key in list(self._dirty):
+            tiles = self._chunks.get(key)
+            if tiles is None:
+                self._dirty.discard(key)   # marked, but never loaded or changed
+            else:
+                self._write(key, tiles)
+
+    def _before_write(self, coord: Coord):
+        self._dirty.add(self.store.key_of(coord))
+
+    @property
+    def loaded(self) -> int:
+        """Chunks currently decoded."""
+        return len(self._chunks)
+
+    def flush(self):
+        """Write back every dirty chunk and sync the file (not while held)."""
+        if self._held:
+            return
+        self._write_dirty()
+        self.store.flush()
+
+    def hold_writes(self):
+        """Flush, then keep the file unchanged until release_writes()."""
+        self.flush()
+        self._held += 1
+
+    def release_writes(self):
+        self._held = max(self._held - 1, 0)
+
+    def close(self):
+        self._held = 0
+        self._write_dirty()
+        self.store.close()
+        self._chunks.clear()
+
+    # ---------------------------------------------------------
+    # Mapping
+    # ---------------------------------------------------------
+    def __getitem__(self, coord: Coord) -> HexTile:
+        return self._load(self.store.key_of(coord))[coord]
+
+    def get(self, coord: Coord, default=None):
+        return self._load(self.store.key_of(coord)).get(coord, default)
+
+    def __contains__(self, coord) -> bool:
+        try:
+            key = self.store.key_of(coord)
+        except TypeError:               # e.g. no selection (None)
+            return False
+        return coord in self._load(key)
+
+    def __setitem__(self, coord: Coord, tile: HexTile):
+        key = self.store.key_of(coord)
+        tiles = self._load(key)
+        if coord not in tiles:
+            self.store.tiles += 1
+        tiles[coord] = tile
+        self._dirty.add(key)
+
+    def __delitem__(self, coord: Coord):
+        key = self.store.key_of(coord)
+        del self._load(key)[coord]
+        self.store.tiles -= 1
+        self._dirty.add(key)
+
+    def __len__(self) -> int:
+        return self.store.tiles
+
+    def __iter__(self) -> Iterator[Coord]:
+        for coord, _ in self.items():
+            yield coord
+
+    def items(self) -> Iterator[Tuple[Coord, HexTile]]:
+        """(coord, tile) over the whole store, one chunk at a time."""
+        self._write_dirty()             # new chunks must be in the index first
+        keys = list(self.store.chunk_keys())
+        if self._held:                  # ... unless held: add the ones only in memory
+            keys += [key for key in self._chunks if not self.store.has(key)]
+        for key in keys:
+            yield from list(self._load(key).items())
+
+    def clear(self):
+        self._chunks.clear()
+        self._dirty.clear()
+        self.store.clear()
+
+    # ---------------------------------------------------------
+    # Regions
+    # ---------------------------------------------------------
+    def bounds(self) -> Tuple[int, int, int, int]:
+        return self.store.bounds()
+
+    def region(self, q_min: int, q_max: int, r_min: int, r_max: int) -> Iterator[Tuple[Coord, HexTile]]:
+        """(coord, tile) inside the rectangle; only its chunks are loaded."""
+        store = self.store
+        c = store.chunk
+        for cq in range(q_min // c, q_max // c + 1):
+            for cr in range(r_min // c, r_max // c + 1):
+                key = (cq, cr)
+                if key not in self._chunks and not store.has(key):
+                    continue
+                for (q, r), tile in list(self._load(key).items()):
+                    if q_min <= q <= q_max and r_min <= r <= r_max:
+                        yield (q, r), tile
+
+
+# ---------------------------------------------------------
+# HexGrid helpers
+# ---------------------------------------------------------
+def open_grid(path, max_chunks: int = 256, readonly: bool = False) -> HexGrid:
+    """HexGrid over a chunk store; call grid.tiles.flush() to save edits."""
+    grid = HexGrid()
+    grid.tiles = ChunkedTiles(ChunkStore.open(path, readonly), max_chunks)
+    grid._watchers.append(grid.tiles)
+    return grid
+
+
+def save_grid(grid: HexGrid, path, chunk: int = CHUNK) -> int:
+    """Write an in-memory HexGrid as a chunk store; returns tiles written."""
+    bounds = grid.bounds() or (0, 0, 0, 0)
+    store = ChunkStore.create(path, bounds, chunk)
+    chunks: Dict[ChunkKey, Dict[Coord, HexTile]] = defaultdict(dict)
+    for coord, tile in grid.tiles.items():
+        chunks[store.key_of(coord)][coord] = tile
+    for key, tiles in chunks.items():
+        store.put_raw(key, store.encode(key, tiles))
+    store.tiles = len(grid.tiles)
+    store.close()
+    return store.tiles
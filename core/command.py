@@ -42,6 +42,26 @@ class ChangeBiomeCommand(Command):
         state.events.publish("grid_changed")
 
 
+class SetElevationCommand(Command):
+    """Change elevation on a single hex."""
+    def __init__(self, coord, old_elevation: int, new_elevation: int):
+        self.coord = coord
+        self.old = old_elevation
+        self.new = new_elevation
+
+    def do(self, state):
+        state.grid.set_elevation(self.coord, self.new)
+        state.events.publish("elevation_changed", self.coord)
+        state.events.publish("tile_changed", self.coord)
+        state.events.publish("grid_changed")
+
+    def undo(self, state):
+        state.grid.set_elevation(self.coord, self.old)
+        state.events.publish("elevation_changed", self.coord)
+        state.events.publish("tile_changed", self.coord)
+        state.events.publish("grid_changed")
+
+
 class SetTrailCommand(Command):
     def __init__(self, coord, direction, old_value: str, new_value: str):
         self.coord = coord
@@ -69,9 +89,31 @@ class MovePartyCommand(Command):
     def do(self, state):
         state.party.position = self.new
         state.events.publish("party_moved", self.new)
-        state.events.publish("grid_changed")
 
     def undo(self, state):
         state.party.position = self.old
         state.events.publish("party_moved", self.old)
-        state.events.publish("grid_changed")
\ No newline at end of file
+
+
+class TravelCostCommand(Command):
+    """
+    Undoable token/time payment. Holds engine snapshots (see
+    SimulationEngine.snapshot) from before and after the cost was paid.
+    """
+    def __init__(self, before: dict, after: dict):
+        self.before = before
+        self.after = after
+        # the cost is paid before the command is built: only a redo has
+        # to put the "after" state back (no redundant restore record)
+        self._paid = True
+
+    def do(self, state):
+        if self._paid:
+            self._paid = False
+        else:
+            state.engine.restore(self.after)
+        state.events.publish("time_changed")
+
+    def undo(self, state):
+        state.engine.restore(self.before)
+        state.events.publish("time_changed")
\ No newline at end of file
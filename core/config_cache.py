@@ -0,0 +1,275 @@
+# file: core/config_cache.py
+"""
+Compiled cache of the CSV libraries (biomes, trails, travel modes,
+modifiers), so startup and every sweep worker load them in one shot
+instead of parsing each CSV row by row.
+
+    libs = load_libraries("config")     # cache if fresh, else parse + write it
+    biome_lib, trail_lib, travel_modes, modifiers = libs
+
+The cache (config/.compiled/libraries.pickle by default) holds the
+library tables plus, per source file, its mtime, size and SHA-256, and
+a hash of the loader modules' source. It is used only if
+
+  - the loader code is unchanged, and
+  - every source file still has its recorded mtime and size, or else
+    still has its recorded content hash (a touched but unchanged file
+    keeps the cache; the stats are refreshed).
+
+A file modified within RACY_NS of the cache being written is always
+re-hashed, since its mtime alone can't tell edits apart at that
+resolution; verify_content=True hashes every file every time.
+
+Writes go through a temp file and a rename, so workers starting
+together can all rebuild without corrupting each other's cache.
+
+reload_library() re-parses one CSV into the running libraries in place
+(for hot reload) and reports which entry fields changed.
+"""
+import gc
+import hashlib
+import os
+import pickle
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, FrozenSet, NamedTuple, Optional
+
+from core import biome, cost_modifiers, trail_type, travel_modes
+from core.biome import BiomeLibrary
+from core.cost_modifiers import ModifierLibrary
+from core.trail_type import TrailLibrary
+from core.travel_modes import TravelModeLibrary
+
+FORMAT = 1
+
+CACHE_DIR = ".compiled"
+CACHE_NAME = "libraries.pickle"
+
+SOURCES = {
+    "biomes": "biomes.csv",
+    "trails": "trails.csv",
+    "travel_modes": "travel_modes.csv",
+    "modifiers": "modifiers.csv",
+}
+
+# the {id: entry} dict of each library
+TABLES = {
+    "biomes": "biomes",
+    "trails": "types",
+    "travel_modes": "modes",
+    "modifiers": "modifiers",
+}
+
+# mtimes this close to the cache build time are not trusted on their own
+RACY_NS = 2_000_000_000
+
+
+class Libraries(NamedTuple):
+    biomes: BiomeLibrary
+    trails: TrailLibrary
+    travel_modes: TravelModeLibrary
+    modifiers: ModifierLibrary
+
+
+def default_cache_path(config_dir) -> Path:
+    return Path(config_dir) / CACHE_DIR / CACHE_NAME
+
+
+def _code_hash() -> str:
+    h = hashlib.sha256()
+    for module in (biome, trail_type, travel_modes, cost_modifiers):
+        h.update(Path(module.__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _stat(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def source_stats(config_dir) -> Dict[str, Optional[list]]:
+    """{library: [mtime_ns, size] or None if missing} of the CSVs."""
+    base = Path(config_dir)
+    return {name: _stat(base / filename) for name, filename in SOURCES.items()}
+
+
+# ---------------------------------------------------------
+# Parsing (the slow path)
+# ---------------------------------------------------------
+def parse_libraries(config_dir) -> Libraries:
+    """Load every library straight from its CSV (no cache)."""
+    base = Path(config_dir)
+    libs = Libraries(BiomeLibrary(), TrailLibrary(), TravelModeLibrary(), ModifierLibrary())
+    for name, lib in zip(Libraries._fields, libs):
+        lib.load_from_csv(base / SOURCES[name])
+    return libs
+
+
+def _tables(libs: Libraries) -> Dict[str, dict]:
+    return {name: getattr(lib, TABLES[name]) for name, lib in zip(Libraries._fields, libs)}
+
+
+def _from_tables(tables: Dict[str, dict]) -> Libraries:
+    libs = Libraries(BiomeLibrary(), TrailLibrary(), TravelModeLibrary(), ModifierLibrary())
+    for name, lib in zip(Libraries._fields, libs):
+        setattr(lib, TABLES[name], tables[name])
+    return libs
+
+
+# ---------------------------------------------------------
+# Cache
+# ---------------------------------------------------------
+def compile_libraries(config_dir, cache_path=None) -> Libraries:
+    """Parse the CSVs and (re)write the cache; returns the libraries."""
+    base = Path(config_dir)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(config_dir)
+
+    stats = source_stats(config_dir)
+    hashes = {name: _file_hash(base / filename) for name, filename in SOURCES.items()}
+    built_ns = time.time_ns()
+    libs = parse_libraries(config_dir)
+
+    # a file that changed while we parsed it would be cached as the old one
+    if source_stats(config_dir) != stats:
+        return libs
+
+    _write(cache_path, {
+        "format": FORMAT,
+        "code": _code_hash(),
+        "built_ns": built_ns,
+        "sources": {name: (stats[name], hashes[name]) for name in SOURCES},
+        "tables": _tables(libs),
+    })
+    return libs
+
+
+def _write(cache_path: Path, payload: dict):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_path)
+
+
+def read_cache(config_dir, cache_path=None, verify_content: bool = False) -> Optional[Libraries]:
+    """The cached libraries, or None if the cache is missing or stale."""
+    base = Path(config_dir)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(config_dir)
+    # tens of thousands of small objects, none cyclic: skip GC passes
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with cache_path.open("rb") as f:
+            payload = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    finally:
+        if enabled:
+            gc.enable()
+    if payload.get("format") != FORMAT or payload.get("code") != _code_hash():
+        return None
+
+    racy_after = payload["built_ns"] - RACY_NS
+    refreshed = False
+    for name, filename in SOURCES.items():
+        recorded = payload["sources"].get(name)
+        if recorded is None:
+            return None
+        stat, digest = recorded
+        current = _stat(base / filename)
+        if current is None or stat is None:
+            if current != stat:
+                return None             # file appeared or disappeared
+            continue
+        trusted = current == list(stat) and stat[0] < racy_after and not verify_content
+        if trusted:
+            continue
+        if current[1] != stat[1] or _file_hash(base / filename) != digest:
+            return None
+        if current != list(stat):
+            payload["sources"][name] = (current, digest)
+            refreshed = True
+
+    if refreshed:
+        payload["built_ns"] = time.time_ns()
+        _write(cache_path, payload)
+    return _from_tables(payload["tables"])
+
+
+def load_libraries(config_dir="config", cache_path=None, verify_content: bool = False) -> Libraries:
+    """Libraries from the cache when it is fresh, otherwise parsed and cached."""
+    libs = read_cache(config_dir, cache_path, verify_content)
+    if libs is None:
+        libs = compile_libraries(config_dir, cache_path)
+    return libs
+
+
+# ---------------------------------------------------------
+# Hot reload
+# ---------------------------------------------------------
+def changed_fields(old: dict, new: dict) -> FrozenSet[str]:
+    """Entry fields that differ between two {id: entry} tables (all of them for added/removed ids)."""
+    changed = set()
+    for key in old.keys() | new.keys():
+        a, b = old.get(key), new.get(key)
+        if a is None or b is None:
+            changed.update(f.name for f in fields(a if b is None else b))
+        elif a != b:
+            changed.update(f.name for f in fields(a) if getattr(a, f.name) != getattr(b, f.name))
+    return frozenset(changed)
+
+
+# entry fields that only change how things are drawn or labelled
+DRAWN_FIELDS = {
+    "biomes": frozenset(["color"]),
+    "trails": frozenset(["color", "width"]),
+}
+LABEL_FIELDS = frozenset(["name", "description"])
+
+
+def cosmetic_fields(name: str) -> FrozenSet[str]:
+    """Fields of library `name` that the simulation never reads."""
+    return DRAWN_FIELDS.get(name, frozenset()) | LABEL_FIELDS
+
+
+def affects_drawing(name: str, fields: FrozenSet[str]) -> bool:
+    return bool(fields & DRAWN_FIELDS.get(name, frozenset()))
+
+
+def affects_simulation(name: str, fields: FrozenSet[str]) -> bool:
+    return bool(fields - cosmetic_fields(name))
+
+
+def reload_library(libs: Libraries, name: str, config_dir) -> FrozenSet[str]:
+    """
+    Re-parse one library's CSV into `libs` in place (everything holding
+    the library sees the new entries) and return the changed fields.
+    Unchanged entries keep their identity. Raises whatever the CSV
+    loader raises on a malformed file, leaving the library untouched.
+    """
+    lib = getattr(libs, name)
+    fresh = type(lib)()
+    fresh.load_from_csv(Path(config_dir) / SOURCES[name])
+
+    table, new = getattr(lib, TABLES[name]), getattr(fresh, TABLES[name])
+    changed = changed_fields(table, new)
+    for key in table.keys() - new.keys():
+        if hasattr(lib, "remove"):
+            lib.remove(key)             # also drops the modifiers' active set
+        else:
+            del table[key]
+    for key, entry in new.items():
+        if table.get(key) != entry:
+            lib.add(entry)
+    return changed
@@ -0,0 +1,766 @@
+# file: core/cost_model.py
+"""
+One travel cost model for the whole program.
+
+A CostModel is a list of terms over a grid:
+
+    raw  = (base + sum of "add" terms) * product of "mul" terms
+    raw  = weather(raw)                  # active ModifierLibrary, if any
+    cost = max(round(raw), min_cost)     # integer models only
+
+Terms come in three scopes:
+    EdgeTerm   per (src, direction) edge: biome, trail, slope ...
+    ModeTerm   per travel mode id
+    PartyTerm  per party: leader stats ...
+
+On first use the model compiles every edge term into a flat array over
+all edges (index i * 6 + d for tile i, direction d), using lookup tables
+keyed by interned biome / trail ids. Scalar, batch and path evaluation
+then only index arrays. invalidate_tile() recompiles the 12 edges
+around an edited hex; invalidate() drops everything (map replaced).
+Terms declare the library fields they read, so library_changed() after
+a hot reload drops only the tables depending on what changed. Weather
+is compiled per tile and only recompiled when the modifier epoch changes.
+"""
+import itertools
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.grid import HexGrid
+from core.movement import AXIAL_DIRECTIONS, DIRECTION_INDEX, direction_between
+
+Coord = Tuple[int, int]
+
+ADD = "add"
+MUL = "mul"
+
+# batch cost of an edge leading off the map
+OFF_MAP = math.inf
+
+
+class Interner:
+    """String ids <-> small dense ints (0 is reserved for "none")."""
+
+    def __init__(self):
+        self.names: List[Optional[str]] = [None]
+        self.ids: Dict[Optional[str], int] = {None: 0, "": 0, "none": 0}
+
+    def __call__(self, name: Optional[str]) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# ---------------------------------------------------------
+# Terms
+# ---------------------------------------------------------
+class EdgeTerm:
+    """
+    Contribution of one edge. value() reads live tiles (used for local
+    patches and uncompiled evaluation); compile() builds the whole
+    per-edge array and may use the model's interned tables.
+    """
+    name = "edge"
+    op = ADD
+    reads: Dict[str, FrozenSet[str]] = {}     # library -> entry fields used
+
+    def value(self, model: "CostModel", src: Coord, dst: Coord,
+              direction: Optional[int]) -> float:
+        return 0.0
+
+    def compile(self, model: "CostModel") -> array:
+        coords, neighbors = model.coords, model.neighbors
+        value = self.value
+        return array("d", [
+            value(model, coords[i // 6], coords[n], i % 6) if n >= 0 else 0.0
+            for i, n in enumerate(neighbors)
+        ])
+
+
+class ModeTerm:
+    name = "mode"
+    op = ADD
+    reads: Dict[str, FrozenSet[str]] = {}
+
+    def mode_value(self, model: "CostModel", mode_id: str) -> float:
+        return 0.0
+
+
+class PartyTerm:
+    name = "party"
+    op = ADD
+    reads: Dict[str, FrozenSet[str]] = {}
+
+    def party_value(self, model: "CostModel", party) -> float:
+        return 0.0
+
+
+class BiomeTerm(EdgeTerm):
+    """
+    A biome attribute: of the destination hex (blend="dst") or the mean
+    of both ends (blend="mean").
+    """
+
+    def __init__(self, attr: str = "move_difficulty", blend: str = "dst",
+                 name: str = "biome", op: str = ADD):
+        self.attr = attr
+        self.blend = blend
+        self.name = name
+        self.op = op
+        self.reads = {"biomes": frozenset([attr])}
+
+    def _biome_value(self, model, biome_id) -> float:
+        try:
+            return float(getattr(model.grid.biome_lib.get(biome_id), self.attr, 0.0))
+        except KeyError:
+            return 0.0
+
+    def value(self, model, src, dst, direction):
+        tiles = model.grid.tiles
+        to = self._biome_value(model, tiles[dst].biome_id)
+        if self.blend == "mean":
+            return (self._biome_value(model, tiles[src].biome_id) + to) * 0.5
+        return to
+
+    def compile(self, model):
+        table = [self._biome_value(model, b) for b in model.biome_ids.names]
+        per_tile = [table[b] for b in model.biome_of]
+        neighbors = model.neighbors
+        if self.blend == "mean":
+            return array("d", [
+                (per_tile[i // 6] + per_tile[n]) * 0.5 if n >= 0 else 0.0
+                for i, n in enumerate(neighbors)
+            ])
+        return array("d", [per_tile[n] if n >= 0 else 0.0 for n in neighbors])
+
+
+class TrailTerm(EdgeTerm):
+    """cost_mod of the trail type laid along the edge."""
+    name = "trail"
+    reads = {"trails": frozenset(["cost_mod"])}
+
+    def _trail_value(self, model, trail_id) -> float:
+        lib = getattr(model.grid, "trail_lib", None)
+        if not trail_id or trail_id == "none" or lib is None:
+            return 0.0
+        try:
+            return float(lib.get(trail_id).cost_mod)
+        except KeyError:
+            return 0.0
+
+    def value(self, model, src, dst, direction):
+        if direction is None:
+            return 0.0
+        return self._trail_value(model, model.grid.tiles[src].trails[direction])
+
+    def compile(self, model):
+        table = [self._trail_value(model, t) for t in model.trail_ids.names]
+        return array("d", [table[t] for t in model.trail_of])
+
+
+class SlopeTerm(EdgeTerm):
+    """Uphill / downhill penalty from a SlopeField."""
+    name = "slope"
+
+    def value(self, model, src, dst, direction):
+        if direction is None or model.slope_field is None:
+            return 0.0
+        return model.slope_field.edge_penalty(src, direction, model.grid)
+
+    def compile(self, model):
+        field = model.slope_field
+        if field is None:
+            return array("d", bytes(8 * len(model.neighbors)))
+        field._ensure(model.grid)
+        if field.coords == model.coords:
+            return array("d", field.penalties)
+        return super().compile(model)
+
+
+class ModeSpeedTerm(ModeTerm):
+    """TravelMode.speed_mod from the model's TravelModeLibrary."""
+    name = "mode"
+    reads = {"travel_modes": frozenset(["speed_mod"])}
+
+    def mode_value(self, model, mode_id):
+        return float(model.travel_modes.get(mode_id).speed_mod)
+
+
+class ModeTableTerm(ModeTerm):
+    """Fixed per-mode values, e.g. pace multipliers."""
+
+    def __init__(self, table: Dict[str, float], default: float = 1.0,
+                 name: str = "mode", op: str = MUL):
+        self.table = dict(table)
+        self.default = default
+        self.name = name
+        self.op = op
+
+    def mode_value(self, model, mode_id):
+        return self.table.get(mode_id, self.default)
+
+
+class NavigationTerm(PartyTerm):
+    """Leader wisdom speeds navigation: multiplies by 1 / max(floor, wis / 15)."""
+    name = "navigation"
+    op = MUL
+
+    def __init__(self, floor: float = 0.3, scale: float = 15.0):
+        self.floor = floor
+        self.scale = scale
+
+    def party_value(self, model, party):
+        if party is None:
+            return 1.0
+        wisdom = getattr(party.leader, "wisdom", self.scale)
+        return 1.0 / max(self.floor, wisdom / self.scale)
+
+
+def default_terms() -> List:
+    """The travel rules used by SimulationEngine."""
+    return [BiomeTerm(), TrailTerm(), SlopeTerm(), ModeSpeedTerm()]
+
+
+class CostBreakdown(NamedTuple):
+    cost: float
+    raw: float                  # before weather and rounding
+    weather: float              # change made by active weather modifiers
+    terms: Dict[str, float]     # per-term values (multipliers as factors)
+
+
+@dataclass
+class PathCost:
+    """
+    Cost of a whole path. Every array has one entry per step
+    (len(path) - 1); terms holds each term's per-step values plus
+    "weather" (the change made by active modifiers).
+    """
+    path: Tuple[Coord, ...]
+    costs: array
+    cumulative: array
+    terms: Dict[str, array]
+
+    @property
+    def steps(self) -> int:
+        return len(self.costs)
+
+    @property
+    def total(self) -> float:
+        return self.cumulative[-1] if self.cumulative else 0.0
+
+
+class CostInputs(NamedTuple):
+    """
+    What costs() reads, for one mode and party. From cost_inputs(copy=True)
+    the tables are copies, so costs() can run on a worker while the grid
+    is edited.
+    """
+    offset: float               # base + mode and party adds
+    scale: float                # mode and party multipliers
+    edge_add: array
+    edge_mul: Optional[array]
+    neighbors: array
+    weather_add: Optional[array]
+    weather_mul: Optional[array]
+    integer: bool
+    min_cost: int
+
+    def costs(self) -> array:
+        """Cost of every edge (index i * 6 + d), OFF_MAP off the map."""
+        offset, scale = self.offset, self.scale
+        raw = [(offset + a) * scale for a in self.edge_add]
+        if self.edge_mul is not None:
+            raw = [r * m for r, m in zip(raw, self.edge_mul)]
+
+        neighbors = self.neighbors
+        if self.weather_add is not None:
+            wa, wm = self.weather_add, self.weather_mul
+            raw = [(r + wa[n]) * wm[n] if n >= 0 else 0.0 for r, n in zip(raw, neighbors)]
+        if self.integer:
+            lo = self.min_cost
+            return array("d", [
+                max(int(round(r)), lo) if n >= 0 else OFF_MAP
+                for r, n in zip(raw, neighbors)
+            ])
+        return array("d", [r if n >= 0 else OFF_MAP for r, n in zip(raw, neighbors)])
+
+
+# ---------------------------------------------------------
+# Model
+# ---------------------------------------------------------
+class CostModel:
+    """Compiled travel cost for one grid; see the module docstring."""
+
+    def __init__(
+        self,
+        grid: HexGrid,
+        travel_modes=None,
+        terms: Optional[Sequence] = None,
+        base: float = 2.0,
+        party=None,
+        slope_field=None,
+        modifiers=None,
+        integer: bool = True,
+        min_cost: float = 1,
+    ):
+        self.grid = grid
+        self.travel_modes = travel_modes
+        self.terms = list(terms) if terms is not None else default_terms()
+        self.base = base
+        self.party = party
+        self.slope_field = slope_field
+        self.integer = integer
+        self.min_cost = min_cost
+
+        self.edge_terms = [t for t in self.terms if isinstance(t, EdgeTerm)]
+        self.mode_terms = [t for t in self.terms if isinstance(t, ModeTerm)]
+        self.party_terms = [t for t in self.terms if isinstance(t, PartyTerm)]
+
+        self.biome_ids = Interner()
+        self.trail_ids = Interner()
+
+        # compiled state
+        self.coords: List[Coord] = []
+        self.index: Dict[Coord, int] = {}
+        self.neighbors = array("l")          # i * 6 + d -> neighbour or -1
+        self.biome_of = array("l")           # per tile: interned biome id
+        self.trail_of = array("l")           # per edge: interned trail id
+        self.term_tables: Dict[str, array] = {}
+        self.edge_add = array("d")
+        self.edge_mul: Optional[array] = None
+        self._mode_cache: Dict[str, Tuple[float, float]] = {}
+        self._dirty = set()                  # hexes awaiting a local patch
+        self._compiled = False
+
+        # weather, compiled per modifier epoch
+        self._modifiers = modifiers
+        self.weather_add: Optional[array] = None
+        self.weather_mul: Optional[array] = None
+        self._weather_epoch = None
+        self._day: Optional[float] = None
+
+    # ---------------------------------------------------------
+    # Compilation
+    # ---------------------------------------------------------
+    def compile(self):
+        grid = self.grid
+        tiles = grid.tiles
+        self.coords = coords = list(tiles)
+        self.index = index = {c: i for i, c in enumerate(coords)}
+
+        get = index.get
+        self.neighbors = array("l", [
+            get((q + dq, r + dr), -1)
+            for (q, r) in coords
+            for (dq, dr) in AXIAL_DIRECTIONS
+        ])
+        biome = self.biome_ids
+        self.biome_of = array("l", [biome(tiles[c].biome_id) for c in coords])
+        trail = self.trail_ids
+        self.trail_of = array("l", [
+            trail(t) for c in coords for t in tiles[c].trails
+        ])
+
+        self.term_tables = {t.name: t.compile(self) for t in self.edge_terms}
+        self._combine_edges()
+        self._mode_cache.clear()
+        self._dirty.clear()
+        self._compiled = True
+
+        # weather arrays are per tile: rebuild for the new tile list
+        self.weather_add = self.weather_mul = None
+        self._weather_epoch = None
+        self._refresh_weather()
+
+    def _combine_edges(self):
+        n = len(self.neighbors)
+        adds = [self.term_tables[t.name] for t in self.edge_terms if t.op == ADD]
+        muls = [self.term_tables[t.name] for t in self.edge_terms if t.op == MUL]
+
+        self.edge_add = array("d", [sum(v) for v in zip(*adds)]) if adds \
+            else array("d", bytes(8 * n))
+        if muls:
+            self.edge_mul = array("d", [math.prod(v) for v in zip(*muls)])
+        else:
+            self.edge_mul = None
+
+    def ensure(self, grid: Optional[HexGrid] = None):
+        """Compile if needed; recompile if pointed at another grid."""
+        if grid is not None and grid is not self.grid:
+            self.grid = grid
+            self._compiled = False
+        if not self._compiled:
+            self.compile()
+        elif self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for coord in dirty:
+                self._patch_tile(coord)
+                if not self._compiled:
+                    self.compile()
+                    break
+
+    def invalidate(self, *_):
+        """Forget all compiled tables (map replaced, libraries reloaded)."""
+        self._compiled = False
+        self._dirty.clear()
+        self._mode_cache.clear()
+
+    def invalidate_modes(self):
+        """Travel modes or party stats changed: only per-mode scalars."""
+        self._mode_cache.clear()
+
+    def library_changed(self, library: str, fields: FrozenSet[str]) -> bool:
+        """
+        Entries of a reloaded library changed `fields`: drop only what
+        reads them (edge terms: full recompile; mode terms: per-mode
+        scalars; modifiers: weather). Returns True if costs may change.
+        """
+        if library == "modifiers":
+            self.modifiers = self._modifiers     # recompiles weather
+            return True
+        if any(fields & t.reads.get(library, frozenset()) for t in self.edge_terms):
+            self.invalidate()
+            return True
+        if any(fields & t.reads.get(library, frozenset()) for t in self.mode_terms):
+            self.invalidate_modes()
+            return True
+        return False
+
+    def invalidate_tile(self, coord: Coord):
+        """
+        A hex's biome, trails or elevation changed: its 12 edges are
+        patched on the next evaluation (many edits, one patch each).
+        """
+        if self._compiled:
+            self._dirty.add(coord)
+
+    def _patch_tile(self, coord: Coord):
+        i = self.index.get(coord)
+        tile = self.grid.get(coord)
+        if i is None or tile is None:
+            self._compiled = False          # tile added/removed
+            return
+
+        self.biome_of[i] = self.biome_ids(tile.biome_id)
+        edges = []
+        for d in range(6):
+            n = self.neighbors[i * 6 + d]
+            edges.append((i, d))
+            if n >= 0:
+                edges.append((n, HexGrid.opposite_dir(d)))
+
+        tiles, coords, neighbors = self.grid.tiles, self.coords, self.neighbors
+        for src, d in edges:
+            e = src * 6 + d
+            self.trail_of[e] = self.trail_ids(tiles[coords[src]].trails[d])
+            n = neighbors[e]
+            add, mul = 0.0, 1.0
+            for term in self.edge_terms:
+                v = term.value(self, coords[src], coords[n], d) if n >= 0 else 0.0
+                self.term_tables[term.name][e] = v
+                if term.op == ADD:
+                    add += v
+                else:
+                    mul *= v
+            self.edge_add[e] = add
+            if self.edge_mul is not None:
+                self.edge_mul[e] = mul
+
+        if self.weather_add is not None:
+            self._compile_weather_tile(i)
+
+    # ---------------------------------------------------------
+    # Modes, parties, weather
+    # ---------------------------------------------------------
+    def _mode(self, mode_id: str) -> Tuple[float, float, Dict[str, float]]:
+        """(add, mul, per-term values) for a travel mode, cached."""
+        cached = self._mode_cache.get(mode_id)
+        if cached is None:
+            add, mul = 0.0, 1.0
+            values = {}
+            for term in self.mode_terms:
+                v = values[term.name] = term.mode_value(self, mode_id)
+                if term.op == ADD:
+                    add += v
+                else:
+                    mul *= v
+            cached = self._mode_cache[mode_id] = (add, mul, values)
+        return cached
+
+    def _party(self, party) -> Tuple[float, float, Dict[str, float]]:
+        add, mul = 0.0, 1.0
+        values = {}
+        for term in self.party_terms:
+            v = values[term.name] = term.party_value(self, party)
+            if term.op == ADD:
+                add += v
+            else:
+                mul *= v
+        return add, mul, values
+
+    @property
+    def modifiers(self):
+        return self._modifiers
+
+    @modifiers.setter
+    def modifiers(self, library):
+        self._modifiers = library
+        self.weather_add = self.weather_mul = None
+        self._weather_epoch = None
+        if self._compiled:
+            self._refresh_weather()
+
+    def set_day(self, day: float):
+        """Bring weather up to `day`; recompiles only on a new epoch."""
+        self._day = day
+        if self._modifiers is not None:
+            self.ensure()
+            self._refresh_weather()
+
+    def _refresh_weather(self):
+        mods = self._modifiers
+        if mods is None or self._day is None:
+            return
+        epoch = mods.update(self._day)
+        if epoch == self._weather_epoch:
+            return
+        self._weather_epoch = epoch
+        if not mods.active:
+            self.weather_add = self.weather_mul = None
+            return
+        n = len(self.coords)
+        self.weather_add = array("d", bytes(8 * n))
+        self.weather_mul = array("d", [1.0]) * n
+        for i in range(n):
+            self._compile_weather_tile(i)
+
+    def _compile_weather_tile(self, i: int):
+        coord = self.coords[i]
+        biome_id = self.grid.tiles[coord].biome_id
+        add, mul = 0.0, 1.0
+        for m in self._modifiers.active:
+            if m.applies(coord, biome_id):
+                add += m.add
+                mul *= m.mul
+        self.weather_add[i] = add
+        self.weather_mul[i] = mul
+
+    # ---------------------------------------------------------
+    # Evaluation
+    # ---------------------------------------------------------
+    def _finish(self, raw: float, dst: int) -> float:
+        if self.weather_add is not None:
+            raw = (raw + self.weather_add[dst]) * self.weather_mul[dst]
+        if self.integer:
+            return max(int(round(raw)), self.min_cost)
+        return raw
+
+    def cost(self, src: Coord, direction: int, mode_id: str, party=None) -> float:
+        """Scalar cost of one edge (OFF_MAP if it leaves the map)."""
+        self.ensure()
+        e = self.index[src] * 6 + direction
+        n = self.neighbors[e]
+        if n < 0:
+            return OFF_MAP
+        m_add, m_mul, _ = self._mode(mode_id)
+        p_add, p_mul, _ = self._party(party or self.party)
+        raw = (self.base + self.edge_add[e] + m_add + p_add) * m_mul * p_mul
+        if self.edge_mul is not None:
+            raw *= self.edge_mul[e]
+        return self._finish(raw, n)
+
+    def breakdown(self, src: Coord, direction: int, mode_id: str,
+                  party=None) -> CostBreakdown:
+        """Scalar cost plus every term's contribution."""
+        self.ensure()
+        e = self.index[src] * 6 + direction
+        n = self.neighbors[e]
+        if n < 0:
+            return CostBreakdown(OFF_MAP, OFF_MAP, 0.0, {})
+        m_add, m_mul, m_values = self._mode(mode_id)
+        p_add, p_mul, p_values = self._party(party or self.party)
+
+        tables = self.term_tables
+        terms = {t.name: tables[t.name][e] for t in self.edge_terms}
+        terms.update(m_values)
+        terms.update(p_values)
+
+        raw = (self.base + self.edge_add[e] + m_add + p_add) * m_mul * p_mul
+        if self.edge_mul is not None:
+            raw *= self.edge_mul[e]
+
+        weathered = raw
+        if self.weather_add is not None:
+            weathered = (raw + self.weather_add[n]) * self.weather_mul[n]
+        cost = max(int(round(weathered)), self.min_cost) if self.integer else weathered
+        return CostBreakdown(cost, raw, weathered - raw, terms)
+
+    def costs(self, mode_id: str, party=None) -> array:
+        """Batch: cost of every edge (index i * 6 + d), OFF_MAP off the map."""
+        return self.cost_inputs(mode_id, party, copy=False).costs()
+
+    def cost_inputs(self, mode_id: str, party=None, copy: bool = True) -> CostInputs:
+        """
+        Everything costs() needs, resolved for one mode and party. With
+        copy=True the arrays are copied (a memcpy each, cheap enough for
+        the Tk thread) so the batch can be evaluated on a worker.
+        """
+        self.ensure()
+        m_add, m_mul, _ = self._mode(mode_id)
+        p_add, p_mul, _ = self._party(party or self.party)
+        tables = (self.edge_add, self.edge_mul, self.neighbors,
+                  self.weather_add, self.weather_mul)
+        if copy:
+            tables = [None if t is None else array(t.typecode, t) for t in tables]
+        return CostInputs(self.base + m_add + p_add, m_mul * p_mul, *tables,
+                          self.integer, self.min_cost)
+
+    def costs_for(self, edges: Iterable[Tuple[Coord, int]], mode_id: str,
+                  party=None) -> List[float]:
+        """Batch: cost of each (src, direction) edge."""
+        cost = self.cost
+        party = party or self.party
+        return [cost(src, d, mode_id, party) for src, d in edges]
+
+    def path_costs(self, path: Sequence[Coord], mode_id: str, party=None) -> List[float]:
+        """Per-step cost along a path of adjacent hexes."""
+        return list(self.path_cost(path, mode_id, party).costs)
+
+    def path_edges(self, path: Sequence[Coord]) -> array:
+        """Edge indices along a path; ValueError if it leaves the map or jumps."""
+        path = [tuple(c) for c in path]
+        tiles, dirs = self._flat_indices(path, [0])
+        return array("l", [i * 6 + d for i, d in zip(tiles, dirs[:len(path) - 1])])
+
+    def _flat_indices(self, flat: List[Coord], starts: List[int]):
+        """
+        Tile index per hex and direction per step for paths laid end to
+        end in `flat` (path k starts at starts[k]). Validates every path.
+        """
+        self.ensure()
+        get = self.index.get
+        tiles = [get(c) for c in flat]
+        dget = DIRECTION_INDEX.get
+        dirs = [dget((b[0] - a[0], b[1] - a[1])) for a, b in zip(flat, flat[1:])]
+        dirs.append(0)
+        for start in starts[1:]:
+            dirs[start - 1] = 0         # the jump from one path to the next
+
+        # every hex on the map and every step adjacent => every edge exists
+        if None in tiles or None in dirs:
+            bounds = starts[1:] + [len(flat)]
+            for k, (start, end) in enumerate(zip(starts, bounds)):
+                for step in range(end - start - 1):
+                    i = start + step
+                    if tiles[i] is None:
+                        what = "starts off the map"
+                    elif dirs[i] is None:
+                        what = "is not adjacent"
+                    elif tiles[i + 1] is None:
+                        what = "leaves the map"
+                    else:
+                        continue
+                    where = f"path {k} " if len(starts) > 1 else "path "
+                    raise ValueError(f"{where}step {step}: {flat[i]} -> {flat[i + 1]} {what}")
+                if end - start == 1 and tiles[start] is None:
+                    raise ValueError(f"path {k}: {flat[start]} is off the map")
+
+        return tiles, dirs
+
+    def path_cost(self, path: Sequence[Coord], mode_id: str, party=None) -> PathCost:
+        """Per-step costs, running totals and per-term breakdown for a path."""
+        return self.paths_cost([path], mode_id, party)[0]
+
+    def paths_cost(self, paths: Iterable[Sequence[Coord]], mode_id: str,
+                   party=None) -> List[PathCost]:
+        """
+        path_cost for many paths at once. The paths are laid end to end
+        and every term is evaluated in one pass over all their edges;
+        each PathCost then gets slices of the shared arrays.
+        """
+        paths = [[tuple(c) for c in p] for p in paths]
+        starts = list(itertools.accumulate((len(p) for p in paths[:-1]), initial=0))
+        flat = [c for p in paths for c in p]
+        if not flat:
+            return [PathCost((), array("d"), array("d"), {}) for _ in paths]
+
+        tiles, dirs = self._flat_indices(flat, starts)
+        # edges[i] leaves flat[i]; entries at a path's last hex are unused
+        edges = [i * 6 + d for i, d in zip(tiles, dirs)]
+        dst = tiles[1:] + tiles[:1]
+
+        m_add, m_mul, m_values = self._mode(mode_id)
+        p_add, p_mul, p_values = self._party(party or self.party)
+        offset = self.base + m_add + p_add
+        scale = m_mul * p_mul
+
+        raw = [(offset + a) * scale for a in map(self.edge_add.__getitem__, edges)]
+        if self.edge_mul is not None:
+            raw = [r * m for r, m in zip(raw, map(self.edge_mul.__getitem__, edges))]
+
+        weathered = raw
+        if self.weather_add is not None:
+            wa, wm = self.weather_add, self.weather_mul
+            weathered = [(r + wa[t]) * wm[t] for r, t in zip(raw, dst)]
+
+        if self.integer:
+            lo = self.min_cost
+            costs = array("d", [max(round(w), lo) for w in weathered])
+        else:
+            costs = array("d", weathered)
+
+        tables = self.term_tables
+        columns = {t.name: array("d", map(tables[t.name].__getitem__, edges))
+                   for t in self.edge_terms}
+        if weathered is raw:
+            columns["weather"] = array("d", bytes(8 * len(edges)))
+        else:
+            columns["weather"] = array("d", map(float.__sub__, weathered, raw))
+        constants = list(itertools.chain(m_values.items(), p_values.items()))
+
+        results = []
+        for path, start in zip(paths, starts):
+            end = start + max(len(path) - 1, 0)
+            step_costs = costs[start:end]
+            terms = {name: col[start:end] for name, col in columns.items()}
+            for name, v in constants:
+                terms[name] = array("d", [v]) * (end - start)
+            results.append(PathCost(
+                path=tuple(path),
+                costs=step_costs,
+                cumulative=array("d", itertools.accumulate(step_costs)),
+                terms=terms,
+            ))
+        return results
+
+    def cost_between(self, src: Coord, dst: Coord, mode_id: str, party=None) -> float:
+        """
+        Uncompiled cost between any two existing hexes (read live from
+        the tiles; edge terms that need a direction contribute 0 when
+        the hexes are not adjacent).
+        """
+        d = direction_between(src, dst)
+        add, mul = self.base, 1.0
+        for t in self.edge_terms:
+            v = t.value(self, src, dst, d)
+            if t.op == ADD:
+                add += v
+            else:
+                mul *= v
+        m_add, m_mul, _ = self._mode(mode_id)
+        p_add, p_mul, _ = self._party(party or self.party)
+        raw = (add + m_add + p_add) * mul * m_mul * p_mul
+
+        mods = self._modifiers
+        if mods is not None and mods.active:
+            raw = mods.adjust(dst, self.grid.tiles[dst].biome_id, raw)
+        if self.integer:
+            return max(int(round(raw)), self.min_cost)
+        return raw
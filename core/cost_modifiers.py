@@ -0,0 +1,169 @@
+# file: core/cost_modifiers.py
+import csv
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+Coord = Tuple[int, int]
+Region = Tuple[int, int, int, int]   # (min_q, max_q, min_r, max_r), inclusive
+
+
+@dataclass(frozen=True)
+class CostModifier:
+    """
+    A weather / seasonal change to travel cost, e.g. snow in tundra.
+
+    Active for start_day <= day < end_day. With period_days set, the
+    window repeats every period (start/end are then days into the
+    period, e.g. a 360-day year).
+    """
+    id: str
+    name: str
+    start_day: float
+    end_day: float
+    add: float = 0.0                          # added to raw cost
+    mul: float = 1.0                          # then multiplies it
+    biomes: Optional[FrozenSet[str]] = None   # None = every biome
+    region: Optional[Region] = None           # None = whole map
+    period_days: Optional[float] = None
+    description: str = ""
+
+    def active_at(self, day: float) -> bool:
+        if self.period_days:
+            day = day % self.period_days
+        return self.start_day <= day < self.end_day
+
+    def next_change(self, day: float) -> float:
+        """First day after `day` on which active_at() can flip."""
+        if not self.period_days:
+            for edge in (self.start_day, self.end_day):
+                if edge > day:
+                    return edge
+            return math.inf
+
+        period = self.period_days
+        base = day - (day % period)
+        for cycle in (base, base + period):
+            for edge in (self.start_day, self.end_day):
+                if cycle + edge > day:
+                    return cycle + edge
+        return base + 2 * period
+
+    def applies(self, coord: Coord, biome_id: str) -> bool:
+        if self.biomes is not None and biome_id not in self.biomes:
+            return False
+        if self.region is not None:
+            min_q, max_q, min_r, max_r = self.region
+            q, r = coord
+            if not (min_q <= q <= max_q and min_r <= r <= max_r):
+                return False
+        return True
+
+
+class ModifierLibrary:
+    """
+    Loads cost modifiers from config/modifiers.csv and tracks which of
+    them are active at the current world day.
+
+    Expected CSV columns (extra columns ignored):
+      id,name,start_day,end_day[,period_days,add,mul,biomes,region,description]
+    biomes: ';'-separated biome ids (empty = all)
+    region: 'min_q;max_q;min_r;max_r' (empty = whole map)
+
+    `epoch` increases only when the *set* of active modifiers changes
+    (or a modifier is added, replaced or removed), so caches keyed on it
+    survive day-to-day stepping through a season.
+    """
+
+    def __init__(self):
+        self.modifiers: Dict[str, CostModifier] = {}
+        self.epoch = 0
+        self.active: Tuple[CostModifier, ...] = ()
+
+        self._active_ids: Optional[FrozenSet[str]] = frozenset()
+        self._valid_from = math.inf      # active set is valid for
+        self._valid_until = -math.inf    # _valid_from <= day < _valid_until
+
+    def load_from_csv(self, path: str | Path):
+        path = Path(path)
+        if not path.exists():
+            return  # no weather: costs stay static
+
+        with path.open(newline="", encoding="utf-8") as f:
+            r = csv.DictReader(f)
+            for row in r:
+                biomes = row.get("biomes") or ""
+                region = row.get("region") or ""
+                period = row.get("period_days") or ""
+
+                mod = CostModifier(
+                    id=row["id"],
+                    name=row.get("name", row["id"]),
+                    start_day=float(row["start_day"]),
+                    end_day=float(row["end_day"]),
+                    add=float(row.get("add") or 0),
+                    mul=float(row.get("mul") or 1),
+                    biomes=frozenset(b for b in biomes.split(";") if b) or None,
+                    region=tuple(int(v) for v in region.split(";")) if region else None,
+                    period_days=float(period) if period else None,
+                    description=row.get("description", ""),
+                )
+                self.add(mod)
+
+    def add(self, mod: CostModifier):
+        self.modifiers[mod.id] = mod
+        self._invalidate()
+
+    def remove(self, mod_id: str):
+        self.modifiers.pop(mod_id, None)
+        self._invalidate()
+
+    def get(self, mod_id: str) -> CostModifier:
+        return self.modifiers[mod_id]
+
+    def ids(self):
+        return list(self.modifiers.keys())
+
+    # ---------------------------------------------------------
+    # Active set + epoch
+    # ---------------------------------------------------------
+    def update(self, day: float) -> int:
+        """
+        Bring the active set up to `day` and return the epoch. O(1)
+        while `day` stays inside the current window of validity.
+        """
+        if self._valid_from <= day < self._valid_until:
+            return self.epoch
+
+        active = tuple(m for m in self.modifiers.values() if m.active_at(day))
+        ids = frozenset(m.id for m in active)
+        if ids != self._active_ids:
+            self._active_ids = ids
+            self.active = active
+            self.epoch += 1
+
+        # conservative window: moving the clock back (undo, restore)
+        # simply recomputes
+        self._valid_from = day
+        self._valid_until = min(
+            [m.next_change(day) for m in self.modifiers.values()] or [math.inf]
+        )
+        return self.epoch
+
+    def adjust(self, coord: Coord, biome_id: str, raw_cost: float) -> float:
+        """Apply active modifiers to a raw cost (adds first, then multipliers)."""
+        add = 0.0
+        mul = 1.0
+        for m in self.active:
+            if m.applies(coord, biome_id):
+                add += m.add
+                mul *= m.mul
+        return (raw_cost + add) * mul
+
+    def _invalidate(self):
+        self._valid_from = math.inf
+        self._valid_until = -math.inf
+        # entries may have changed under the same ids: rebuild `active`
+        # and bump the epoch on the next update()
+        self._active_ids = None
@@ -1,6 +1,6 @@
 # file: core/grid.py
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, Any, List
+from typing import Dict, Iterator, Tuple, Optional, Any, List
 
 Coord = Tuple[int, int]  # axial (q, r)
 
@@ -31,6 +31,20 @@ class HexGrid:
         self.tiles: Dict[Coord, HexTile] = {}
         self.biome_lib = None  # set externally
         self.trail_lib = None
+        # notified before a tile changes: open GridSnapshots, ChunkedTiles
+        self._watchers: List[Any] = []
+
+    # ---------------------------------------------------------
+    # Snapshots
+    # ---------------------------------------------------------
+
+    def snapshot(self) -> "GridSnapshot":
+        """Frozen view of the current tiles; close() it when done."""
+        return GridSnapshot(self)
+
+    def _before_write(self, coord: Coord):
+        for watcher in self._watchers:
+            watcher._before_write(coord)
 
     # ---------------------------------------------------------
     # Tile access
@@ -42,15 +56,50 @@ class HexGrid:
     def get(self, coord: Coord) -> Optional[HexTile]:
         return self.tiles.get(coord)
 
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """(q_min, q_max, r_min, r_max), or None for an empty grid."""
+        bounds = getattr(self.tiles, "bounds", None)
+        if bounds is not None:
+            return bounds()             # chunked: whole chunks, no scan
+        if not self.tiles:
+            return None
+        qs = [q for (q, _) in self.tiles]
+        rs = [r for (_, r) in self.tiles]
+        return min(qs), max(qs), min(rs), max(rs)
+
+    def region(self, q_min: int, q_max: int, r_min: int, r_max: int) -> Iterator[Tuple[Coord, HexTile]]:
+        """(coord, tile) for the hexes inside an axial q/r rectangle."""
+        region = getattr(self.tiles, "region", None)
+        if region is not None:
+            return region(q_min, q_max, r_min, r_max)   # faults in only those chunks
+        tiles = self.tiles
+        if (q_max - q_min + 1) * (r_max - r_min + 1) >= len(tiles):
+            return ((c, t) for c, t in tiles.items()
+                    if q_min <= c[0] <= q_max and r_min <= c[1] <= r_max)
+        return ((c, tiles[c]) for c in
+                ((q, r) for q in range(q_min, q_max + 1) for r in range(r_min, r_max + 1))
+                if c in tiles)
+
     def set(self, coord: Coord, tile: HexTile):
+        if self._watchers:
+            self._before_write(coord)
         self.tiles[coord] = tile
 
     def set_biome(self, coord: Coord, biome_id: str):
+        if self._watchers:
+            self._before_write(coord)
         if coord not in self.tiles:
             self.tiles[coord] = HexTile(biome_id)
         else:
             self.tiles[coord].biome_id = biome_id
 
+    def set_elevation(self, coord: Coord, elevation: int):
+        tile = self.tiles.get(coord)
+        if tile is not None:
+            if self._watchers:
+                self._before_write(coord)
+            tile.elevation = elevation
+
     # ---------------------------------------------------------
     # Map generation
     # ---------------------------------------------------------
@@ -61,6 +110,8 @@ class HexGrid:
         q = 0..width-1
         r = 0..height-1
         """
+        for coord in list(self.tiles) if self._watchers else ():
+            self._before_write(coord)
         for q in range(width):
             for r in range(height):
                 self.tiles[(q, r)] = HexTile(default_biome)
@@ -74,6 +125,8 @@ class HexGrid:
         return max(abs(aq - bq), abs(ar - br), abs(as_ - bs))
     
     def generate_hex_radius(self, radius: int, default_biome="plains"):
+        for coord in list(self.tiles) if self._watchers else ():
+            self._before_write(coord)
         self.tiles.clear()
         for q in range(-radius, radius + 1):
             for r in range(-radius, radius + 1):
@@ -97,14 +150,18 @@ class HexGrid:
         if tile is None:
             return
 
-        # Set on this tile
-        tile.trails[direction_index] = value
-
-        # Mirror to neighbor
         from core.movement import AXIAL_DIRECTIONS, add
 
         dq, dr = AXIAL_DIRECTIONS[direction_index]
         neighbor_coord = add(coord, (dq, dr))
+        if self._watchers:
+            self._before_write(coord)
+            self._before_write(neighbor_coord)
+
+        # Set on this tile
+        tile.trails[direction_index] = value
+
+        # Mirror to neighbor
         neighbor = self.tiles.get(neighbor_coord)
         if neighbor is not None:
             opp = self.opposite_dir(direction_index)
@@ -151,4 +208,59 @@ class HexGrid:
     # ---------------------------------------------------------
 
     def coords(self):
-        return self.tiles.keys()
\ No newline at end of file
+        return self.tiles.keys()
+
+
+class GridSnapshot:
+    """
+    Copy-on-write view of a HexGrid at the moment it was taken.
+
+    Taking one costs a list of the coords. Afterwards every HexGrid
+    mutator first hands the snapshot a copy of the tile it is about to
+    change, so the snapshot only ever copies tiles edited while it is
+    open. items() may run on a worker thread while the Tk thread keeps
+    editing: a tile read from the live grid is only used if it had not
+    been preserved by the time the read finished.
+    """
+
+    def __init__(self, grid: HexGrid):
+        self.grid = grid
+        self.coords: List[Coord] = list(grid.tiles)
+        self._saved: Dict[Coord, Optional[HexTile]] = {}
+        grid._watchers.append(self)
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def __enter__(self) -> "GridSnapshot":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self in self.grid._watchers:
+            self.grid._watchers.remove(self)
+
+    @staticmethod
+    def _copy(tile: Optional[HexTile]) -> Optional[HexTile]:
+        if tile is None:
+            return None
+        return HexTile(tile.biome_id, tile.elevation, list(tile.trails), dict(tile.data))
+
+    def _before_write(self, coord: Coord):
+        if coord not in self._saved:
+            self._saved[coord] = self._copy(self.grid.tiles.get(coord))
+
+    def items(self) -> Iterator[Tuple[Coord, HexTile]]:
+        """(coord, tile) as of the snapshot; tiles must not be modified."""
+        tiles, saved = self.grid.tiles, self._saved
+        for coord in self.coords:
+            tile = saved.get(coord)
+            if tile is None:
+                tile = self._copy(tiles.get(coord))
+                # edited while we were copying: the preserved copy wins
+                tile = saved.get(coord, tile)
+            if tile is not None:
+                yield coord, tile
+
@@ -0,0 +1,234 @@
+# file: core/json_stream.py
+"""
+Streaming JSON maps in the HexGrid.to_dict() schema:
+
+    {"tiles": [{"q": .., "r": .., "biome": .., "elevation": ..,
+                "trails": [..], "data": {..}}, ...]}
+
+write_tiles() encodes one tile record at a time from any (coord, tile)
+iterable; iter_tiles() parses records one at a time from a file, reading
+it in fixed-size chunks. Neither ever holds more than one record plus
+one read chunk, so peak memory stays flat however big the map is.
+With indent=2 the output is byte-identical to json.dump(grid.to_dict(),
+f, indent=2), so old and new files are interchangeable.
+"""
+import gc
+import json
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+from core.grid import HexGrid, HexTile
+
+Coord = Tuple[int, int]
+
+CHUNK = 1 << 20
+_WS = " \t\n\r"
+_NUMBER_LOOKAHEAD = 32
+
+
+# ---------------------------------------------------------
+# Writing
+# ---------------------------------------------------------
+_encode = json.JSONEncoder().encode       # C-accelerated; no indent
+
+
+def _number(value) -> str:
+    # json encodes ints via its slow path; their repr is the same text
+    return repr(value) if type(value) is int else _encode(value)
+
+
+def _indented_record(q, r, t: HexTile, indent: int, pad: str, trail_cache: dict) -> str:
+    """
+    json.dumps(record, indent=indent) shifted right by `pad`, built by
+    hand: with indent set, json falls back to its pure-Python encoder.
+    """
+    inner = pad + " " * indent
+    key = tuple(t.trails)
+    trails = trail_cache.get(key)
+    if trails is None:
+        if key:
+            item = ",\n" + inner + " " * indent
+            trails = ("[\n" + inner + " " * indent
+                      + item.join(map(_encode, key)) + "\n" + inner + "]")
+        else:
+            trails = "[]"
+        trail_cache[key] = trails
+
+    if t.data:
+        data = json.dumps(t.data, indent=indent).replace("\n", "\n" + inner)
+    else:
+        data = "{}" if isinstance(t.data, dict) else _encode(t.data)
+
+    return (f"{pad}{{\n"
+            f'{inner}"q": {_number(q)},\n'
+            f'{inner}"r": {_number(r)},\n'
+            f'{inner}"biome": {_encode(t.biome_id)},\n'
+            f'{inner}"elevation": {_number(t.elevation)},\n'
+            f'{inner}"trails": {trails},\n'
+            f'{inner}"data": {data}\n'
+            f"{pad}}}")
+
+
+def iter_json(tiles: Iterable[Tuple[Coord, HexTile]],
+              indent: Optional[int] = 2) -> Iterator[str]:
+    """The document as string pieces, one tile record per piece."""
+    if indent is None:
+        first = True
+        yield '{"tiles": ['
+        for (q, r), t in tiles:
+            record = _encode({
+                "q": q,
+                "r": r,
+                "biome": t.biome_id,
+                "elevation": t.elevation,
+                "trails": t.trails,
+                "data": t.data,
+            })
+            yield record if first else ", " + record
+            first = False
+        yield "]}"
+        return
+
+    pad = " " * (2 * indent)
+    trail_cache = {}
+    first = True
+    yield "{\n" + " " * indent + '"tiles": ['
+    for (q, r), t in tiles:
+        yield ("\n" if first else ",\n") + _indented_record(q, r, t, indent, pad, trail_cache)
+        first = False
+    yield ("]" if first else "\n" + " " * indent + "]") + "\n}"
+
+
+def write_tiles(tiles: Iterable[Tuple[Coord, HexTile]], fp: IO[str],
+                indent: Optional[int] = 2) -> int:
+    """Stream a map to an open text file; returns the number of tiles."""
+    count = -1
+    for count, piece in enumerate(iter_json(tiles, indent)):
+        fp.write(piece)
+    return max(count - 1, 0)
+
+
+def save_grid(grid: HexGrid, path, indent: Optional[int] = 2) -> int:
+    with open(path, "w", encoding="utf-8") as f:
+        return write_tiles(grid.tiles.items(), f, indent)
+
+
+# ---------------------------------------------------------
+# Reading
+# ---------------------------------------------------------
+class _Reader:
+    """A sliding window over a text file for incremental raw_decode."""
+
+    def __init__(self, fp: IO[str], chunk: int):
+        self.fp = fp
+        self.chunk = chunk
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.fp.read(self.chunk)
+        if not data:
+            self.eof = True
+            return False
+        # drop what has been consumed before growing the window
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of file)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in map JSON, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number near the end of the window may be cut short ("1"
+            # whose ".5e3" is still unread); objects, arrays and strings
+            # end with their own delimiter
+            if (isinstance(value, (int, float)) and len(self.buf) - end < _NUMBER_LOOKAHEAD
+                    and self._fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_records(fp: IO[str], chunk: int = CHUNK) -> Iterator[dict]:
+    """Tile records from a map JSON file, one at a time."""
+    reader = _Reader(fp, chunk)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "tiles":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.peek() == ",":
+                        reader.pos += 1
+                        continue
+                    reader.expect("]")
+                    break
+        else:
+            reader.value()          # unknown top-level key: skip it
+
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("}")
+        return
+
+
+def iter_tiles(fp: IO[str], chunk: int = CHUNK) -> Iterator[Tuple[Coord, HexTile]]:
+    """(coord, HexTile) pairs with the same defaults as HexGrid.from_dict."""
+    for item in iter_records(fp, chunk):
+        yield (item["q"], item["r"]), HexTile(
+            biome_id=item.get("biome", "plains"),
+            elevation=item.get("elevation", 0),
+            trails=item.get("trails", ["none"] * 6),
+            data=item.get("data", {}),
+        )
+
+
+def load_grid(path, chunk: int = CHUNK) -> HexGrid:
+    grid = HexGrid()
+    # nothing here creates reference cycles; skip the collector passes
+    # that millions of new tiles would otherwise trigger
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, encoding="utf-8") as f:
+            grid.tiles = dict(iter_tiles(f, chunk))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return grid
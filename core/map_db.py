@@ -0,0 +1,279 @@
+# file: core/map_db.py
+"""
+SQLite map storage (stdlib sqlite3) for authoring pipelines that query
+and update maps without loading them whole.
+
+    tiles(q, r, biome, elevation, data)     primary key (q, r); index on
+                                            (biome, q, r); data is JSON or NULL
+    edges(q, r, dir, trail)                 one row per tile side with a trail
+                                            (both sides of an edge, as HexGrid
+                                            keeps them); primary key (q, r, dir)
+
+Both tables are WITHOUT ROWID, clustered on (q, r), so a bounding box
+is read as one key seek per q column. Bulk writes go through executemany() in
+transactions of `batch` rows; every statement is a constant SQL string
+with parameters, so sqlite3's statement cache prepares each once. A
+full import drops the biome index and rebuilds it at the end.
+
+    db = MapDB("world.db")
+    db.import_grid(grid)
+    forests = db.coords_where(biome="forest", bounds=(0, 99, 0, 99))
+    db.set_biome_where("tundra", "snow")
+    piece = db.load_region(0, 99, 0, 99)     # HexGrid of just that box
+    ... edit piece ...
+    db.save_tiles(piece)
+"""
+import gc
+import json
+import sqlite3
+from typing import Container, Iterable, Iterator, List, Optional, Tuple
+
+from core.grid import HexGrid, HexTile
+from core.movement import AXIAL_DIRECTIONS
+
+Coord = Tuple[int, int]
+Bounds = Tuple[int, int, int, int]      # q_min, q_max, r_min, r_max
+
+SUFFIX = ".db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tiles (
+    q INTEGER NOT NULL,
+    r INTEGER NOT NULL,
+    biome TEXT NOT NULL,
+    elevation INTEGER NOT NULL DEFAULT 0,
+    data TEXT,
+    PRIMARY KEY (q, r)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS edges (
+    q INTEGER NOT NULL,
+    r INTEGER NOT NULL,
+    dir INTEGER NOT NULL,
+    trail TEXT NOT NULL,
+    PRIMARY KEY (q, r, dir)
+) WITHOUT ROWID;
+"""
+
+_BIOME_INDEX = "CREATE INDEX IF NOT EXISTS tiles_biome ON tiles (biome, q, r)"
+
+_BOX = "q BETWEEN ? AND ? AND r BETWEEN ? AND ?"
+
+# a box as one primary-key seek per q column (a plain range on q would
+# read every r of those columns and filter)
+_COLUMNS = "WITH RECURSIVE cols(q) AS (SELECT ? UNION ALL SELECT q + 1 FROM cols WHERE q < ?) "
+_REGION_TILES = (_COLUMNS + "SELECT t.q, t.r, t.biome, t.elevation, t.data FROM cols "
+                 "JOIN tiles t ON t.q = cols.q AND t.r BETWEEN ? AND ?")
+_REGION_EDGES = (_COLUMNS + "SELECT e.q, e.r, e.dir, e.trail FROM cols "
+                 "JOIN edges e ON e.q = cols.q AND e.r BETWEEN ? AND ?")
+
+_UPSERT_TILE = ("INSERT OR REPLACE INTO tiles (q, r, biome, elevation, data) "
+                "VALUES (?, ?, ?, ?, ?)")
+_INSERT_EDGE = "INSERT OR REPLACE INTO edges (q, r, dir, trail) VALUES (?, ?, ?, ?)"
+_DELETE_EDGES = "DELETE FROM edges WHERE q = ? AND r = ?"
+# the far side of an edge leaving the written region (only onto stored tiles)
+_MIRROR_EDGE = ("INSERT OR REPLACE INTO edges (q, r, dir, trail) SELECT ?, ?, ?, ? "
+                "WHERE EXISTS (SELECT 1 FROM tiles WHERE q = ? AND r = ?)")
+_DELETE_EDGE = "DELETE FROM edges WHERE q = ? AND r = ? AND dir = ?"
+
+
+class MapDB:
+    """One map in an SQLite file. Not shared between threads."""
+
+    def __init__(self, path, batch: int = 50_000):
+        self.path = path
+        self.batch = batch
+        self.conn = sqlite3.connect(path, cached_statements=64)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(_BIOME_INDEX)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "MapDB":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    # ---------------------------------------------------------
+    # Bulk writes
+    # ---------------------------------------------------------
+    def import_grid(self, grid: HexGrid, replace: bool = True) -> int:
+        """Write every tile of `grid` (streamed); returns tiles written."""
+        if not replace:
+            return self.write_tiles(grid.tiles.items(), clear_edges=True, inside=grid.tiles)
+
+        # load into bare tables, then build the biome index in one pass
+        with self.conn:
+            self.conn.execute("DELETE FROM tiles")
+            self.conn.execute("DELETE FROM edges")
+            self.conn.execute("DROP INDEX IF EXISTS tiles_biome")
+        try:
+            return self.write_tiles(grid.tiles.items(), clear_edges=False)
+        finally:
+            with self.conn:
+                self.conn.execute(_BIOME_INDEX)
+
+    def save_tiles(self, grid: HexGrid, coords: Optional[Iterable[Coord]] = None) -> int:
+        """
+        Upsert `coords` (default: every tile of grid), e.g. an edited
+        region. Trails on its border are mirrored onto the stored hexes
+        outside it.
+        """
+        tiles = grid.tiles
+        if coords is None:
+            return self.write_tiles(tiles.items(), clear_edges=True, inside=tiles)
+        inside = {tuple(c) for c in coords if c in tiles}
+        return self.write_tiles(((c, tiles[c]) for c in inside), clear_edges=True, inside=inside)
+
+    def write_tiles(self, items: Iterable[Tuple[Coord, HexTile]], clear_edges: bool = True,
+                    inside: Optional[Container[Coord]] = None) -> int:
+        """
+        Upsert (coord, tile) pairs in transactions of `batch` tiles. With
+        `inside` (the coords being written), each side facing a hex not
+        in it also sets or clears that hex's opposite side, as
+        HexGrid.set_trail does.
+        """
+        conn = self.conn
+        written = 0
+        tile_rows, edge_rows, cleared = [], [], []
+        mirrored, uncleared = [], []
+
+        def commit():
+            with conn:
+                if cleared:
+                    conn.executemany(_DELETE_EDGES, cleared)
+                conn.executemany(_UPSERT_TILE, tile_rows)
+                conn.executemany(_INSERT_EDGE, edge_rows)
+                if mirrored:
+                    conn.executemany(_MIRROR_EDGE, mirrored)
+                if uncleared:
+                    conn.executemany(_DELETE_EDGE, uncleared)
+            tile_rows.clear()
+            edge_rows.clear()
+            cleared.clear()
+            mirrored.clear()
+            uncleared.clear()
+
+        for (q, r), tile in items:
+            tile_rows.append((q, r, tile.biome_id, tile.elevation,
+                              json.dumps(tile.data) if tile.data else None))
+            if clear_edges:
+                cleared.append((q, r))
+            for direction, trail in enumerate(tile.trails):
+                if trail != "none":
+                    edge_rows.append((q, r, direction, trail))
+            if inside is not None:
+                for direction, (dq, dr) in enumerate(AXIAL_DIRECTIONS):
+                    n = (q + dq, r + dr)
+                    if n in inside:
+                        continue
+                    back, trail = HexGrid.opposite_dir(direction), tile.trails[direction]
+                    if trail != "none":
+                        mirrored.append((n[0], n[1], back, trail, n[0], n[1]))
+                    else:
+                        uncleared.append((n[0], n[1], back))
+            written += 1
+            if len(tile_rows) >= self.batch:
+                commit()
+        if tile_rows:
+            commit()
+        return written
+
+    def set_biome_where(self, old: str, new: str, bounds: Optional[Bounds] = None) -> int:
+        """Rename a biome (optionally inside a box); returns tiles changed."""
+        sql, args = "UPDATE tiles SET biome = ? WHERE biome = ?", [new, old]
+        if bounds is not None:
+            sql += " AND " + _BOX
+            args.extend(bounds)
+        with self.conn:
+            return self.conn.execute(sql, args).rowcount
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    def count(self) -> int:
+        return self.conn.execute("SELECT count(*) FROM tiles").fetchone()[0]
+
+    def bounds(self) -> Optional[Bounds]:
+        row = self.conn.execute("SELECT min(q), max(q), min(r), max(r) FROM tiles").fetchone()
+        return None if row[0] is None else row
+
+    def coords_where(self, biome: Optional[str] = None, bounds: Optional[Bounds] = None,
+                     min_elevation: Optional[int] = None,
+                     max_elevation: Optional[int] = None) -> List[Coord]:
+        """Hexes matching every given condition, in (q, r) order."""
+        where, args = [], []
+        if biome is not None:
+            where.append("biome = ?")
+            args.append(biome)
+        if bounds is not None:
+            where.append(_BOX)
+            args.extend(bounds)
+        if min_elevation is not None:
+            where.append("elevation >= ?")
+            args.append(min_elevation)
+        if max_elevation is not None:
+            where.append("elevation <= ?")
+            args.append(max_elevation)
+        sql = "SELECT q, r FROM tiles"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return [(q, r) for q, r in self.conn.execute(sql + " ORDER BY q, r", args)]
+
+    def biome_counts(self, bounds: Optional[Bounds] = None) -> dict:
+        sql, args = "SELECT biome, count(*) FROM tiles", []
+        if bounds is not None:
+            sql += " WHERE " + _BOX
+            args.extend(bounds)
+        return dict(self.conn.execute(sql + " GROUP BY biome", args))
+
+    # ---------------------------------------------------------
+    # Loading into a HexGrid
+    # ---------------------------------------------------------
+    def iter_tiles(self, bounds: Optional[Bounds] = None) -> Iterator[Tuple[Coord, HexTile]]:
+        """(coord, tile) for the whole map or a box, trails from the edges table."""
+        if bounds is None:
+            tiles = self.conn.execute("SELECT q, r, biome, elevation, data FROM tiles")
+            edges = self.conn.execute("SELECT q, r, dir, trail FROM edges")
+        else:
+            q_min, q_max, r_min, r_max = bounds
+            args = (q_min, q_max, r_min, r_max)
+            tiles = self.conn.execute(_REGION_TILES, args)
+            edges = self.conn.execute(_REGION_EDGES, args)
+
+        trails_at = {}
+        for q, r, direction, trail in edges:
+            trails = trails_at.get((q, r))
+            if trails is None:
+                trails = trails_at[(q, r)] = ["none"] * 6
+            trails[direction] = trail
+
+        for q, r, biome, elevation, data in tiles:
+            yield (q, r), HexTile(biome, elevation, trails_at.get((q, r)),
+                                  json.loads(data) if data is not None else None)
+
+    def load_region(self, q_min: int, q_max: int, r_min: int, r_max: int) -> HexGrid:
+        """A HexGrid holding only the hexes inside the box."""
+        return self._grid(self.iter_tiles((q_min, q_max, r_min, r_max)))
+
+    def load(self) -> HexGrid:
+        return self._grid(self.iter_tiles())
+
+    @staticmethod
+    def _grid(items) -> HexGrid:
+        grid = HexGrid()
+        # no cycles among the new tiles: skip GC passes while building them
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            grid.tiles = dict(items)
+        finally:
+            if enabled:
+                gc.enable()
+        return grid
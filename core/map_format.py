@@ -0,0 +1,308 @@
+# file: core/map_format.py
+"""
+Compact binary map files (.hexmap).
+
+Layout (all integers little-endian):
+
+    header   b"HEXMAP" | version u16 | compression u8 | tile count u32
+    body     (compressed as a whole unless compression is "none")
+        biome palette, trail palette      count u16, then (len u16, utf-8)*
+        sections, each                    tag 4s | encoding u8 | typecode 1s |
+                                          item count u32 | byte length u32 |
+                                          payload
+            QQQQ / RRRR   axial q / r             int32 per tile
+            BIOM          biome palette index     uint8/16 per tile
+            ELEV          elevation               int32 per tile
+            TRAL          trail palette index     uint8/16, 6 per tile
+            DATA          JSON {tile index: data} for tiles with extra data
+
+Section encoding 0 is the raw array; 1 is run-length (run count u32,
+then run lengths uint32[], then values[]), used whenever it is smaller.
+Big maps are mostly one biome, no trails and flat, so the layers
+collapse to a handful of runs before compression even starts.
+
+Loading decodes each layer into one array and builds the HexTiles
+straight from them; no per-tile dict is built on the way.
+"""
+import bz2
+import gc
+import io
+import itertools
+import json
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Tuple
+
+from core.grid import HexGrid, HexTile
+
+Coord = Tuple[int, int]
+
+MAGIC = b"HEXMAP"
+VERSION = 1
+
+SUFFIX = ".hexmap"
+
+COMPRESSION = {
+    "none": 0,
+    "zlib": 1,
+    "bz2": 2,
+    "lzma": 3,
+}
+_COMPRESS = {
+    1: lambda b: zlib.compress(b, 6),
+    2: bz2.compress,
+    3: lzma.compress,
+}
+_DECOMPRESS = {
+    1: zlib.decompress,
+    2: bz2.decompress,
+    3: lzma.decompress,
+}
+
+RAW = 0
+RLE = 1
+
+_HEADER = struct.Struct("<6sHBI")
+_SECTION = struct.Struct("<4sBcII")
+
+_SWAP = sys.byteorder != "little"
+
+# what truncated or corrupted input raises on the way through loads()
+_CORRUPT = (zlib.error, lzma.LZMAError, OSError, EOFError, struct.error, KeyError, IndexError)
+
+
+def is_binary_map(path) -> bool:
+    """True if the file starts with the .hexmap magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+# ---------------------------------------------------------
+# Arrays <-> bytes
+# ---------------------------------------------------------
+def _to_bytes(values: array) -> bytes:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, payload: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(payload)
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+def _index_typecode(palette_size: int) -> str:
+    return "B" if palette_size <= 0xFF else "H"
+
+
+def _rle(values: array) -> Tuple[array, array]:
+    lengths = array("I")
+    runs = array(values.typecode)
+    for value, group in itertools.groupby(values):
+        runs.append(value)
+        lengths.append(sum(1 for _ in group))
+    return lengths, runs
+
+
+def _unrle(lengths: array, runs: array) -> array:
+    out = array(runs.typecode)
+    for n, value in zip(lengths, runs):
+        out.extend(array(runs.typecode, [value]) * n)
+    return out
+
+
+# ---------------------------------------------------------
+# Writing
+# ---------------------------------------------------------
+def _write_palette(out: BinaryIO, names: List[str]):
+    out.write(struct.pack("<H", len(names)))
+    for name in names:
+        raw = name.encode("utf-8")
+        out.write(struct.pack("<H", len(raw)))
+        out.write(raw)
+
+
+def _write_section(out: BinaryIO, tag: bytes, values: array, rle: bool):
+    payload = _to_bytes(values)
+    encoding = RAW
+    if rle:
+        lengths, runs = _rle(values)
+        packed = struct.pack("<I", len(runs)) + _to_bytes(lengths) + _to_bytes(runs)
+        if len(packed) < len(payload):
+            payload, encoding = packed, RLE
+    out.write(_SECTION.pack(tag, encoding, values.typecode.encode("ascii"),
+                            len(values), len(payload)))
+    out.write(payload)
+
+
+def dumps(grid: HexGrid, compression: str = "zlib", rle: bool = True) -> bytes:
+    """Encode a grid; compression is one of COMPRESSION."""
+    return encode(grid.tiles.items(), compression, rle)
+
+
+def encode(tiles: Iterable[Tuple[Coord, HexTile]], compression: str = "zlib",
+           rle: bool = True) -> bytes:
+    """Encode (coord, tile) pairs, read once (e.g. GridSnapshot.items())."""
+    if compression not in COMPRESSION:
+        raise ValueError(f"Unknown compression {compression!r}; "
+                         f"expected one of {sorted(COMPRESSION)}")
+    method = COMPRESSION[compression]
+
+    coords: List[Coord] = []
+    tile_list: List[HexTile] = []
+    for coord, tile in tiles:
+        coords.append(coord)
+        tile_list.append(tile)
+
+    biome_names: Dict[str, int] = {}
+    trail_names: Dict[str, int] = {"none": 0}
+    for tile in tile_list:
+        biome_names.setdefault(tile.biome_id, len(biome_names))
+        for trail in tile.trails:
+            trail_names.setdefault(trail, len(trail_names))
+
+    qs = array("i", [q for q, _ in coords])
+    rs = array("i", [r for _, r in coords])
+    biomes = array(_index_typecode(len(biome_names)),
+                   [biome_names[t.biome_id] for t in tile_list])
+    elevation = array("i", [t.elevation for t in tile_list])
+    trails = array(_index_typecode(len(trail_names)),
+                   [trail_names[x] for t in tile_list for x in t.trails])
+    extra = {i: t.data for i, t in enumerate(tile_list) if t.data}
+
+    body = io.BytesIO()
+    _write_palette(body, list(biome_names))
+    _write_palette(body, list(trail_names))
+    _write_section(body, b"QQQQ", qs, rle)
+    _write_section(body, b"RRRR", rs, rle)
+    _write_section(body, b"BIOM", biomes, rle)
+    _write_section(body, b"ELEV", elevation, rle)
+    _write_section(body, b"TRAL", trails, rle)
+    if extra:
+        payload = array("B", json.dumps(extra, separators=(",", ":")).encode("utf-8"))
+        _write_section(body, b"DATA", payload, False)
+
+    data = body.getvalue()
+    if method:
+        data = _COMPRESS[method](data)
+    return _HEADER.pack(MAGIC, VERSION, method, len(coords)) + data
+
+
+def save(grid: HexGrid, path, compression: str = "zlib", rle: bool = True) -> None:
+    Path(path).write_bytes(dumps(grid, compression, rle))
+
+
+# ---------------------------------------------------------
+# Reading
+# ---------------------------------------------------------
+def _read_palette(buf: memoryview, pos: int) -> Tuple[List[str], int]:
+    (count,) = struct.unpack_from("<H", buf, pos)
+    pos += 2
+    names = []
+    for _ in range(count):
+        (n,) = struct.unpack_from("<H", buf, pos)
+        pos += 2
+        names.append(bytes(buf[pos:pos + n]).decode("utf-8"))
+        pos += n
+    return names, pos
+
+
+def _read_sections(buf: memoryview, pos: int) -> Dict[bytes, array]:
+    sections = {}
+    while pos < len(buf):
+        tag, encoding, typecode, count, size = _SECTION.unpack_from(buf, pos)
+        pos += _SECTION.size
+        payload = buf[pos:pos + size]
+        pos += size
+
+        typecode = typecode.decode("ascii")
+        if encoding == RAW:
+            values = _from_bytes(typecode, payload)
+        elif encoding == RLE:
+            (runs,) = struct.unpack_from("<I", payload, 0)
+            split = 4 + runs * array("I").itemsize
+            values = _unrle(_from_bytes("I", payload[4:split]),
+                            _from_bytes(typecode, payload[split:]))
+        else:
+            raise ValueError(f"Section {tag!r}: unknown encoding {encoding}")
+        if len(values) != count:
+            raise ValueError(f"Section {tag!r}: expected {count} values, got {len(values)}")
+        sections[tag] = values
+    return sections
+
+
+def loads(data: bytes) -> HexGrid:
+    """Decode a .hexmap; ValueError if it is not one or is damaged."""
+    try:
+        return _loads(data)
+    except _CORRUPT as exc:
+        raise ValueError(f"Damaged .hexmap file: {exc!r}") from exc
+
+
+def _loads(data: bytes) -> HexGrid:
+    magic, version, method, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a .hexmap file")
+    if version > VERSION:
+        raise ValueError(f".hexmap version {version} is newer than supported ({VERSION})")
+    if method not in _DECOMPRESS and method != 0:
+        raise ValueError(f"Unknown compression id {method}")
+
+    body = data[_HEADER.size:]
+    if method:
+        body = _DECOMPRESS[method](body)
+    buf = memoryview(body)
+
+    biome_names, pos = _read_palette(buf, 0)
+    trail_names, pos = _read_palette(buf, pos)
+    sections = _read_sections(buf, pos)
+
+    qs, rs = sections[b"QQQQ"], sections[b"RRRR"]
+    biomes = [biome_names[i] for i in sections[b"BIOM"]]
+    elevation = sections[b"ELEV"]
+    if len(qs) != count:
+        raise ValueError(f"Header says {count} tiles, found {len(qs)}")
+
+    # most tiles share a handful of trail patterns (usually all "none")
+    trail_bytes = sections[b"TRAL"]
+    patterns: Dict[Tuple[int, ...], Tuple[str, ...]] = {}
+    cols = [trail_bytes[d::6] for d in range(6)]
+    trails = []
+    for key in zip(*cols):
+        names = patterns.get(key)
+        if names is None:
+            names = patterns[key] = tuple(trail_names[i] for i in key)
+        trails.append(names)
+
+    # millions of new container objects would otherwise trigger repeated
+    # collector passes over everything already alive
+    grid = HexGrid()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        grid.tiles = {
+            coord: HexTile(biome, elev, list(trail))
+            for coord, biome, elev, trail in zip(zip(qs, rs), biomes, elevation, trails)
+        }
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    if b"DATA" in sections:
+        extra = json.loads(sections[b"DATA"].tobytes().decode("utf-8"))
+        keys = list(grid.tiles)
+        for i, value in extra.items():
+            grid.tiles[keys[int(i)]].data = value
+    return grid
+
+
+def load(path) -> HexGrid:
+    return loads(Path(path).read_bytes())
@@ -0,0 +1,278 @@
+# file: core/map_journal.py
+"""
+Incremental map autosave: a base map file plus an append-only journal
+of tile states.
+
+    map.json / map.hexmap        base, written by a full save
+    map.json.journal             one JSON object per line:
+        {"seq": 7, "tiles": [[q, r, biome, elevation, trails, data], ...]}
+
+DirtyTiles collects the hexes touched since the last autosave from the
+tile/trail/elevation events that every edit command publishes on do,
+undo and redo. MapJournal.append() writes just those tiles, so an
+autosave costs in proportion to the edits, not to the map.
+
+Each record holds the full state of its tiles, so replaying is
+idempotent: load() reads the base and replays the whole journal on top,
+which also recovers edits after a crash (a torn last line is ignored).
+compact() folds the journal into a new base file on a worker thread
+without touching the live grid, then drops the folded records.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from core import json_stream, map_format
+from core.grid import GridSnapshot, HexGrid
+from core.movement import AXIAL_DIRECTIONS
+
+Coord = Tuple[int, int]
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class DirtyTiles:
+    """Hexes changed since the last take()."""
+
+    def __init__(self):
+        self.coords: Set[Coord] = set()
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def mark(self, coord: Coord):
+        self.coords.add(tuple(coord))
+
+    def mark_edge(self, coord: Coord, direction_index: int):
+        # set_trail mirrors the edge onto the neighbour
+        q, r = coord
+        dq, dr = AXIAL_DIRECTIONS[direction_index]
+        self.coords.add((q, r))
+        self.coords.add((q + dq, r + dr))
+
+    def take(self) -> Set[Coord]:
+        coords, self.coords = self.coords, set()
+        return coords
+
+    def clear(self):
+        self.coords.clear()
+
+    def attach(self, events):
+        events.subscribe("tile_changed", self.mark)
+        events.subscribe("elevation_changed", self.mark)
+        events.subscribe("trail_changed", self.mark_edge)
+        # a freshly loaded map has nothing to journal yet
+        events.subscribe("map_loaded", lambda *_: self.clear())
+
+
+# ---------------------------------------------------------
+# Base file helpers (format picked by magic / suffix)
+# ---------------------------------------------------------
+def read_map(path) -> HexGrid:
+    if map_format.is_binary_map(path):
+        return map_format.load(path)
+    return json_stream.load_grid(path)
+
+
+def write_map(source, path, progress: Optional[Callable[[float], None]] = None,
+              binary: Optional[bool] = None):
+    """
+    Write a HexGrid or GridSnapshot as .hexmap if `binary`, else JSON
+    (None: by suffix). Goes through a temp file and a rename, so `path`
+    is never half written (the temp file is removed if writing fails).
+    progress(fraction) is called as tiles are encoded (from the calling
+    thread).
+    """
+    if isinstance(source, GridSnapshot):
+        items, total = source.items(), len(source)
+    else:
+        items, total = source.tiles.items(), len(source.tiles)
+    if progress is not None:
+        items = _reporting(items, total, progress)
+
+    path = Path(path)
+    tmp = _tmp_path(path)
+    if binary is None:
+        binary = path.suffix == map_format.SUFFIX
+    try:
+        with (tmp.open("wb") if binary else tmp.open("w", encoding="utf-8")) as f:
+            if binary:
+                f.write(map_format.encode(items))
+            else:
+                json_stream.write_tiles(items, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if progress is not None:
+        progress(1.0)
+
+
+def _tmp_path(path: Path) -> Path:
+    # one per writer: a compaction and a full save may overlap
+    return path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def _reporting(items, total: int, progress: Callable[[float], None]):
+    step = max(total // 100, 1)
+    for n, item in enumerate(items, 1):
+        yield item
+        if n % step == 0:
+            progress(n / total)
+
+
+# ---------------------------------------------------------
+# Journal
+# ---------------------------------------------------------
+class MapJournal:
+    """
+    Journal for one base map file. All methods may be called from the Tk
+    thread while compact() runs on a worker; the file itself is guarded
+    by a lock.
+    """
+
+    def __init__(self, base_path, journal_path=None):
+        self.base_path = Path(base_path)
+        self.path = Path(journal_path) if journal_path else \
+            self.base_path.with_name(self.base_path.name + JOURNAL_SUFFIX)
+        self._lock = threading.Lock()          # journal file
+        self._base_lock = threading.Lock()     # base file (compaction vs full save)
+        self._drop_torn_tail()
+        records = list(self.records())
+        self.seq = max((rec["seq"] for rec in records), default=0)
+        self.pending = len(records)         # records not yet folded into the base
+
+    def _drop_torn_tail(self):
+        """Cut a half-written last line so new appends start on a fresh line."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb+") as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+
+    # ---------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------
+    def append(self, grid: HexGrid, coords: Iterable[Coord]) -> int:
+        """Record the current state of `coords`; returns tiles written."""
+        tiles = []
+        for coord in coords:
+            tile = grid.tiles.get(coord)
+            if tile is not None:
+                tiles.append([coord[0], coord[1], tile.biome_id, tile.elevation,
+                              tile.trails, tile.data])
+        if not tiles:
+            return 0
+
+        with self._lock:
+            self.seq += 1
+            line = json.dumps({"seq": self.seq, "tiles": tiles}, separators=(",", ":"))
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.pending += 1
+        return len(tiles)
+
+    def reset(self):
+        """Drop the journal (after a full save of the base file)."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self.pending = 0
+
+    def save_base(self, source, upto: Optional[int] = None,
+                  progress: Optional[Callable[[float], None]] = None,
+                  binary: Optional[bool] = None):
+        """
+        Full save of a HexGrid or GridSnapshot as the base file (format as
+        in write_map), then drop the records it covers: those up to
+        `upto`, the journal seq when the snapshot was taken (default:
+        everything so far). Records appended while a snapshot is being
+        written survive. Safe on a worker thread.
+        """
+        if upto is None:
+            upto = self.seq
+        with self._base_lock:
+            write_map(source, self.base_path, progress, binary)
+            self._drop_folded(upto)
+
+    # ---------------------------------------------------------
+    # Reading
+    # ---------------------------------------------------------
+    def records(self) -> Iterator[dict]:
+        """Complete records in order; a torn last line is skipped."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break               # crash mid-append
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    break
+
+    def replay(self, grid: HexGrid, upto: Optional[int] = None) -> List[Coord]:
+        """Apply journal records (seq <= upto) to grid; returns touched hexes."""
+        touched = []
+        for rec in self.records():
+            if upto is not None and rec["seq"] > upto:
+                break
+            for q, r, biome, elevation, trails, data in rec["tiles"]:
+                tile = grid.tiles.get((q, r))
+                if tile is None:
+                    grid.set_biome((q, r), biome)
+                    tile = grid.tiles[(q, r)]
+                tile.biome_id = biome
+                tile.elevation = elevation
+                tile.trails = list(trails)
+                tile.data = data
+                touched.append((q, r))
+        return touched
+
+    def load(self) -> HexGrid:
+        """Base file plus every journalled edit (crash recovery)."""
+        grid = read_map(self.base_path)
+        self.replay(grid)
+        return grid
+
+    # ---------------------------------------------------------
+    # Compaction (safe on a worker thread)
+    # ---------------------------------------------------------
+    def compact(self) -> int:
+        """
+        Fold the records written so far into the base file; records
+        appended meanwhile stay in the journal. Returns hexes folded.
+        """
+        with self._lock:
+            upto, pending = self.seq, self.pending
+        if not pending or not self.base_path.exists():
+            return 0
+
+        with self._base_lock:
+            grid = read_map(self.base_path)
+            folded = len(set(self.replay(grid, upto)))
+            # keep the base in the format it was saved in
+            write_map(grid, self.base_path, binary=map_format.is_binary_map(self.base_path))
+
+            # a crash from here on just replays already-folded records again
+            self._drop_folded(upto)
+        return folded
+
+    def _drop_folded(self, upto: int):
+        with self._lock:
+            tail = [rec for rec in self.records() if rec["seq"] > upto]
+            tmp = _tmp_path(self.path)
+            with tmp.open("w", encoding="utf-8") as f:
+                for rec in tail:
+                    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self.pending = len(tail)
@@ -1,4 +1,5 @@
 # file: core/movement.py
+import weakref
 from typing import Tuple
 from core.grid import HexGrid
 from core.party import Party
@@ -18,12 +19,19 @@ AXIAL_DIRECTIONS = [
     (-1, 0),   # 5 = NW
 ]
 
+DIRECTION_INDEX = {d: i for i, d in enumerate(AXIAL_DIRECTIONS)}
+
 
 def add(a: Coord, b: Coord) -> Coord:
     """Add two axial coordinates."""
     return (a[0] + b[0], a[1] + b[1])
 
 
+def direction_between(a: Coord, b: Coord):
+    """Direction index from a to an adjacent hex b, or None if not adjacent."""
+    return DIRECTION_INDEX.get((b[0] - a[0], b[1] - a[1]))
+
+
 # ---------------------------------------------------------
 # Basic movement step (no cost)
 # ---------------------------------------------------------
@@ -55,6 +63,38 @@ SPEED_MODES = {
 }
 
 
+def time_cost_model(grid: HexGrid, party: Party = None):
+    """
+    The time-token rules as a CostModel: mean biome base_cost of both
+    hexes x pace (SPEED_MODES) / leader navigation (wisdom).
+    """
+    from core.cost_model import BiomeTerm, CostModel, ModeTableTerm, NavigationTerm
+
+    return CostModel(
+        grid,
+        terms=[
+            BiomeTerm("base_cost", blend="mean"),
+            ModeTableTerm(SPEED_MODES),
+            NavigationTerm(),
+        ],
+        base=0.0,
+        party=party,
+        integer=False,
+    )
+
+
+# grid -> (party, model): one time-cost model per grid, rebuilt when the
+# party changes (cost_between reads tiles live, so edits need no reset)
+_time_models = weakref.WeakKeyDictionary()
+
+
+def _time_model(grid: HexGrid, party: Party):
+    cached = _time_models.get(grid)
+    if cached is None or cached[0] is not party:
+        cached = _time_models[grid] = (party, time_cost_model(grid, party))
+    return cached[1]
+
+
 def calculate_time_cost(
     party: Party,
     grid: HexGrid,
@@ -64,31 +104,11 @@ def calculate_time_cost(
 ) -> float:
     """
     Computes time tokens required to move from axial coord src → dst.
-    Uses leader stats and biome difficulty.
+    Uses leader stats and biome difficulty (see time_cost_model).
     """
 
-    tile_from = grid.get(src)
-    tile_to   = grid.get(dst)
-
     # Missing tile → impossible move
-    if tile_from is None or tile_to is None:
+    if grid.get(src) is None or grid.get(dst) is None:
         return 9999.0
 
-    biome_from = tile_from.biome_id
-    biome_to   = tile_to.biome_id
-
-    # Leader stat factor (example: wisdom affects navigation)
-    leader = party.leader
-    stat_factor = max(0.3, leader.wisdom / 15.0)
-
-    # Biome difficulties
-    b_from = grid.biome_lib.get(biome_from)
-    b_to   = grid.biome_lib.get(biome_to)
-    base_difficulty = (b_from.base_cost + b_to.base_cost) * 0.5
-
-    # Speed mode modifier
-    speed_mult = SPEED_MODES.get(mode, 1.0)
-
-    # Final formula
-    cost = base_difficulty * speed_mult / stat_factor
-    return cost
\ No newline at end of file
+    return _time_model(grid, party).cost_between(src, dst, mode)
@@ -1,8 +1,9 @@
 # file: core/party.py
 import csv
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 import math
 
 Coord = Tuple[int, int]
@@ -20,6 +21,7 @@ class PartyMember:
     name: str
     speed: int
     con: int
+    wisdom: int = 10
 
     max_tokens: int = field(init=False)
     tokens: float = field(init=False)
@@ -41,23 +43,265 @@ class PartyMember:
             self.exhaustion += deficit
 
 
+class PartyMemberView:
+    """
+    One member row of a PartyPopulation.
+    Reads and writes go straight to the population arrays, so the
+    view behaves like a PartyMember without owning any state.
+    """
+
+    __slots__ = ("_pop", "_index")
+
+    def __init__(self, population: "PartyPopulation", index: int):
+        self._pop = population
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._pop.names[self._index]
+
+    @property
+    def speed(self) -> int:
+        return self._pop.speed[self._index]
+
+    @property
+    def con(self) -> int:
+        return self._pop.con[self._index]
+
+    @property
+    def wisdom(self) -> int:
+        return self._pop.wisdom[self._index]
+
+    @property
+    def max_tokens(self) -> int:
+        return self._pop.max_tokens[self._index]
+
+    @property
+    def tokens(self) -> float:
+        return self._pop.tokens[self._index]
+
+    @tokens.setter
+    def tokens(self, value: float):
+        self._pop.tokens[self._index] = value
+
+    @property
+    def exhaustion(self) -> float:
+        return self._pop.exhaustion[self._index]
+
+    @exhaustion.setter
+    def exhaustion(self, value: float):
+        self._pop.exhaustion[self._index] = value
+
+    def apply_cost(self, cost: float):
+        """Same rule as PartyMember.apply_cost."""
+        self._pop.apply_member_cost(self._index, cost)
+
+    def __repr__(self):
+        return (
+            f"PartyMemberView(name={self.name!r}, tokens={self.tokens}, "
+            f"max_tokens={self.max_tokens}, exhaustion={self.exhaustion})"
+        )
+
+
+class PartyPopulation:
+    """
+    Structure-of-arrays store for many parties travelling at once
+    (caravans, patrols, rival parties...).
+
+    Member columns (one entry per member; a party's members are contiguous):
+        names, speed, con, wisdom, max_tokens, tokens, exhaustion, party_of
+    Party columns (one entry per party row):
+        start, count, leader, q, r
+
+    Party objects are views over a single row of this store.
+    """
+
+    def __init__(self):
+        # member columns
+        self.names: List[str] = []
+        self.speed = array("l")
+        self.con = array("l")
+        self.wisdom = array("l")
+        self.max_tokens = array("l")
+        self.tokens = array("d")
+        self.exhaustion = array("d")
+        self.party_of = array("l")
+
+        # party columns
+        self.start = array("l")
+        self.count = array("l")
+        self.leader = array("l")
+        self.q = array("l")
+        self.r = array("l")
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def member_total(self) -> int:
+        return len(self.tokens)
+
+    # ---------------------------------------------------------
+    # Construction
+    # ---------------------------------------------------------
+    def add_party(
+        self,
+        members: Iterable[Union[PartyMember, PartyMemberView]],
+        leader_index: int = 0,
+        position: Coord = (0, 0),
+    ) -> int:
+        """
+        Append a party row. Current tokens/exhaustion of the given
+        members are copied in. Returns the new row index.
+        """
+        row = len(self.start)
+        start = len(self.tokens)
+
+        n = 0
+        for m in members:
+            self.names.append(m.name)
+            self.speed.append(m.speed)
+            self.con.append(m.con)
+            self.wisdom.append(m.wisdom)
+            self.max_tokens.append(m.max_tokens)
+            self.tokens.append(m.tokens)
+            self.exhaustion.append(m.exhaustion)
+            self.party_of.append(row)
+            n += 1
+
+        self.start.append(start)
+        self.count.append(n)
+        self.leader.append(leader_index)
+        self.q.append(position[0])
+        self.r.append(position[1])
+        return row
+
+    def party(self, row: int) -> "Party":
+        """Return a Party view over `row`."""
+        return Party.view(self, row)
+
+    def member_range(self, row: int) -> range:
+        start = self.start[row]
+        return range(start, start + self.count[row])
+
+    # ---------------------------------------------------------
+    # Token + exhaustion system
+    # ---------------------------------------------------------
+    def apply_member_cost(self, index: int, cost: float):
+        """Pay cost for a single member; overflow becomes exhaustion."""
+        t = self.tokens[index]
+        if t >= cost:
+            self.tokens[index] = t - cost
+        else:
+            self.tokens[index] = 0.0
+            self.exhaustion[index] += cost - t
+
+    def apply_cost(self, costs: Union[float, Sequence[float]]):
+        """
+        Apply travel cost to every member of every party in one pass.
+
+        `costs` is either a single value for all parties or one value
+        per party row. Overflow becomes exhaustion, exactly like
+        PartyMember.apply_cost.
+        """
+        if isinstance(costs, (int, float)):
+            member_costs = [float(costs)] * len(self.tokens)
+        else:
+            if len(costs) != len(self.start):
+                raise ValueError(
+                    f"expected {len(self.start)} costs, got {len(costs)}"
+                )
+            member_costs = [costs[p] for p in self.party_of]
+
+        tokens = self.tokens
+        self.exhaustion[:] = array("d", [
+            e + c - t if t < c else e
+            for e, t, c in zip(self.exhaustion, tokens, member_costs)
+        ])
+        tokens[:] = array("d", [
+            t - c if t >= c else 0.0
+            for t, c in zip(tokens, member_costs)
+        ])
+
+    def apply_cost_rows(self, rows: Iterable[int], cost: float):
+        """Apply the same cost to the members of the given party rows only."""
+        for row in rows:
+            for i in self.member_range(row):
+                self.apply_member_cost(i, cost)
+
+    def recover_tokens(self, rows: Iterable[int], exhaustion_recovery: float = 0.0):
+        """
+        Refill tokens to max for the given party rows and remove up to
+        `exhaustion_recovery` exhaustion from each member.
+        """
+        tokens, max_tokens, exhaustion = self.tokens, self.max_tokens, self.exhaustion
+        for row in rows:
+            for i in self.member_range(row):
+                tokens[i] = float(max_tokens[i])
+                if exhaustion_recovery:
+                    exhaustion[i] = max(0.0, exhaustion[i] - exhaustion_recovery)
+
+
 class Party:
-    def __init__(self, members: List[PartyMember], leader_index: int, position: Coord):
-        self.members = members
-        self.leader_index = leader_index
-        self.position = position
+    """
+    A travelling group. Party is a view over one row of a PartyPopulation;
+    constructing it from a member list creates a private single-row store.
+    """
+
+    def __init__(
+        self,
+        members: List[PartyMember],
+        leader_index: int,
+        position: Coord,
+        population: Optional[PartyPopulation] = None,
+    ):
+        if population is None:
+            population = PartyPopulation()
+        self.population = population
+        self.row = population.add_party(members, leader_index, position)
+
+    @classmethod
+    def view(cls, population: PartyPopulation, row: int) -> "Party":
+        party = cls.__new__(cls)
+        party.population = population
+        party.row = row
+        return party
+
+    @property
+    def members(self) -> List[PartyMemberView]:
+        pop = self.population
+        return [PartyMemberView(pop, i) for i in pop.member_range(self.row)]
+
+    @property
+    def leader_index(self) -> int:
+        return self.population.leader[self.row]
+
+    @leader_index.setter
+    def leader_index(self, value: int):
+        self.population.leader[self.row] = value
+
+    @property
+    def position(self) -> Coord:
+        pop = self.population
+        return (pop.q[self.row], pop.r[self.row])
+
+    @position.setter
+    def position(self, value: Coord):
+        pop = self.population
+        pop.q[self.row] = value[0]
+        pop.r[self.row] = value[1]
 
     @property
-    def leader(self) -> PartyMember:
-        return self.members[self.leader_index]
+    def leader(self) -> PartyMemberView:
+        pop = self.population
+        return PartyMemberView(pop, pop.start[self.row] + self.leader_index)
 
     def apply_movement_cost(self, cost: float):
         """
         Apply travel cost to all party members.
         Overflow adds exhaustion.
         """
-        for m in self.members:
-            m.apply_cost(cost)
+        self.population.apply_cost_rows((self.row,), cost)
 
 
 def load_party_from_csv(path: str | Path, leader_index=0, start_pos=(0, 0)) -> Party:
@@ -76,6 +320,7 @@ def load_party_from_csv(path: str | Path, leader_index=0, start_pos=(0, 0)) -> P
                 name=row["name"],
                 speed=int(row.get("speed", 30)),
                 con=int(row.get("con", 10)),
+                wisdom=int(row.get("wis") or 10),
             )
             members.append(m)
 
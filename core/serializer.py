@@ -3,34 +3,53 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+from . import json_stream
 from .grid import HexGrid
-from .party import Party
+from .party import Party, PartyMember
 
 def save_grid(grid: HexGrid, path: str | Path) -> None:
-    data = grid.to_dict()
-    path = Path(path)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # same bytes as json.dumps(grid.to_dict(), indent=2), one tile at a time
+    json_stream.save_grid(grid, path)
 
-def load_grid(path: str | Path, biome_lib) -> HexGrid:
+def load_grid(path: str | Path, biome_lib=None) -> HexGrid:
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(path)
-    data: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
-    from .grid import HexGrid  # local import to avoid circulars at top-level
-    return HexGrid.from_dict(data, biome_lib)
+    grid = json_stream.load_grid(path)
+    grid.biome_lib = biome_lib
+    return grid
 
-def save_party(party: Party, path: str | Path) -> None:
-    obj = {
-        "position": party.position,
+def party_to_dict(party: Party) -> Dict[str, Any]:
+    # max_tokens is derived from speed/con, so it is not stored
+    return {
+        "position": list(party.position),
         "leader_index": party.leader_index,
-        "members": [m.__dict__ for m in party.members],
+        "members": [
+            {
+                "name": m.name,
+                "speed": m.speed,
+                "con": m.con,
+                "wis": m.wisdom,
+                "tokens": m.tokens,
+                "exhaustion": m.exhaustion,
+            }
+            for m in party.members
+        ],
     }
+
+def party_from_dict(data: Dict[str, Any]) -> Party:
+    members = []
+    for m in data["members"]:
+        member = PartyMember(m["name"], m["speed"], m["con"], m.get("wis", 10))
+        member.tokens = m.get("tokens", member.tokens)
+        member.exhaustion = m.get("exhaustion", 0.0)
+        members.append(member)
+    return Party(members, data["leader_index"], tuple(data["position"]))
+
+def save_party(party: Party, path: str | Path) -> None:
     path = Path(path)
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(party_to_dict(party), indent=2), encoding="utf-8")
 
 def load_party(path: str | Path) -> Party:
-    from .party import PartyMember, Party
     path = Path(path)
-    data = json.loads(path.read_text(encoding="utf-8"))
-    members = [PartyMember(**m) for m in data["members"]]
-    return Party(members, data["leader_index"], tuple(data["position"]))
\ No newline at end of file
+    return party_from_dict(json.loads(path.read_text(encoding="utf-8")))
@@ -0,0 +1,135 @@
+# file: core/slope.py
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from core.grid import HexGrid
+from core.movement import AXIAL_DIRECTIONS
+
+Coord = Tuple[int, int]
+
+# Extra tokens per elevation unit climbed / descended along an edge.
+UPHILL_COST = 0.5
+DOWNHILL_COST = 0.25
+
+
+class SlopeField:
+    """
+    Direction-dependent slope penalties for every edge of the grid.
+
+    penalties[i * 6 + d] is the extra cost of leaving tile i in
+    direction d (0 for off-map neighbours). The whole table is built in
+    one pass over elevation differences; update(coord) patches only the
+    12 entries touching one tile after its elevation changes.
+
+    Built lazily on first use and rebuilt if pointed at another grid.
+    """
+
+    def __init__(self, grid: HexGrid, uphill: float = UPHILL_COST,
+                 downhill: float = DOWNHILL_COST):
+        self.grid = grid
+        self.uphill = uphill
+        self.downhill = downhill
+
+        self.index: Dict[Coord, int] = {}
+        self.coords = []
+        self.elevation = array("d")
+        self.neighbors = array("l")     # i * 6 + d -> neighbour index or -1
+        self.penalties = array("d")
+        self._built = False
+
+    # ---------------------------------------------------------
+    # Building
+    # ---------------------------------------------------------
+    def rebuild(self, grid: Optional[HexGrid] = None):
+        if grid is not None:
+            self.grid = grid
+
+        tiles = self.grid.tiles
+        self.coords = list(tiles)
+        self.index = index = {c: i for i, c in enumerate(self.coords)}
+        self.elevation = array("d", [tiles[c].elevation for c in self.coords])
+
+        get = index.get
+        self.neighbors = array("l", [
+            get((q + dq, r + dr), -1)
+            for (q, r) in self.coords
+            for (dq, dr) in AXIAL_DIRECTIONS
+        ])
+
+        elev = self.elevation
+        up, down = self.uphill, self.downhill
+        src = [i // 6 for i in range(len(self.neighbors))]
+        diffs = [
+            elev[n] - elev[s] if n >= 0 else 0.0
+            for s, n in zip(src, self.neighbors)
+        ]
+        self.penalties = array("d", [
+            d * up if d > 0 else (-d * down if d < 0 else 0.0)
+            for d in diffs
+        ])
+        self._built = True
+
+    def _ensure(self, grid: HexGrid):
+        if not self._built or grid is not self.grid:
+            self.rebuild(grid)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    def edge_penalty(self, src: Coord, direction_index: int,
+                     grid: Optional[HexGrid] = None) -> float:
+        self._ensure(grid or self.grid)
+        i = self.index.get(src)
+        if i is None:
+            return 0.0
+        return self.penalties[i * 6 + direction_index]
+
+    def heights(self) -> Iterator[Tuple[Coord, float]]:
+        """(coord, normalised elevation 0..1) for a heightmap overlay."""
+        self._ensure(self.grid)
+        elev = self.elevation
+        if not elev:
+            return
+        lo, hi = min(elev), max(elev)
+        span = (hi - lo) or 1.0
+        for coord, e in zip(self.coords, elev):
+            yield coord, (e - lo) / span
+
+    # ---------------------------------------------------------
+    # Local updates
+    # ---------------------------------------------------------
+    def update(self, coord: Coord):
+        """Re-read one tile's elevation and patch the edges around it."""
+        if not self._built:
+            return
+        i = self.index.get(coord)
+        tile = self.grid.get(coord)
+        if i is None or tile is None:
+            # tile added or removed: the index itself is stale
+            self._built = False
+            return
+
+        self.elevation[i] = tile.elevation
+        for d in range(6):
+            n = self.neighbors[i * 6 + d]
+            if n < 0:
+                continue
+            self.penalties[i * 6 + d] = self._penalty(i, n)
+            self.penalties[n * 6 + HexGrid.opposite_dir(d)] = self._penalty(n, i)
+
+    def invalidate(self, *_):
+        """Forget everything; rebuilt on next query."""
+        self._built = False
+
+    def _penalty(self, src: int, dst: int) -> float:
+        d = self.elevation[dst] - self.elevation[src]
+        if d > 0:
+            return d * self.uphill
+        return -d * self.downhill if d < 0 else 0.0
+
+    # ---------------------------------------------------------
+    # Event wiring
+    # ---------------------------------------------------------
+    def attach(self, events):
+        events.subscribe("elevation_changed", self.update)
+        events.subscribe("map_loaded", self.invalidate)
@@ -0,0 +1,189 @@
+# file: core/trail_network.py
+from collections import deque
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from core.grid import HexGrid
+from core.movement import AXIAL_DIRECTIONS
+
+Coord = Tuple[int, int]
+
+
+class TrailNetwork:
+    """
+    Connected trail networks as a disjoint-set forest over hexes.
+
+    - adding a trail is a union: near-constant time
+    - erasing a trail can split a network, which a union-find cannot
+      undo, so only the affected network is re-walked (BFS over its own
+      hexes)
+    - hexes with no trail are their own one-hex network
+
+    `trail_ids` restricts which trail types count (e.g. only roads);
+    None means any trail.
+    """
+
+    def __init__(self, grid: HexGrid, trail_ids: Optional[Iterable[str]] = None):
+        self.grid = grid
+        self.trail_ids = frozenset(trail_ids) if trail_ids is not None else None
+
+        self._parent: Dict[Coord, Coord] = {}
+        self._members: Dict[Coord, Set[Coord]] = {}   # root -> hexes
+        self.rebuild()
+
+    # ---------------------------------------------------------
+    # Building
+    # ---------------------------------------------------------
+    def reset(self, grid: HexGrid):
+        """Follow `grid` with every hex its own network (no scan)."""
+        self.grid = grid
+        self._parent.clear()
+        self._members.clear()
+
+    def rebuild(self, grid: Optional[HexGrid] = None):
+        """Full scan of every tile's trails."""
+        for _ in self.rebuild_steps(grid):
+            pass
+
+    def rebuild_steps(self, grid: Optional[HexGrid] = None, every: int = 512):
+        """
+        rebuild() as a generator yielding every `every` hexes, for the
+        GUI TaskRunner. Queries see a partial network until it finishes.
+        """
+        self.reset(grid if grid is not None else self.grid)
+
+        for n, (coord, tile) in enumerate(self.grid.tiles.items(), 1):
+            if n % every == 0:
+                yield n / len(self.grid.tiles)
+            q, r = coord
+            # each edge is stored on both tiles; union from one side only
+            for d in range(3):
+                if self._counts(tile.trails[d]):
+                    dq, dr = AXIAL_DIRECTIONS[d]
+                    nbr = (q + dq, r + dr)
+                    if nbr in self.grid.tiles:
+                        self._union(coord, nbr)
+
+    def _counts(self, trail_id) -> bool:
+        if not trail_id or trail_id == "none":
+            return False
+        return self.trail_ids is None or trail_id in self.trail_ids
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    def find(self, coord: Coord) -> Coord:
+        parent = self._parent
+        root = parent.get(coord)
+        if root is None:
+            return coord
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while coord != root:
+            coord, parent[coord] = parent[coord], root
+        return root
+
+    def connected(self, a: Coord, b: Coord) -> bool:
+        return a == b or self.find(a) == self.find(b)
+
+    def component(self, coord: Coord) -> Set[Coord]:
+        members = self._members.get(self.find(coord))
+        return set(members) if members is not None else {coord}
+
+    def component_size(self, coord: Coord) -> int:
+        members = self._members.get(self.find(coord))
+        return len(members) if members is not None else 1
+
+    def components(self) -> Iterator[Set[Coord]]:
+        """Every network of two or more hexes."""
+        for members in self._members.values():
+            yield set(members)
+
+    # ---------------------------------------------------------
+    # Incremental updates
+    # ---------------------------------------------------------
+    def update(self, coord: Coord, direction_index: int):
+        """Re-read one edge after its trail was set or erased."""
+        tile = self.grid.get(coord)
+        if tile is None:
+            return
+        dq, dr = AXIAL_DIRECTIONS[direction_index]
+        nbr = (coord[0] + dq, coord[1] + dr)
+        if nbr not in self.grid.tiles:
+            return
+
+        if self._counts(tile.trails[direction_index]):
+            self._union(coord, nbr)
+        elif self.connected(coord, nbr):
+            self._split(coord, nbr)
+
+    def _union(self, a: Coord, b: Coord):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        parent, members = self._parent, self._members
+        for root in (ra, rb):
+            if root not in members:
+                parent[root] = root
+                members[root] = {root}
+
+        # union by size: the smaller member set moves
+        if len(members[ra]) < len(members[rb]):
+            ra, rb = rb, ra
+        parent[rb] = ra
+        members[ra] |= members.pop(rb)
+
+    def _split(self, a: Coord, b: Coord):
+        """Edge a-b was erased: re-walk their old network only."""
+        old_root = self.find(a)
+        old = self._members.pop(old_root)
+
+        side_a = self._reachable(a, old)
+        if b in side_a:
+            self._members[old_root] = old      # still joined another way
+            return
+
+        for part in (side_a, old - side_a):
+            root = next(iter(part))
+            if len(part) == 1:
+                # back to an untracked singleton
+                self._parent.pop(root, None)
+                continue
+            for c in part:
+                self._parent[c] = root
+            self._members[root] = part
+
+    def _reachable(self, start: Coord, within: Set[Coord]) -> Set[Coord]:
+        tiles = self.grid.tiles
+        seen = {start}
+        todo = deque([start])
+        while todo:
+            q, r = todo.popleft()
+            trails = tiles[(q, r)].trails
+            for d, (dq, dr) in enumerate(AXIAL_DIRECTIONS):
+                nbr = (q + dq, r + dr)
+                if nbr in within and nbr not in seen and self._counts(trails[d]):
+                    seen.add(nbr)
+                    todo.append(nbr)
+        return seen
+
+    # ---------------------------------------------------------
+    # Event wiring
+    # ---------------------------------------------------------
+    def attach(self, state):
+        state.events.subscribe("trail_changed", self.update)
+        state.events.subscribe("map_loaded", lambda *_: self._on_map_loaded(state))
+
+    def _on_map_loaded(self, state):
+        tasks = getattr(state, "tasks", None)
+        if hasattr(state.grid.tiles, "store"):
+            # a chunked map: scanning it would fault in the whole store, so
+            # the network starts empty and follows the trails edited from
+            # here on (rebuild() still scans everything on request)
+            if tasks is not None:
+                tasks.cancel("trail_network")
+            self.reset(state.grid)
+        elif tasks is None:
+            self.rebuild(state.grid)
+        else:
+            tasks.spawn(self.rebuild_steps(state.grid), key="trail_network")
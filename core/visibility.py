@@ -0,0 +1,264 @@
+# file: core/visibility.py
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+from core.grid import HexGrid
+
+Coord = Tuple[int, int]
+
+# Observer eye height above their own hex, in elevation units.
+EYE_HEIGHT = 1.0
+DEFAULT_SIGHT_RADIUS = 4
+
+# Per-hex visibility states
+UNEXPLORED = 0
+EXPLORED = 1      # seen before, not currently in view
+VISIBLE = 2
+
+
+def _cube_round(x: float, z: float) -> Coord:
+    y = -x - z
+    rx, ry, rz = round(x), round(y), round(z)
+    dx, dy, dz = abs(rx - x), abs(ry - y), abs(rz - z)
+    if dx > dy and dx > dz:
+        rx = -ry - rz
+    elif dz >= dy:
+        rz = -rx - ry
+    return (int(rx), int(rz))
+
+
+def hex_line(a: Coord, b: Coord) -> List[Coord]:
+    """Hexes on the straight line from a to b, both ends included."""
+    n = HexGrid.hex_distance(a, b)
+    if n == 0:
+        return [a]
+    # nudge off exact hex edges so ties round consistently
+    aq, ar = a[0] + 1e-6, a[1] + 1e-6
+    bq, br = b[0] + 1e-6, b[1] + 1e-6
+    return [
+        _cube_round(aq + (bq - aq) * i / n, ar + (br - ar) * i / n)
+        for i in range(n + 1)
+    ]
+
+
+class SightLines:
+    """
+    Sight lines from (0, 0) to every hex within `radius`, precomputed
+    once. Lines are translation invariant, so a field of view at any
+    origin just offsets these.
+
+    lines: [(dq, dr, ((iq, ir, t), ...)), ...] where the inner tuple
+    lists the intermediate hexes and their fraction t along the line.
+    """
+
+    def __init__(self, radius: int):
+        self.radius = radius
+        self.lines = []
+        origin = (0, 0)
+        for dq in range(-radius, radius + 1):
+            for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1):
+                target = (dq, dr)
+                if target == origin:
+                    continue
+                path = hex_line(origin, target)
+                n = len(path) - 1
+                between = tuple((q, r, i / n) for i, (q, r) in enumerate(path[1:-1], start=1))
+                self.lines.append((dq, dr, between))
+
+
+def compute_fov(
+    grid: HexGrid,
+    origin: Coord,
+    sight: SightLines,
+    eye_height: float = EYE_HEIGHT,
+) -> FrozenSet[Coord]:
+    """
+    Hexes visible from `origin`. A hex is visible if no hex on the line
+    to it rises (elevation + biome occlusion) above the sight line from
+    the observer's eye to the target's top.
+    """
+    tiles = grid.tiles
+    biome_lib = grid.biome_lib
+    start = tiles.get(origin)
+    if start is None:
+        return frozenset()
+
+    heights: Dict[Coord, float] = {}
+
+    def height(coord: Coord) -> Optional[float]:
+        h = heights.get(coord)
+        if h is None and coord not in heights:
+            tile = tiles.get(coord)
+            if tile is None:
+                h = None
+            else:
+                occ = 0.0
+                if biome_lib is not None:
+                    try:
+                        occ = getattr(biome_lib.get(tile.biome_id), "occlusion", 0.0)
+                    except KeyError:
+                        pass
+                h = tile.elevation + occ
+            heights[coord] = h
+        return h
+
+    oq, or_ = origin
+    eye = start.elevation + eye_height
+    visible = {origin}
+
+    for dq, dr, between in sight.lines:
+        target = (oq + dq, or_ + dr)
+        top = height(target)
+        if top is None:
+            continue
+
+        slope = top - eye
+        for iq, ir, t in between:
+            h = height((oq + iq, or_ + ir))
+            if h is not None and h > eye + slope * t:
+                break
+        else:
+            visible.add(target)
+
+    return frozenset(visible)
+
+
+class PartyVision:
+    __slots__ = ("origin", "visible", "explored")
+
+    def __init__(self):
+        self.origin: Optional[Coord] = None
+        self.visible: FrozenSet[Coord] = frozenset()
+        self.explored: Set[Coord] = set()
+
+
+class VisibilitySystem:
+    """
+    Line-of-sight fog of war for one or more parties.
+
+    - update_party(key, origin) recomputes only the sight disk around the
+      party and returns the hexes whose state changed
+    - fields of view are cached per origin and dropped only when a tile
+      within sight range of that origin changes (or all of them when
+      biome occlusion is reloaded)
+    - attach(events) wires it to party_moved / tile_changed /
+      library_changed and publishes
+      "visibility_changed" with the changed hexes
+    """
+
+    def __init__(self, grid: HexGrid, radius: int = DEFAULT_SIGHT_RADIUS,
+                 eye_height: float = EYE_HEIGHT, cache_limit: int = 4096):
+        self.grid = grid
+        self.eye_height = eye_height
+        self.cache_limit = cache_limit
+        self.sight = SightLines(radius)
+        self.parties: Dict[Hashable, PartyVision] = {}
+        self._fov_cache: Dict[Coord, FrozenSet[Coord]] = {}
+
+    @property
+    def radius(self) -> int:
+        return self.sight.radius
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    def state(self, coord: Coord, party_key: Hashable = "party") -> int:
+        vision = self.parties.get(party_key)
+        if vision is None:
+            return UNEXPLORED
+        if coord in vision.visible:
+            return VISIBLE
+        if coord in vision.explored:
+            return EXPLORED
+        return UNEXPLORED
+
+    def visible(self, party_key: Hashable = "party") -> FrozenSet[Coord]:
+        vision = self.parties.get(party_key)
+        return vision.visible if vision else frozenset()
+
+    def explored(self, party_key: Hashable = "party") -> Set[Coord]:
+        vision = self.parties.get(party_key)
+        return vision.explored if vision else set()
+
+    # ---------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------
+    def fov(self, origin: Coord) -> FrozenSet[Coord]:
+        fov = self._fov_cache.get(origin)
+        if fov is None:
+            fov = compute_fov(self.grid, origin, self.sight, self.eye_height)
+            if len(self._fov_cache) >= self.cache_limit:
+                # drop the oldest entry (dicts keep insertion order)
+                del self._fov_cache[next(iter(self._fov_cache))]
+            self._fov_cache[origin] = fov
+        return fov
+
+    def update_party(self, party_key: Hashable, origin: Coord) -> Set[Coord]:
+        """Move a party's eye to `origin`. Returns hexes whose state changed."""
+        vision = self.parties.get(party_key)
+        if vision is None:
+            vision = self.parties[party_key] = PartyVision()
+
+        new = self.fov(origin)
+        old = vision.visible
+        vision.origin = origin
+        vision.visible = new
+        vision.explored |= new
+        return set(new.symmetric_difference(old))
+
+    def invalidate(self, coord: Coord) -> Dict[Hashable, Set[Coord]]:
+        """
+        A tile's height or occlusion changed. Drop cached views that can
+        see it and refresh parties in range. Returns changes per party.
+        """
+        dist = HexGrid.hex_distance
+        r = self.radius
+        for origin in [o for o in self._fov_cache if dist(o, coord) <= r]:
+            del self._fov_cache[origin]
+
+        changes = {}
+        for key, vision in self.parties.items():
+            if vision.origin is not None and dist(vision.origin, coord) <= r:
+                changed = self.update_party(key, vision.origin)
+                if changed:
+                    changes[key] = changed
+        return changes
+
+    def invalidate_all(self) -> Dict[Hashable, Set[Coord]]:
+        """Sight rules changed everywhere (e.g. biome occlusion reloaded)."""
+        self._fov_cache.clear()
+        changes = {}
+        for key, vision in self.parties.items():
+            if vision.origin is not None:
+                changed = self.update_party(key, vision.origin)
+                if changed:
+                    changes[key] = changed
+        return changes
+
+    def reset(self, grid: Optional[HexGrid] = None):
+        """Forget all views and exploration (e.g. after loading a map)."""
+        if grid is not None:
+            self.grid = grid
+        self.parties.clear()
+        self._fov_cache.clear()
+
+    # ---------------------------------------------------------
+    # Event wiring
+    # ---------------------------------------------------------
+    def attach(self, events, party_key: Hashable = "party"):
+        def on_party_moved(pos):
+            changed = self.update_party(party_key, pos)
+            if changed:
+                events.publish("visibility_changed", party_key, changed)
+
+        def on_tile_changed(coord):
+            for key, changed in self.invalidate(coord).items():
+                events.publish("visibility_changed", key, changed)
+
+        def on_library_changed(name, fields):
+            if name == "biomes" and "occlusion" in fields:
+                for key, changed in self.invalidate_all().items():
+                    events.publish("visibility_changed", key, changed)
+
+        events.subscribe("party_moved", on_party_moved)
+        events.subscribe("tile_changed", on_tile_changed)
+        events.subscribe("library_changed", on_library_changed)
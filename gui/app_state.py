@@ -1,7 +1,7 @@
 # file: gui/app_state.py
 
 from dataclasses import dataclass, field
-import tkinter as tk
+from typing import Any
 
 from core.event_bus import EventBus
 from gui.undo_manager import UndoManager   # your GUI-undo class
@@ -23,11 +23,8 @@ class AppState:
     # Undo/redo manager
     undo: UndoManager = field(default_factory=UndoManager)
 
-    # 🔥 Add this: a globally shared selected tool variable
-    current_tool_var: tk.StringVar = field(
-        default_factory=lambda: tk.StringVar(value="select")
-    )
+    # Globally shared selected tool / trail (tk.StringVar). Created by
+    # gui_main once the Tk root exists, so AppState itself needs no Tk.
+    current_tool_var: Any = None
 
-    current_trail_var: tk.StringVar = field(
-        default_factory=lambda: tk.StringVar(value="footpath")
-    )
\ No newline at end of file
+    current_trail_var: Any = None
\ No newline at end of file
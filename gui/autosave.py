@@ -0,0 +1,144 @@
+# file: gui/autosave.py
+import os
+from concurrent import futures
+from pathlib import Path
+from typing import Optional
+
+from core.map_journal import DirtyTiles, MapJournal
+
+
+def _same_file(a, b) -> bool:
+    return Path(os.path.abspath(a)) == Path(os.path.abspath(b))
+
+
+class Autosave:
+    """
+    Journals edited hexes to the current map file's journal.
+
+      - every `interval_ms` the tiles changed since the last tick (edits,
+        undo and redo alike) are appended to the journal; nothing is
+        written when nothing changed
+      - once `compact_after` records are pending, the journal is folded
+        into the base file on the job service
+      - until a map has been saved or loaded there is no file to journal
+        to, and ticks do nothing
+      - while a full save is being written ticks wait; the new file's
+        journal takes over only once the save has succeeded
+    """
+
+    def __init__(self, root, state, interval_ms: int = 5000, compact_after: int = 200):
+        self.root = root
+        self.state = state
+        self.interval_ms = interval_ms
+        self.compact_after = compact_after
+
+        self.dirty = DirtyTiles()
+        self.dirty.attach(state.events)
+        self.journal: Optional[MapJournal] = None
+        self._saving: Optional[MapJournal] = None
+        self._compact_job = None
+
+        self.root.after(self.interval_ms, self._tick)
+
+    # ---------------------------------------------------------
+    # Binding to a map file
+    # ---------------------------------------------------------
+    def open(self, path):
+        """Load a map file plus its journal (recovering unsaved edits)."""
+        journal = MapJournal(path)
+        grid = journal.load()
+        self._bind(journal)
+        return grid, journal.pending
+
+    def save_full(self, path, binary=None):
+        """Full save of the current grid to `path`; starts a fresh journal."""
+        journal, upto = self.begin_full_save(path)
+        try:
+            journal.save_base(self.state.grid, upto, binary=binary)
+        except BaseException:
+            self.end_full_save(journal, False)
+            raise
+        self.end_full_save(journal, True)
+
+    def begin_full_save(self, path):
+        """
+        Prepare a full save to `path` of the grid as it is now: edits so
+        far go to the current journal, later ones wait for
+        end_full_save(). Returns `path`'s journal and the seq the save
+        will cover.
+        """
+        current = self.journal
+        if current is not None and len(self.dirty):
+            current.append(self.state.grid, self.dirty.take())
+        self.dirty.clear()              # the rest are in the saved grid
+
+        if current is not None and _same_file(path, current.base_path):
+            # one journal, one base lock: a compaction still running on
+            # this file finishes before the save writes it (or after,
+            # finding its records already folded)
+            journal = current
+        else:
+            self._wait_for_compaction()
+            journal = MapJournal(path)
+        self._saving = journal
+        return journal, journal.seq
+
+    def end_full_save(self, journal: MapJournal, ok: bool):
+        """
+        The full save has been written (`ok`) or has failed: switch to its
+        journal, or keep the old one. Edits made meanwhile go to whichever.
+        """
+        if self._saving is not journal:
+            return                      # another map was loaded meanwhile
+        self._saving = None
+        if ok:
+            self.journal = journal
+
+    def detach(self):
+        """Stop journalling (the map in use keeps its own file)."""
+        self.journal = self._saving = None
+        self.dirty.clear()
+
+    def _bind(self, journal: MapJournal):
+        self.journal = journal
+        self._saving = None
+        self.dirty.clear()
+
+    # ---------------------------------------------------------
+    # Autosave
+    # ---------------------------------------------------------
+    def flush(self) -> int:
+        """Journal pending edits now; returns hexes written."""
+        if self.journal is None or self._saving is not None or not len(self.dirty):
+            return 0
+        written = self.journal.append(self.state.grid, self.dirty.take())
+        if self.journal.pending >= self.compact_after:
+            self.compact()
+        return written
+
+    def compact(self):
+        """Fold the journal into the base file, in the background if possible."""
+        if self.journal is None:
+            return
+        job = self._compact_job
+        if job is not None and not job.future.done():
+            return                      # one compaction at a time
+        jobs = getattr(self.state, "jobs", None)
+        if jobs is None:
+            self.journal.compact()
+        else:
+            self._compact_job = jobs.submit(self.journal.compact, event="map_compacted")
+
+    def _wait_for_compaction(self):
+        job = self._compact_job
+        if job is None or job.future.done():
+            return
+        job.future.cancel()             # not started yet: skip it
+        if not job.future.cancelled():
+            futures.wait([job.future])
+
+    def _tick(self):
+        try:
+            self.flush()
+        finally:
+            self.root.after(self.interval_ms, self._tick)
@@ -0,0 +1,135 @@
+# file: gui/background_save.py
+from core import chunk_store, map_format
+from core.map_journal import write_map
+
+
+class BackgroundSave:
+    """
+    Saves the map without blocking the Tk loop.
+
+      - save() takes a copy-on-write GridSnapshot on the Tk thread (cheap:
+        a list of coords), so editing can go on while the file is written
+      - a chunked map is not snapshotted: its dirty chunks are written
+        back and further write-backs held (ChunkedTiles.hold_writes) while
+        the worker streams its own read-only view of the store, chunk by
+        chunk, as JSON (.hexmap needs the whole map in memory, so it is
+        refused for chunked maps)
+      - a job-service worker encodes the snapshot to a temp file and
+        renames it into place; with autosave on, the journal is switched
+        to the new file once the save succeeded and keeps the edits made
+        during the save (on failure the old journal gets them)
+      - progress is polled every `poll_ms` and published on the Tk thread:
+            "save_started"(path)
+            "save_progress"(path, fraction)
+            "save_finished"(path, error)      error is None on success
+    """
+
+    def __init__(self, state, widget, poll_ms: int = 100):
+        self.state = state
+        self.widget = widget
+        self.poll_ms = poll_ms
+
+        self.path = None
+        self._progress = 0.0            # written by the worker
+        self._shown = -1.0
+        self._after_id = None
+
+    @property
+    def busy(self) -> bool:
+        return self.path is not None
+
+    def save(self, path, binary=None) -> bool:
+        """
+        Start saving to `path` (.hexmap if `binary`, else JSON; None: by
+        suffix); False if a save is already running. ValueError for
+        .hexmap on a chunked map.
+        """
+        if self.busy:
+            return False
+
+        state = self.state
+        tiles = state.grid.tiles
+        autosave = getattr(state, "autosave", None)
+        journal = None
+        if hasattr(tiles, "hold_writes"):
+            if binary or (binary is None and str(path).endswith(map_format.SUFFIX)):
+                raise ValueError("a chunked map can only be exported as JSON")
+            tiles.hold_writes()
+            store_path = tiles.store.path
+            release = tiles.release_writes
+            write = lambda progress: _export_chunked(store_path, path, progress)
+        else:
+            snapshot = state.grid.snapshot()
+            release = snapshot.close
+            if autosave is not None:
+                journal, upto = autosave.begin_full_save(path)
+                write = lambda progress: journal.save_base(snapshot, upto, progress, binary)
+            else:
+                write = lambda progress: write_map(snapshot, path, progress, binary)
+
+        self.path = path
+        self._progress, self._shown = 0.0, -1.0
+        state.events.publish("save_started", path)
+
+        jobs = getattr(state, "jobs", None)
+        if jobs is None:
+            self._finish(release, journal, self._run(write))
+            return True
+
+        jobs.submit(self._run, write,
+                    on_done=lambda error: self._finish(release, journal, error))
+        self._schedule_poll()
+        return True
+
+    # ---------------------------------------------------------
+    # Worker side
+    # ---------------------------------------------------------
+    def _run(self, write):
+        try:
+            write(self._set_progress)
+        except Exception as exc:        # reported through save_finished
+            return exc
+        return None
+
+    def _set_progress(self, fraction: float):
+        self._progress = fraction
+
+    # ---------------------------------------------------------
+    # Tk thread
+    # ---------------------------------------------------------
+    def _schedule_poll(self):
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._after_id = None
+        if not self.busy:
+            return
+        self._publish_progress()
+        self._schedule_poll()
+
+    def _publish_progress(self):
+        progress = self._progress
+        if progress != self._shown:
+            self._shown = progress
+            self.state.events.publish("save_progress", self.path, progress)
+
+    def _finish(self, release, journal, error):
+        release()
+        if journal is not None:
+            self.state.autosave.end_full_save(journal, error is None)
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if error is None:
+            self._publish_progress()
+        path, self.path = self.path, None
+        self.state.events.publish("save_finished", path, error)
+
+
+def _export_chunked(store_path, path, progress):
+    grid = chunk_store.open_grid(store_path, max_chunks=16, readonly=True)
+    try:
+        write_map(grid, path, progress, binary=False)
+    finally:
+        grid.tiles.close()
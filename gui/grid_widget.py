@@ -8,6 +8,9 @@ from core.hex_math import HexMath
 from gui.renderers.layered_renderer import LayeredRenderer
 from gui.renderers.layers.tile_layer import TileLayer
 from gui.renderers.layers.trail_layer import TrailLayer
+from gui.renderers.layers.fog_layer import FogLayer
+from gui.renderers.layers.heightmap_layer import HeightmapLayer
+from gui.renderers.layers.risk_layer import RiskLayer
 from gui.renderers.layers.party_layer import PartyLayer
 from gui.renderers.layers.gridline_layer import GridlineLayer
 from gui.renderers.layers.selection_layer import SelectionLayer
@@ -18,8 +21,9 @@ Coord = Tuple[int, int]
 class HexGridWidget(tk.Canvas):
     """
     Canvas-based hex grid widget with layered rendering.
-    After resizing the canvas, we WAIT (after 100ms) before centering
-    because Tk must finish layout before winfo_width/height are accurate.
+    Layout is driven by <Configure>: nothing is drawn until Tk reports
+    the canvas geometry, then the map is centred and drawn at once;
+    later resizes keep the view centred.
     """
 
     def __init__(self, master, grid: HexGrid, cell_size=32, **kwargs):
@@ -34,16 +38,22 @@ class HexGridWidget(tk.Canvas):
 
         # Layers
         self.tile_layer = TileLayer(self, self.hex_math)
+        self.heightmap_layer = HeightmapLayer(self, self.hex_math)
+        self.risk_layer = RiskLayer(self, self.hex_math)
         self.grid_layer = GridlineLayer(self, self.hex_math)
         self.trail_layer = TrailLayer(self, self.hex_math)
+        self.fog_layer = FogLayer(self, self.hex_math)
         self.party_layer = PartyLayer(self, self.hex_math)
         self.selection_layer = SelectionLayer(self, self.hex_math)
 
         self.renderer = LayeredRenderer(
             self, layers=[
                 self.tile_layer,
+                self.heightmap_layer,
+                self.risk_layer,
                 self.grid_layer,
                 self.trail_layer,
+                self.fog_layer,
                 self.party_layer,
                 self.selection_layer,
             ]
@@ -57,23 +67,44 @@ class HexGridWidget(tk.Canvas):
 
         self._last_drag: Optional[Coord] = None
 
-        # Start delayed layout
-        self.after(500, self._post_init_layout)
+        # Middle-drag pans; the newly exposed hexes are drawn on release
+        self.bind("<ButtonPress-2>", self._pan_start)
+        self.bind("<B2-Motion>", self._pan_move)
+        self.bind("<ButtonRelease-2>", self._pan_end)
+        self._pan_from: Optional[Tuple[int, int]] = None
+
+        # Sliced redraws (TaskRunner injected by CenterPanelController)
+        self.tasks = None
+        self._sliced = None
+        self._redraw_again = False
+        self._redraw_id = None
+
+        # Request a size from the map now; centre and draw once Tk
+        # has laid the canvas out (first <Configure> with a real size)
+        self._size: Optional[Tuple[int, int]] = None
+        self._compute_canvas_size()
+        self.bind("<Configure>", self._on_configure)
 
     # ---------------------------------------------------------
-    # Full post-init sequence: resize canvas → wait → center map
+    # Geometry-driven layout
     # ---------------------------------------------------------
-    def _post_init_layout(self):
-        """Run initial layout after Tk has sized widgets once."""
-        self._compute_canvas_size()
-
-        # Wait for geometry propagation before centering
-        self.after(500, self._delayed_center_and_redraw)
+    def _on_configure(self, event):
+        if event.width <= 1 or event.height <= 1:
+            return
+        old, self._size = self._size, (event.width, event.height)
+        if old is None:
+            self._center_map(event.width, event.height)
+            self.redraw()
+            return
 
-    def _delayed_center_and_redraw(self):
-        """Second-stage layout: now canvas dimensions are correct."""
-        self._center_map()
-        self.redraw()
+        # keep the same map point in the middle of the view
+        dx = (event.width - old[0]) // 2
+        dy = (event.height - old[1]) // 2
+        if dx or dy:
+            self.move("all", dx, dy)
+            self.hex_math.set_offset(self.hex_math.offset_x + dx, self.hex_math.offset_y + dy)
+        if event.width > old[0] or event.height > old[1]:
+            self.redraw_sliced()        # newly exposed hexes
 
     # ---------------------------------------------------------
     # Public API
@@ -82,8 +113,13 @@ class HexGridWidget(tk.Canvas):
         self.redraw()  # kept for compatibility only
 
     def set_party_positions(self, positions: List[Coord]):
-        self.party_positions = positions
-        self.redraw()
+        """Move the party markers only (fog follows via visibility_changed)."""
+        # in place: a sliced repaint under way draws the new positions too
+        self.party_positions[:] = positions
+        if self._size is None:
+            return
+        self.party_layer.redraw(self.grid, self.party_positions,
+                                below=self.selection_layer.TAG)
 
     def set_on_hex_clicked(self, callback: Callable[[Coord], None]):
         self.on_hex_clicked = callback
@@ -91,6 +127,17 @@ class HexGridWidget(tk.Canvas):
     def pixel_to_hex(self, x: float, y: float) -> Coord:
         return self.hex_math.pixel_to_axial(x, y)
 
+    def visible_bounds(self) -> Tuple[int, int, int, int]:
+        """Axial (q_min, q_max, r_min, r_max) covering the canvas area."""
+        w = self.winfo_width()
+        h = self.winfo_height()
+        if w <= 1 or h <= 1:            # not laid out yet: use the requested size
+            w, h = self.winfo_reqwidth(), self.winfo_reqheight()
+        corners = [self.pixel_to_hex(x, y) for x in (0, w) for y in (0, h)]
+        qs = [q for q, _ in corners]
+        rs = [r for _, r in corners]
+        return min(qs) - 1, max(qs) + 1, min(rs) - 1, max(rs) + 1
+
     # ---------------------------------------------------------
     # Events
     # ---------------------------------------------------------
@@ -121,19 +168,32 @@ class HexGridWidget(tk.Canvas):
         self.selection_layer.set_hovered(None)
         self.redraw()
 
+    def _pan_start(self, event):
+        self._pan_from = (event.x, event.y)
+
+    def _pan_move(self, event):
+        if self._pan_from is None:
+            return
+        dx, dy = event.x - self._pan_from[0], event.y - self._pan_from[1]
+        self._pan_from = (event.x, event.y)
+        self.move("all", dx, dy)
+        self.hex_math.set_offset(self.hex_math.offset_x + dx, self.hex_math.offset_y + dy)
+
+    def _pan_end(self, event):
+        if self._pan_from is not None:
+            self._pan_from = None
+            self.redraw_sliced()
+
     # ---------------------------------------------------------
     # Compute bounding box
     # ---------------------------------------------------------
     def _compute_canvas_size(self):
         """Compute map bounding box in pixels, set canvas size."""
-        if not self.grid.tiles:
+        bounds = self.grid.bounds()
+        if bounds is None:
             return
 
-        qs = [q for (q, _) in self.grid.tiles]
-        rs = [r for (_, r) in self.grid.tiles]
-
-        min_q, max_q = min(qs), max(qs)
-        min_r, max_r = min(rs), max(rs)
+        min_q, max_q, min_r, max_r = bounds
 
         # Compute raw pixel box from HEX CENTERS (faster & adequate)
         px_min_x, px_min_y = self.hex_math.axial_to_pixel_raw(min_q, min_r)
@@ -144,8 +204,9 @@ class HexGridWidget(tk.Canvas):
 
         pad = self.hex_math.s * 4
 
-        width = int(map_w + pad)
-        height = int(map_h + pad)
+        # giant (chunked) maps get a screen-sized canvas and are panned
+        width = min(int(map_w + pad), self.winfo_screenwidth())
+        height = min(int(map_h + pad), self.winfo_screenheight())
 
         # Apply canvas size
         self.config(width=width, height=height)
@@ -163,16 +224,9 @@ class HexGridWidget(tk.Canvas):
         print(f"canvas set to {width}×{height}")
 
     # ---------------------------------------------------------
-    # Center the map AFTER canvas size is correct
+    # Center the map once the canvas size is known
     # ---------------------------------------------------------
-    def _center_map(self):
-        canvas_w = self.winfo_width()
-        canvas_h = self.winfo_height()
-
-        if canvas_w <= 1 or canvas_h <= 1:
-            print("Center skipped: canvas not ready")
-            return
-
+    def _center_map(self, canvas_w: int, canvas_h: int):
         # Centering
         self.hex_math.offset_x = canvas_w // 2# - self._map_width // 2
         self.hex_math.offset_y = canvas_h // 2# - self._map_height // 2
@@ -186,4 +240,51 @@ class HexGridWidget(tk.Canvas):
     # Render
     # ---------------------------------------------------------
     def redraw(self):
-        self.renderer.draw(self.grid, self.party_positions)
\ No newline at end of file
+        if self._size is None:
+            return                      # first frame comes from <Configure>
+        if self._sliced is not None and not (self._sliced.done or self._sliced.cancelled):
+            # the sliced redraw in progress may already be past this change
+            self._redraw_again = True
+            return
+        self.renderer.draw(self.grid, self.party_positions)
+
+    def redraw_soon(self):
+        """
+        One synchronous redraw once the current burst of events is over
+        (an edit publishes several), for small edits.
+        """
+        if self._size is None or self._redraw_id is not None:
+            return
+        sliced = self._sliced
+        if sliced is not None and sliced.steps == 0 and not sliced.cancelled:
+            return                      # a repaint that hasn't started covers it
+        self._redraw_id = self.after_idle(self._redraw_idle)
+
+    def _redraw_idle(self):
+        self._redraw_id = None
+        self.redraw()
+
+    def redraw_sliced(self):
+        """
+        Repaint over several Tk idle slices (falls back to redraw()), for
+        map loads, pans and bulk changes. The old picture stays up until
+        it is done.
+        """
+        if self._size is None:
+            return
+        if self.tasks is None:
+            self._sliced = None
+            self.redraw()
+            return
+        self._redraw_again = False
+        self._sliced = self.tasks.spawn(
+            self.renderer.draw_steps(self.grid, self.party_positions),
+            key="redraw",
+            priority=10,
+            on_done=self._sliced_done,
+        )
+
+    def _sliced_done(self, _result):
+        self._sliced = None
+        if self._redraw_again:
+            self.redraw_sliced()
\ No newline at end of file
@@ -1,15 +1,21 @@
 # file: gui/gui_main.py
 import tkinter as tk
 
-from core.biome import BiomeLibrary
+from core.config_cache import load_libraries
 from core.grid import HexGrid
 from core.party import load_party_from_csv
-from core.trail_type import TrailLibrary
-from core.travel_modes import TravelModeLibrary
+from core.trail_network import TrailNetwork
+from core.visibility import VisibilitySystem
 
 from simulation.engine import SimulationEngine
+from simulation.journal import Journal
 
 from gui.app_state import AppState
+from gui.autosave import Autosave
+from gui.background_save import BackgroundSave
+from gui.job_service import JobService
+from gui.library_watcher import LibraryWatcher
+from gui.task_runner import TaskRunner
 from gui.main_window import MainWindow
 
 
@@ -18,22 +24,11 @@ def run_app():
     root.title("Hexcrawl Simulator")
 
     # ---------------------------------------------------------
-    # Biome definitions
+    # Biomes, trail types, travel modes, weather modifiers
+    # (compiled cache, rebuilt when a CSV changes)
     # ---------------------------------------------------------
-    biome_lib = BiomeLibrary()
-    biome_lib.load_from_csv("config/biomes.csv")
-
-    # ---------------------------------------------------------
-    # Trail types
-    # ---------------------------------------------------------
-    trail_lib = TrailLibrary()
-    trail_lib.load_from_csv("config/trails.csv")
-
-    # ---------------------------------------------------------
-    # Travel modes (new)
-    # ---------------------------------------------------------
-    travel_modes = TravelModeLibrary()
-    travel_modes.load_from_csv("config/travel_modes.csv")
+    libraries = load_libraries("config")
+    biome_lib, trail_lib, travel_modes, modifiers = libraries
 
     # ---------------------------------------------------------
     # Create grid
@@ -56,6 +51,7 @@ def run_app():
     # Simulation Engine  ← FIXED: pass travel_modes
     # ---------------------------------------------------------
     engine = SimulationEngine(grid, party, travel_modes)
+    engine.modifiers = modifiers
 
     # ---------------------------------------------------------
     # App State
@@ -67,13 +63,54 @@ def run_app():
         engine=engine,
     )
 
+    state.current_tool_var = tk.StringVar(root, value="select")
+    state.current_trail_var = tk.StringVar(root, value="footpath")
+
     # Attach travel modes to state for the MovementPanel
     state.travel_modes = travel_modes
-    state.travel_mode_var = tk.StringVar(value="normal")
+    state.travel_mode_var = tk.StringVar(root, value="normal")
+
+    # ---------------------------------------------------------
+    # Fog of war (must see party_moved before the widgets redraw)
+    # ---------------------------------------------------------
+    state.visibility = VisibilitySystem(grid)
+    state.visibility.attach(state.events)
+
+    # Keep slope penalties and cached edge costs in step with map edits
+    engine.slope_field.attach(state.events)
+    engine.attach(state.events)
+
+    # Connected trail networks, kept current as trails are drawn/erased
+    state.trail_network = TrailNetwork(grid)
+    state.trail_network.attach(state)
+
+    # Session journey journal (in memory; Journal(engine, path) to persist)
+    state.journal = Journal(engine)
+    state.journal.attach(state)
+
+    # Background work (route searches, ...) delivered on the Tk thread
+    state.jobs = JobService(root, state.events)
+
+    # Long main-thread work (repaints, index rebuilds) in time slices
+    state.tasks = TaskRunner(root, state.events)
+
+    # Incremental autosave of edited hexes once a map file is in use
+    state.autosave = Autosave(root, state)
+
+    # Full saves written from a snapshot while editing continues
+    state.saver = BackgroundSave(state, root)
+
+    # Edited CSVs reloaded in place; caches drop only what changed
+    state.library_watcher = LibraryWatcher(root, state, libraries)
 
     # ---------------------------------------------------------
     # Launch main window
     # ---------------------------------------------------------
     MainWindow(root, state)
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    state.autosave.flush()
+    close_chunks = getattr(state.grid.tiles, "close", None)
+    if close_chunks is not None:
+        close_chunks()
+    state.jobs.shutdown()
\ No newline at end of file
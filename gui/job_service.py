@@ -0,0 +1,206 @@
+# file: gui/job_service.py
+import itertools
+import queue
+import time
+import traceback
+from concurrent.futures import CancelledError, Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from core.event_bus import EventBus
+
+
+class Job:
+    """One submitted call. Timestamps are time.perf_counter() seconds."""
+
+    def __init__(self, job_id: int, fn: Callable, key: Optional[str],
+                 event: Optional[str], on_done: Optional[Callable]):
+        self.id = job_id
+        self.fn = fn
+        self.key = key
+        self.event = event
+        self.on_done = on_done
+
+        self.future: Optional[Future] = None
+        self.submitted = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.delivered: Optional[float] = None
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the result; the call itself is skipped if it hasn't started."""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Submit to delivery on the Tk thread."""
+        if self.delivered is None:
+            return None
+        return self.delivered - self.submitted
+
+
+@dataclass
+class JobStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    pending: int = 0                # submitted, not yet delivered or dropped
+    last_latency_ms: float = 0.0
+    mean_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    mean_run_ms: float = 0.0        # submit to finish on the pool
+
+
+class JobService:
+    """
+    Runs heavy work off the Tk thread.
+
+      - submit() hands a call to a thread pool (or any Executor, e.g. a
+        ProcessPoolExecutor for picklable work)
+      - finished jobs go on a queue that the Tk loop drains every
+        `poll_ms` via after(); polling stops while nothing is pending
+      - results are republished on the EventBus as `event`(result) and/or
+        passed to on_done(result), always on the Tk thread
+      - a job submitted with a `key` supersedes the pending job with the
+        same key (e.g. "hover"): that one is cancelled and its result
+        never delivered
+      - failures publish "job_failed"(job, exc); every poll that delivers
+        something publishes "job_metrics"(JobStats)
+
+    Jobs run concurrently with the Tk thread, so they should read a
+    snapshot taken at submit time rather than the live grid/engine.
+    """
+
+    def __init__(self, widget, events: EventBus, workers: int = 2,
+                 executor: Optional[Executor] = None, poll_ms: int = 30):
+        self.widget = widget
+        self.events = events
+        self.poll_ms = poll_ms
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="job")
+
+        self._ids = itertools.count(1)
+        self._done: "queue.SimpleQueue[Job]" = queue.SimpleQueue()
+        self._pending: Dict[int, Job] = {}
+        self._by_key: Dict[str, Job] = {}
+        self._after_id = None
+
+        self._stats = JobStats()
+        self._latency_total = 0.0
+        self._run_total = 0.0
+
+    # ---------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------
+    def submit(self, fn: Callable, *args, event: Optional[str] = None,
+               key: Optional[str] = None, on_done: Optional[Callable[[Any], None]] = None,
+               **kwargs) -> Job:
+        """Run fn(*args, **kwargs) on the pool (call from the Tk thread)."""
+        if key is not None:
+            self.cancel(key)
+
+        job = Job(next(self._ids), fn, key, event, on_done)
+        self._pending[job.id] = job
+        if key is not None:
+            self._by_key[key] = job
+        self._stats.submitted += 1
+
+        job.future = self.executor.submit(fn, *args, **kwargs)
+        job.future.add_done_callback(lambda _f, job=job: self._finished(job))
+        self._schedule_poll()
+        return job
+
+    def cancel(self, key: str):
+        """Cancel the pending job submitted under `key`, if any."""
+        job = self._by_key.pop(key, None)
+        if job is not None and job.id in self._pending:
+            job.cancel()
+
+    def cancel_all(self):
+        for job in list(self._pending.values()):
+            job.cancel()
+        self._by_key.clear()
+
+    def stats(self) -> JobStats:
+        s = self._stats
+        s.pending = len(self._pending)
+        return JobStats(**vars(s))
+
+    def shutdown(self):
+        self.cancel_all()
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---------------------------------------------------------
+    # Worker side
+    # ---------------------------------------------------------
+    def _finished(self, job: Job):
+        # runs on a pool thread (or right away if the future was cancelled)
+        job.finished = time.perf_counter()
+        self._done.put(job)
+
+    # ---------------------------------------------------------
+    # Polling (Tk thread only)
+    # ---------------------------------------------------------
+    def _schedule_poll(self):
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._after_id = None
+        delivered = False
+
+        while True:
+            try:
+                job = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(job)
+            delivered = True
+
+        if delivered:
+            self.events.publish("job_metrics", self.stats())
+        if self._pending:
+            self._schedule_poll()
+
+    def _deliver(self, job: Job):
+        self._pending.pop(job.id, None)
+        if job.key is not None and self._by_key.get(job.key) is job:
+            del self._by_key[job.key]
+
+        s = self._stats
+        if job.cancelled:
+            s.cancelled += 1
+            return
+
+        try:
+            result = job.future.result()
+        except CancelledError:
+            s.cancelled += 1
+            return
+        except Exception as exc:
+            s.failed += 1
+            print(f"Job {job.id} ({getattr(job.fn, '__name__', job.fn)}) failed:")
+            traceback.print_exception(exc)
+            self.events.publish("job_failed", job, exc)
+            return
+
+        job.delivered = time.perf_counter()
+        latency_ms = job.latency * 1000.0
+        s.completed += 1
+        self._latency_total += latency_ms
+        self._run_total += (job.finished - job.submitted) * 1000.0
+        s.last_latency_ms = latency_ms
+        s.max_latency_ms = max(s.max_latency_ms, latency_ms)
+        s.mean_latency_ms = self._latency_total / s.completed
+        s.mean_run_ms = self._run_total / s.completed
+
+        if job.event:
+            self.events.publish(job.event, result)
+        if job.on_done is not None:
+            job.on_done(result)
@@ -0,0 +1,55 @@
+# file: gui/library_watcher.py
+import csv
+from pathlib import Path
+from typing import Dict, FrozenSet
+
+from core import config_cache
+
+
+class LibraryWatcher:
+    """
+    Hot reload of the CSV libraries while the app runs.
+
+      - every `poll_ms` the CSVs are stat()ed; a library whose file
+        changed is re-parsed into the running library in place
+      - "library_changed" (name, fields) is published with the entry
+        fields that changed; each cache drops only what depends on them
+        (a color repaints tiles, a speed_mod clears mode costs, ...)
+      - a file that doesn't parse or can't be read (e.g. caught
+        half-written, or briefly missing while an editor replaces it) is
+        left alone and retried on the next poll
+    """
+
+    def __init__(self, root, state, libraries: config_cache.Libraries,
+                 config_dir="config", poll_ms: int = 1000):
+        self.root = root
+        self.state = state
+        self.libraries = libraries
+        self.config_dir = Path(config_dir)
+        self.poll_ms = poll_ms
+
+        self._seen = config_cache.source_stats(config_dir)
+        self.root.after(self.poll_ms, self._tick)
+
+    def _tick(self):
+        try:
+            self.check()
+        finally:
+            self.root.after(self.poll_ms, self._tick)
+
+    def check(self) -> Dict[str, FrozenSet[str]]:
+        """Reload changed libraries now; returns {library: changed fields}."""
+        changes = {}
+        for name, stat in config_cache.source_stats(self.config_dir).items():
+            if stat is None or stat == self._seen[name]:
+                continue                # missing: keep the live library
+            try:
+                fields = config_cache.reload_library(self.libraries, name, self.config_dir)
+            except (ValueError, KeyError, TypeError, csv.Error, OSError) as exc:
+                print(f"[reload] {config_cache.SOURCES[name]}: {exc}")
+                continue
+            self._seen[name] = stat
+            if fields:
+                changes[name] = fields
+                self.state.events.publish("library_changed", name, fields)
+        return changes
@@ -14,6 +14,7 @@ from gui.windows.right_panel import RightPanel
 
 from gui.menus.file_menu import FileMenu
 from gui.menus.edit_menu import EditMenu
+from gui.menus.view_menu import ViewMenu
 
 from gui.input.shortcuts import bind_shortcuts
 
@@ -38,6 +39,8 @@ class MainWindow:
         # Menus
         FileMenu(root, state)
         EditMenu(root, state)
+        ViewMenu(root, state, self.center_view.grid_widget,
+                 risk_overlay=self.center_controller.risk_overlay)
 
         # Shortcuts
         bind_shortcuts(root, state)
@@ -1,15 +1,17 @@
 # file: gui/menus/file_menu.py
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import json
 
 from gui.app_state import AppState
-from core.grid import HexGrid
+from core import chunk_store, json_stream, map_format
+from core.map_journal import write_map
+from simulation import session
 
 
 class FileMenu:
     """
-    Owns the File menu (Save Map / Load Map).
+    Owns the File menu (Save Map / Save Map (Binary) / Load Map /
+    Save Session / Resume Session).
     Ensures a menubar exists so EditMenu can attach to it.
     """
 
@@ -30,7 +32,13 @@ class FileMenu:
         self.menubar.add_cascade(label="File", menu=self.filemenu)
 
         self.filemenu.add_command(label="Save Map", command=self.save_map)
+        self.filemenu.add_command(label="Save Map (Binary)", command=self.save_map_binary)
         self.filemenu.add_command(label="Load Map", command=self.load_map)
+        self.filemenu.add_separator()
+        self.filemenu.add_command(label="Save Session", command=self.save_session)
+        self.filemenu.add_command(label="Resume Session", command=self.resume_session)
+
+        state.events.subscribe("save_finished", self._on_save_finished)
 
     # ---------------------------------------------------------
     # Actions
@@ -43,23 +51,104 @@ class FileMenu:
         if not path:
             return
 
-        with open(path, "w") as f:
-            json.dump(self.state.grid.to_dict(), f, indent=2)
+        self._save(path, binary=False)
+
+    def save_map_binary(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=map_format.SUFFIX,
+            filetypes=[("Hex map", "*" + map_format.SUFFIX)]
+        )
+        if not path:
+            return
+
+        self._save(path, binary=True)
+
+    def _save(self, path, binary: bool):
+        chunked = hasattr(self.state.grid.tiles, "hold_writes")
+        if chunked and binary:
+            # chunked maps are already saved in place; the export streams
+            # the store chunk by chunk, which only the JSON writer can do
+            messagebox.showwarning("Save", "A chunked map can only be exported as JSON.")
+            return
+
+        saver = getattr(self.state, "saver", None)
+        if saver is not None:
+            # written from a snapshot (chunked: the held store) on a worker;
+            # reported via save_finished
+            if not saver.save(path, binary):
+                messagebox.showwarning("Save", "A save is already in progress.")
+            return
+
+        autosave = getattr(self.state, "autosave", None)
+        if chunked:
+            self.state.grid.tiles.flush()
+            write_map(self.state.grid, path, binary=False)
+        elif autosave is not None:
+            # full save + fresh journal for incremental autosaves
+            autosave.save_full(path, binary)
+        else:
+            write_map(self.state.grid, path, binary=binary)
 
         messagebox.showinfo("Saved", "Map saved.")
 
+    def _exporting_chunks(self, title) -> bool:
+        """True (and says so) while a chunked map is being exported."""
+        saver = getattr(self.state, "saver", None)
+        if saver is None or not saver.busy or not hasattr(self.state.grid.tiles, "hold_writes"):
+            return False
+        # the export is still reading the store; closing it would write back
+        messagebox.showwarning(title, "Wait for the map export to finish.")
+        return True
+
+    def _on_save_finished(self, path, error):
+        if error is not None:
+            messagebox.showerror("Save failed", f"Could not save {path}:\n{error}")
+        else:
+            messagebox.showinfo("Saved", "Map saved.")
+
     def load_map(self):
         path = filedialog.askopenfilename(
-            filetypes=[("JSON", "*.json")]
+            filetypes=[("Maps", "*.json *" + map_format.SUFFIX + " *" + chunk_store.SUFFIX),
+                       ("JSON", "*.json"),
+                       ("Hex map", "*" + map_format.SUFFIX),
+                       ("Chunked map", "*" + chunk_store.SUFFIX)]
         )
         if not path:
             return
 
-        with open(path) as f:
-            data = json.load(f)
-
-        new_grid = HexGrid.from_dict(data)
+        # the old map may be a chunk store with edits not yet written back
+        # (possibly the very file being opened)
+        old_tiles = self.state.grid.tiles
+        flush = getattr(old_tiles, "flush", None)
+        if flush is not None:
+            if self._exporting_chunks("Load"):
+                return
+            flush()
+
+        recovered = 0
+        autosave = getattr(self.state, "autosave", None)
+        try:
+            if chunk_store.is_chunk_store(path):
+                # loaded chunk by chunk as it is viewed; edits go back to the file
+                new_grid = chunk_store.open_grid(path)
+                if autosave is not None:
+                    autosave.detach()
+            elif autosave is not None:
+                # replays edits journalled after the last full save
+                new_grid, recovered = autosave.open(path)
+            elif map_format.is_binary_map(path):
+                new_grid = map_format.load(path)
+            else:
+                new_grid = json_stream.load_grid(path)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Load failed", f"Could not load {path}:\n{exc}")
+            return
         new_grid.biome_lib = self.state.biome_lib
+        new_grid.trail_lib = self.state.grid.trail_lib
+
+        close = getattr(old_tiles, "close", None)
+        if close is not None:
+            close()
 
         # Swap into state + engine
         self.state.grid = new_grid
@@ -72,4 +161,66 @@ class FileMenu:
         self.state.events.publish("map_loaded")
         self.state.events.publish("grid_changed")
 
-        messagebox.showinfo("Loaded", "Map loaded.")
\ No newline at end of file
+        if recovered:
+            messagebox.showinfo("Loaded", f"Map loaded; recovered unsaved edits from {recovered} autosave(s).")
+        else:
+            messagebox.showinfo("Loaded", "Map loaded.")
+
+    # ---------------------------------------------------------
+    # Sessions (map + party + world time + dice in one file)
+    # ---------------------------------------------------------
+    def save_session(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=session.SUFFIX,
+            filetypes=[("Session", "*" + session.SUFFIX)]
+        )
+        if not path:
+            return
+
+        state = self.state
+        session.save_session(path, state.engine, state.travel_mode_var.get())
+        messagebox.showinfo("Saved", "Session saved.")
+
+    def resume_session(self):
+        path = filedialog.askopenfilename(
+            filetypes=[("Session", "*" + session.SUFFIX)]
+        )
+        if not path:
+            return
+
+        state = self.state
+        if self._exporting_chunks("Resume Session"):
+            return
+        try:
+            try:
+                loaded = session.resume(path, state.engine)
+            except session.LibraryMismatch as exc:
+                if not messagebox.askyesno(
+                    "Resume Session",
+                    f"The {', '.join(exc.names)} definitions changed since this "
+                    "session was saved. Resume anyway?"
+                ):
+                    return
+                loaded = session.resume(path, state.engine, strict=False)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Resume failed", f"Could not resume {path}:\n{exc}")
+            return
+
+        close = getattr(state.grid.tiles, "close", None)
+        if close is not None:
+            close()
+        autosave = getattr(state, "autosave", None)
+        if autosave is not None:
+            autosave.detach()
+
+        state.grid = state.engine.grid
+        state.party = state.engine.party
+        state.travel_mode_var.set(loaded.travel_mode)
+        state.undo.clear()
+
+        state.events.publish("map_loaded")
+        state.events.publish("grid_changed")
+        state.events.publish("time_changed")
+        state.events.publish("party_moved", state.party.position)
+
+        messagebox.showinfo("Loaded", f"Session resumed at day {loaded.time_days:.2f}.")
@@ -0,0 +1,48 @@
+# file: gui/menus/view_menu.py
+import tkinter as tk
+from gui.app_state import AppState
+
+
+class ViewMenu:
+    """
+    View menu: toggles for optional map overlays.
+    Each entry flips a render layer's `enabled` flag and redraws.
+    """
+
+    def __init__(self, root: tk.Tk, state: AppState, grid_widget, risk_overlay=None):
+        self.root = root
+        self.state = state
+        self.grid_widget = grid_widget
+
+        # Attach or create menubar (FileMenu usually created it already)
+        menubar = root.nametowidget(root.cget("menu")) if root.cget("menu") else None
+        if menubar is None:
+            menubar = tk.Menu(root)
+            root.config(menu=menubar)
+
+        self.menubar = menubar
+
+        # Build View menu
+        self.viewmenu = tk.Menu(self.menubar, tearoff=False)
+        self.menubar.add_cascade(label="View", menu=self.viewmenu)
+
+        self.layer_vars = {}
+        self.add_layer_toggle("Fog of War", grid_widget.fog_layer)
+        self.add_layer_toggle("Heightmap", grid_widget.heightmap_layer)
+        if risk_overlay is not None:
+            self.add_layer_toggle("Risk Heatmap", grid_widget.risk_layer,
+                                  on_toggle=risk_overlay.set_enabled)
+
+    def add_layer_toggle(self, label: str, layer, on_toggle=None):
+        """on_toggle(enabled), if given, replaces the default flip + redraw."""
+        var = tk.BooleanVar(value=layer.enabled)
+        self.layer_vars[label] = var
+
+        def toggle():
+            if on_toggle is not None:
+                on_toggle(var.get())
+                return
+            layer.enabled = var.get()
+            self.grid_widget.redraw()
+
+        self.viewmenu.add_checkbutton(label=label, variable=var, command=toggle)
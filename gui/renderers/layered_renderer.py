@@ -8,8 +8,16 @@ class LayeredRenderer:
     """
     Owns multiple rendering layers and draws them in order.
     Each layer draws only its own elements and does not clear the canvas.
+
+    draw() paints everything at once; draw_steps() is the same as a
+    generator for the TaskRunner, so a huge map is painted over several
+    slices without blocking input. The old picture stays up (tagged
+    STALE, under the new items) until the sliced repaint has finished;
+    a superseded repaint's partial items are swept up the same way.
     """
 
+    STALE = "stale"
+
     def __init__(self, canvas, layers: List[BaseRenderLayer]):
         self.canvas = canvas
         self.layers = layers
@@ -21,4 +29,11 @@ class LayeredRenderer:
         # Draw in layer order
         for layer in self.layers:
             if layer.enabled:
-                layer.draw(grid, party_positions)
\ No newline at end of file
+                layer.draw(grid, party_positions)
+
+    def draw_steps(self, grid: HexGrid, party_positions):
+        self.canvas.addtag_all(self.STALE)
+        for layer in self.layers:
+            if layer.enabled:
+                yield from layer.draw_steps(grid, party_positions)
+        self.canvas.delete(self.STALE)
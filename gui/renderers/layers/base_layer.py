@@ -6,6 +6,9 @@ import tkinter as tk
 
 Coord = Tuple[int, int]
 
+# hexes drawn between yields in draw_steps()
+STEP_HEXES = 64
+
 
 class BaseRenderLayer:
     """
@@ -18,9 +21,25 @@ class BaseRenderLayer:
         self.hex_math = hex_math
         self.enabled = True
 
+    def visible_tiles(self, grid: HexGrid):
+        """(coord, tile) for the hexes on screen; chunked maps load only those."""
+        visible_bounds = getattr(self.canvas, "visible_bounds", None)
+        if visible_bounds is None:
+            return grid.tiles.items()
+        return grid.region(*visible_bounds())
+
     def draw(self, grid: HexGrid, party_positions: List[Coord]):
         """
         Override in subclasses. Should not delete the canvas.
         Should only draw its own elements.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def draw_steps(self, grid: HexGrid, party_positions: List[Coord]):
+        """
+        Generator form of draw() for sliced redraws (gui.task_runner).
+        Layers that loop over every hex override this and yield every
+        STEP_HEXES hexes; the default draws everything in one step.
+        """
+        self.draw(grid, party_positions)
+        yield
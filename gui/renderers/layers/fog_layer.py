@@ -0,0 +1,74 @@
+# file: gui/renderers/layers/fog_layer.py
+import math
+from typing import Dict, Iterable, Optional, Tuple
+import tkinter as tk
+
+from gui.renderers.layers.base_layer import BaseRenderLayer
+from core.visibility import EXPLORED, UNEXPLORED, VISIBLE
+
+Coord = Tuple[int, int]
+
+
+class FogLayer(BaseRenderLayer):
+    """
+    Fog of war over the tile layers.
+      - unexplored hexes: dark, mostly opaque
+      - explored but out of sight: light stipple
+      - visible: no fog (item hidden)
+
+    draw() creates one item per hex and remembers it, so that
+    update_cells() can restyle only the hexes whose visibility changed
+    without a full redraw.
+    """
+
+    STYLES = {
+        UNEXPLORED: {"fill": "#1e1e1e", "stipple": "gray75", "state": "normal"},
+        EXPLORED: {"fill": "#1e1e1e", "stipple": "gray25", "state": "normal"},
+        VISIBLE: {"state": "hidden"},
+    }
+
+    def __init__(self, canvas: tk.Canvas, hex_math, visibility=None, party_key="party"):
+        super().__init__(canvas, hex_math)
+        self.visibility = visibility
+        self.party_key = party_key
+        self._items: Dict[Coord, int] = {}
+
+    def draw(self, grid, _party_positions):
+        self._items.clear()
+        if not self.enabled or self.visibility is None:
+            return
+
+        s = self.hex_math.s
+        state_of = self.visibility.state
+        key = self.party_key
+
+        for (q, r), _ in self.visible_tiles(grid):
+            cx, cy = self.hex_math.axial_to_pixel(q, r)
+
+            pts = []
+            for i in range(6):
+                angle = math.radians(60 * i)
+                pts.append(cx + s * math.cos(angle))
+                pts.append(cy + s * math.sin(angle))
+
+            style = self.STYLES[state_of((q, r), key)]
+            self._items[(q, r)] = self.canvas.create_polygon(
+                pts,
+                fill=style.get("fill", ""),
+                stipple=style.get("stipple", ""),
+                state=style["state"],
+                outline="",
+                tags=("fog",),
+            )
+
+    def update_cells(self, coords: Iterable[Coord]):
+        """Restyle existing fog items for `coords` only."""
+        if not self.enabled or self.visibility is None:
+            return
+
+        state_of = self.visibility.state
+        key = self.party_key
+        for coord in coords:
+            item: Optional[int] = self._items.get(coord)
+            if item is not None:
+                self.canvas.itemconfig(item, **self.STYLES[state_of(coord, key)])
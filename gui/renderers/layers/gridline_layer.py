@@ -1,17 +1,24 @@
 # file: gui/renderers/layers/gridline_layer.py
 import math
-from gui.renderers.layers.base_layer import BaseRenderLayer
+from gui.renderers.layers.base_layer import STEP_HEXES, BaseRenderLayer
 
 
 class GridlineLayer(BaseRenderLayer):
 
-    def draw(self, grid, _party):
+    def draw(self, grid, party_positions):
+        for _ in self.draw_steps(grid, party_positions):
+            pass
+
+    def draw_steps(self, grid, _party_positions):
         if not self.enabled:
             return
 
         s = self.hex_math.s
 
-        for (q, r) in grid.tiles:
+        for n, ((q, r), _) in enumerate(self.visible_tiles(grid), 1):
+            if n % STEP_HEXES == 0:
+                yield
+
             cx, cy = self.hex_math.axial_to_pixel(q, r)
 
             pts = []
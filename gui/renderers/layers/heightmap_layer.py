@@ -0,0 +1,40 @@
+# file: gui/renderers/layers/heightmap_layer.py
+import math
+import tkinter as tk
+
+from gui.renderers.layers.base_layer import BaseRenderLayer
+
+
+class HeightmapLayer(BaseRenderLayer):
+    """
+    Grey-scale elevation overlay (dark = low, light = high), stippled so
+    biome colors stay readable underneath. Reads normalised heights
+    from a SlopeField; disabled by default (toggle from the View menu).
+    """
+
+    def __init__(self, canvas: tk.Canvas, hex_math, slope_field=None):
+        super().__init__(canvas, hex_math)
+        self.slope_field = slope_field
+        self.enabled = False
+
+    def draw(self, grid, _party_positions):
+        if not self.enabled or self.slope_field is None:
+            return
+
+        s = self.hex_math.s
+
+        for (q, r), h in self.slope_field.heights():
+            cx, cy = self.hex_math.axial_to_pixel(q, r)
+
+            level = int(40 + 200 * h)
+            fill = f"#{level:02x}{level:02x}{level:02x}"
+
+            pts = []
+            for i in range(6):
+                angle = math.radians(60 * i)
+                pts.append(cx + s * math.cos(angle))
+                pts.append(cy + s * math.sin(angle))
+
+            self.canvas.create_polygon(
+                pts, fill=fill, stipple="gray50", outline="", tags=("heightmap",)
+            )
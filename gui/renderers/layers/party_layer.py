@@ -5,6 +5,17 @@ import tkinter as tk
 
 
 class PartyLayer(BaseRenderLayer):
+    """Party markers, tagged "party" so a move can redraw just them."""
+
+    TAG = "party"
+
+    def redraw(self, grid, party_positions: List[Tuple[int, int]], below=None):
+        """Replace only the markers; `below` is a tag to keep them under."""
+        self.canvas.delete(self.TAG)
+        self.draw(grid, party_positions)
+        self.canvas.tag_raise(self.TAG)
+        if below is not None:
+            self.canvas.tag_raise(below)
 
     def draw(self, grid, party_positions: List[Tuple[int, int]]):
         if not self.enabled:
@@ -18,5 +29,5 @@ class PartyLayer(BaseRenderLayer):
             self.canvas.create_oval(
                 cx - r0, cy - r0,
                 cx + r0, cy + r0,
-                fill="red", outline="black", width=2
+                fill="red", outline="black", width=2, tags=(self.TAG,)
             )
\ No newline at end of file
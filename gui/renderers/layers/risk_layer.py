@@ -0,0 +1,71 @@
+# file: gui/renderers/layers/risk_layer.py
+import math
+from typing import Dict, Tuple
+import tkinter as tk
+
+from gui.renderers.layers.base_layer import BaseRenderLayer
+
+Coord = Tuple[int, int]
+
+
+def risk_color(risk: float) -> str:
+    """Yellow (safe) to red (dangerous)."""
+    risk = min(max(risk, 0.0), 1.0)
+    green = int(220 * (1.0 - risk))
+    return f"#ff{green:02x}00"
+
+
+class RiskLayer(BaseRenderLayer):
+    """
+    Monte Carlo risk overlay (see simulation.risk). Hexes no sampled
+    journey crossed stay clear. Disabled by default.
+
+    Like FogLayer, draw() keeps one item per hex so set_estimate() can
+    restyle in place while the estimate is still being refined.
+    """
+
+    def __init__(self, canvas: tk.Canvas, hex_math):
+        super().__init__(canvas, hex_math)
+        self.enabled = False
+        self.estimate: Dict[Coord, float] = {}
+        self._items: Dict[Coord, int] = {}
+
+    def draw(self, grid, _party_positions):
+        self._items.clear()
+        if not self.enabled:
+            return
+
+        s = self.hex_math.s
+        estimate = self.estimate
+
+        for (q, r), _ in self.visible_tiles(grid):
+            cx, cy = self.hex_math.axial_to_pixel(q, r)
+
+            pts = []
+            for i in range(6):
+                angle = math.radians(60 * i)
+                pts.append(cx + s * math.cos(angle))
+                pts.append(cy + s * math.sin(angle))
+
+            risk = estimate.get((q, r))
+            self._items[(q, r)] = self.canvas.create_polygon(
+                pts,
+                fill=risk_color(risk or 0.0),
+                stipple="gray50",
+                state="hidden" if risk is None else "normal",
+                outline="",
+                tags=("risk",),
+            )
+
+    def set_estimate(self, estimate: Dict[Coord, float]):
+        """Swap in a newer estimate and restyle the existing items."""
+        self.estimate = estimate
+        if not self.enabled:
+            return
+
+        for coord, item in self._items.items():
+            risk = estimate.get(coord)
+            if risk is None:
+                self.canvas.itemconfig(item, state="hidden")
+            else:
+                self.canvas.itemconfig(item, state="normal", fill=risk_color(risk))
@@ -15,6 +15,8 @@ class SelectionLayer(BaseRenderLayer):
       - selected hex (cyan)
     """
 
+    TAG = "selection"
+
     def __init__(self, canvas: tk.Canvas, hex_math, outline_width=3):
         super().__init__(canvas, hex_math)
         self.hovered: Optional[Coord] = None
@@ -60,5 +62,6 @@ class SelectionLayer(BaseRenderLayer):
             pts,
             fill="",
             outline=color,
-            width=width
+            width=width,
+            tags=(self.TAG,)
         )
\ No newline at end of file
@@ -1,7 +1,7 @@
 # file: gui/renderers/layers/tile_layer.py
 import math
 import tkinter as tk
-from gui.renderers.layers.base_layer import BaseRenderLayer
+from gui.renderers.layers.base_layer import STEP_HEXES, BaseRenderLayer
 from core.grid import HexGrid
 
 
@@ -19,14 +19,21 @@ class TileLayer(BaseRenderLayer):
         super().__init__(canvas, hex_math)
         self.biome_colors = biome_colors or {}
 
-    def draw(self, grid: HexGrid, _party_positions):
+    def draw(self, grid: HexGrid, party_positions):
+        for _ in self.draw_steps(grid, party_positions):
+            pass
+
+    def draw_steps(self, grid: HexGrid, _party_positions):
         if not self.enabled:
             return
 
         s = self.hex_math.s
         biome_lib = grid.biome_lib
 
-        for (q, r), tile in grid.tiles.items():
+        for n, ((q, r), tile) in enumerate(self.visible_tiles(grid), 1):
+            if n % STEP_HEXES == 0:
+                yield
+
             cx, cy = self.hex_math.axial_to_pixel(q, r)
 
             # -----------------------------------------------------
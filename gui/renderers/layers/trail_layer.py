@@ -1,18 +1,25 @@
 # file: gui/renderers/layers/trail_layer.py
-from gui.renderers.layers.base_layer import BaseRenderLayer
+from gui.renderers.layers.base_layer import STEP_HEXES, BaseRenderLayer
 from core.movement import AXIAL_DIRECTIONS
 import tkinter as tk
 
 
 class TrailLayer(BaseRenderLayer):
-    def draw(self, grid, _party):
+    def draw(self, grid, party_positions):
+        for _ in self.draw_steps(grid, party_positions):
+            pass
+
+    def draw_steps(self, grid, _party_positions):
         if not self.enabled:
             return
 
         trail_lib = grid.trail_lib
         s = self.hex_math.s
 
-        for (q, r), tile in grid.tiles.items():
+        for n, ((q, r), tile) in enumerate(self.visible_tiles(grid), 1):
+            if n % STEP_HEXES == 0:
+                yield
+
             cx, cy = self.hex_math.axial_to_pixel(q, r)
 
             for dir_index, trail_id in enumerate(tile.trails):
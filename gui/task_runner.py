@@ -0,0 +1,225 @@
+# file: gui/task_runner.py
+import heapq
+import itertools
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional
+
+from core.event_bus import EventBus
+
+
+class Task:
+    """
+    A generator run a few steps at a time. Whatever it yields is a
+    progress hint (a float 0..1 is kept in `progress`); its return value
+    goes to on_done.
+    """
+
+    def __init__(self, task_id: int, gen: Generator, name: str, priority: int,
+                 key: Optional[str], on_done: Optional[Callable[[Any], None]]):
+        self.id = task_id
+        self.gen = gen
+        self.name = name
+        self.priority = priority
+        self.key = key
+        self.on_done = on_done
+
+        self.progress = 0.0
+        self.steps = 0
+        self.run_ms = 0.0
+        self.done = False
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+@dataclass
+class TaskStats:
+    budget_ms: float
+    slices: int = 0
+    steps: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    overruns: int = 0               # slices that went over budget
+    worst_slice_ms: float = 0.0
+    worst_step_ms: float = 0.0
+    worst_task: str = ""            # task whose step was worst_step_ms
+
+
+class TaskRunner:
+    """
+    Cooperative scheduler for main-thread work (canvas drawing, grid
+    mutation) that is too big for one event callback.
+
+      - a slice runs for at most `budget_ms`: it steps the highest
+        priority task, then the next, until the budget is spent
+      - tasks of equal priority take turns slice by slice
+      - the first slice is scheduled with after_idle, the following ones
+        `interval_ms` apart, so input events are handled in between
+      - spawning under a `key` cancels the running task with that key
+        (e.g. a redraw superseding an unfinished redraw)
+
+    A slice ends after the step that crosses the budget, so it normally
+    overshoots a little; one that overshoots by more than `slack_ms` (a
+    step too coarse to interleave with input) is counted as an overrun in
+    stats() and published as "frame_overrun"(task_name, slice_ms) when an
+    EventBus is given, naming the task with the slowest step.
+    """
+
+    def __init__(self, widget, events: Optional[EventBus] = None,
+                 budget_ms: float = 8.0, slack_ms: float = 4.0, interval_ms: int = 1):
+        self.widget = widget
+        self.events = events
+        self.budget_ms = budget_ms
+        self.slack_ms = slack_ms
+        self.interval_ms = interval_ms
+
+        self._ids = itertools.count(1)
+        self._heap: List = []               # (-priority, turn, task)
+        self._turns = itertools.count()
+        self._by_key: Dict[str, Task] = {}
+        self._after_id = None
+
+        self._stats = TaskStats(budget_ms=budget_ms)
+
+    # ---------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------
+    def spawn(self, gen: Generator, name: Optional[str] = None, priority: int = 0,
+              key: Optional[str] = None,
+              on_done: Optional[Callable[[Any], None]] = None) -> Task:
+        """Queue a generator; higher priority runs first."""
+        if key is not None:
+            self.cancel(key)
+
+        task = Task(next(self._ids), gen, name or key or getattr(gen, "__name__", "task"),
+                    priority, key, on_done)
+        if key is not None:
+            self._by_key[key] = task
+        heapq.heappush(self._heap, (-priority, next(self._turns), task))
+
+        if self._after_id is None:
+            self._after_id = self.widget.after_idle(self._slice)
+        return task
+
+    def cancel(self, key: str):
+        task = self._by_key.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self):
+        for _, _, task in self._heap:
+            task.cancel()
+        self._by_key.clear()
+
+    def run_now(self, key: str):
+        """Finish the task under `key` synchronously (e.g. before saving)."""
+        task = self._by_key.get(key)
+        if task is None or task.done or task.cancelled:
+            return
+        while not task.done:
+            self._step(task)
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for _, _, t in self._heap if not t.cancelled)
+
+    def stats(self) -> TaskStats:
+        return TaskStats(**vars(self._stats))
+
+    # ---------------------------------------------------------
+    # Scheduling (Tk thread only)
+    # ---------------------------------------------------------
+    def _slice(self):
+        self._after_id = None
+        heap = self._heap
+        s = self._stats
+        s.slices += 1
+
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0
+        slowest = None
+
+        while heap and time.perf_counter() < deadline:
+            _, _, task = heapq.heappop(heap)
+            if task.cancelled:
+                s.cancelled += 1
+                self._forget(task)
+                continue
+
+            while not (task.done or task.cancelled) and time.perf_counter() < deadline:
+                step_ms = self._step(task)
+                if step_ms > s.worst_step_ms:
+                    s.worst_step_ms = step_ms
+                    s.worst_task = task.name
+                if slowest is None or step_ms > slowest[1]:
+                    slowest = (task.name, step_ms)
+
+            if not task.done and not task.cancelled:
+                # back of its priority level: equal priorities take turns
+                heapq.heappush(heap, (-task.priority, next(self._turns), task))
+
+        slice_ms = (time.perf_counter() - start) * 1000.0
+        s.worst_slice_ms = max(s.worst_slice_ms, slice_ms)
+        if slice_ms > self.budget_ms + self.slack_ms:
+            s.overruns += 1
+            if self.events is not None and slowest is not None:
+                self.events.publish("frame_overrun", slowest[0], slice_ms)
+
+        if heap:
+            self._after_id = self.widget.after(self.interval_ms, self._slice)
+
+    def _step(self, task: Task) -> float:
+        """Advance one step; returns its duration in ms."""
+        t0 = time.perf_counter()
+        try:
+            value = next(task.gen)
+        except StopIteration as stop:
+            self._finish(task, stop.value)
+        except Exception as exc:
+            task.done = True
+            self._forget(task)
+            print(f"Task {task.name} failed:")
+            traceback.print_exception(exc)
+            if self.events is not None:
+                self.events.publish("task_failed", task.name, exc)
+        else:
+            if isinstance(value, float):
+                task.progress = value
+        step_ms = (time.perf_counter() - t0) * 1000.0
+        task.steps += 1
+        task.run_ms += step_ms
+        self._stats.steps += 1
+        return step_ms
+
+    def _finish(self, task: Task, result):
+        task.done = True
+        task.progress = 1.0
+        self._stats.completed += 1
+        self._forget(task)
+        if task.on_done is not None:
+            task.on_done(result)
+
+    def _forget(self, task: Task):
+        if task.key is not None and self._by_key.get(task.key) is task:
+            del self._by_key[task.key]
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def apply_in_steps(items: Iterable, fn: Callable[[Any], None],
+                   every: int = 256) -> Generator[float, None, int]:
+    """
+    Task body for bulk edits: fn(item) for each item, yielding progress
+    every `every` items. Returns the number of items applied.
+    """
+    items = list(items)
+    total = len(items) or 1
+    for n, item in enumerate(items, 1):
+        fn(item)
+        if n % every == 0:
+            yield n / total
+    return len(items)
@@ -2,7 +2,7 @@
 import tkinter as tk
 from tkinter import ttk
 
-from core.command import MovePartyCommand, SetTrailCommand
+from core.command import MovePartyCommand, SetTrailCommand, TravelCostCommand
 from core.movement import AXIAL_DIRECTIONS, add
 
 
@@ -24,7 +24,10 @@ class MovementPanel:
         # Travel mode variable from AppState (set in gui_main)
         self.mode_var = state.travel_mode_var
 
+        self.mode_box = None
         self.time_label = None
+        self.route_label = None
+        self.jobs_label = None
         self.status_frame = None
 
         self._build()
@@ -32,6 +35,11 @@ class MovementPanel:
         # Listen for updates when movement occurs
         state.events.subscribe("party_moved", self._refresh_time)
         state.events.subscribe("party_moved", self._refresh_status)
+        state.events.subscribe("time_changed", self._refresh_time)
+        state.events.subscribe("time_changed", self._refresh_status)
+        state.events.subscribe("route_preview", self._show_route)
+        state.events.subscribe("job_metrics", self._show_job_metrics)
+        state.events.subscribe("library_changed", self._refresh_modes)
 
     # ---------------------------------------------------------
     # UI layout
@@ -62,18 +70,24 @@ class MovementPanel:
         # Travel mode dropdown (CSV-driven)
         ttk.Label(self.parent, text="Travel Mode").pack(pady=5)
 
-        mode_box = ttk.Combobox(
+        self.mode_box = ttk.Combobox(
             self.parent,
             textvariable=self.mode_var,
             values=self.state.travel_modes.ids(),
             state="readonly",
         )
-        mode_box.pack(pady=4)
+        self.mode_box.pack(pady=4)
 
         # Time token / days display
         self.time_label = ttk.Label(self.parent, text="Time: 0.00 days")
         self.time_label.pack(pady=8)
 
+        # Hover route preview (computed in the background)
+        self.route_label = ttk.Label(self.parent, text="Route: -")
+        self.route_label.pack(pady=2)
+        self.jobs_label = ttk.Label(self.parent, text="", foreground="gray")
+        self.jobs_label.pack(pady=2)
+
         # Token + exhaustion display
         self.status_frame = ttk.Frame(self.parent)
         self.status_frame.pack(pady=8, fill="x")
@@ -107,7 +121,9 @@ class MovementPanel:
         dst, cost = result
 
         # Apply cost BEFORE movement (rules: cost is paid when deciding to travel)
+        before = engine.snapshot(include_rng=False, include_position=False)
         engine.apply_movement_cost(cost)
+        after = engine.snapshot(include_rng=False, include_position=False)
 
         # Build undoable transaction: move (+ optional trail placement)
         state.undo.begin()
@@ -129,12 +145,15 @@ class MovementPanel:
             )
             state.undo.add(trail_cmd)
 
-        # Commit transaction (both move + trail become one undo step)
+        # Token/time payment goes last so that undo restores it first,
+        # before party_moved refreshes the status panel
+        state.undo.add(TravelCostCommand(before, after))
+
+        # Commit transaction (move + trail + cost become one undo step)
         state.undo.commit(state)
 
-        # Notify rest of GUI
+        # Notify rest of GUI (a laid trail published its own grid_changed)
         state.events.publish("party_moved", dst)
-        state.events.publish("grid_changed")
 
         # Stealth check event: only when cautious (for now)
         if mode_id == "cautious":
@@ -153,6 +172,26 @@ class MovementPanel:
         days = self.state.engine.get_time()
         self.time_label.config(text=f"Time: {days:.2f} days")
 
+    def _refresh_modes(self, name, fields):
+        """Travel modes added/removed by a hot reload."""
+        if name == "travel_modes" and "id" in fields:
+            self.mode_box.config(values=self.state.travel_modes.ids())
+
+    def _show_route(self, goal, route):
+        if goal is None:
+            text = "Route: -"
+        elif route is None:
+            text = f"Route to {goal}: unreachable"
+        else:
+            text = f"Route to {goal}: {route.cost:g} tokens, {len(route.path) - 1} steps"
+        self.route_label.config(text=text)
+
+    def _show_job_metrics(self, stats):
+        self.jobs_label.config(
+            text=f"Jobs: {stats.pending} queued, {stats.last_latency_ms:.1f} ms "
+                 f"(avg {stats.mean_latency_ms:.1f}, max {stats.max_latency_ms:.1f})"
+        )
+
     def _refresh_status(self, *_):
         """Update token/exhaustion panel for each party member."""
         frame = self.status_frame
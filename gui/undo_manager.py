@@ -54,13 +54,12 @@ class UndoManager:
     # Core undo/redo
     # ---------------------------------------------------------
     def do(self, cmd, state):
+        # commands publish their own change events (a move repaints only
+        # the party; map edits publish grid_changed)
         cmd.do(state)
         self.past.append(cmd)
         self.future.clear()
 
-        if state:
-            state.events.publish("grid_changed")
-
     def undo(self, state):
         if not self.past:
             return
@@ -69,8 +68,6 @@ class UndoManager:
         cmd.undo(state)
         self.future.append(cmd)
 
-        state.events.publish("grid_changed")
-
     def redo(self, state):
         if not self.future:
             return
@@ -79,8 +76,6 @@ class UndoManager:
         cmd.do(state)
         self.past.append(cmd)
 
-        state.events.publish("grid_changed")
-
     def clear(self):
         self.past.clear()
         self.future.clear()
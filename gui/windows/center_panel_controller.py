@@ -1,5 +1,8 @@
 # file: gui/windows/center_panel_controller.py
 from gui.input.tool_dispatch import ToolDispatch
+from core.config_cache import affects_drawing
+from gui.windows.risk_overlay_controller import RiskOverlayController
+from gui.windows.route_preview_controller import RoutePreviewController
 
 
 class CenterPanelController:
@@ -42,14 +45,47 @@ class CenterPanelController:
         # Event subscriptions
         # ---------------------------------------------------------
         ev = state.events
-        ev.subscribe("grid_changed", lambda *_: gw.redraw())
+
+        # Heightmap overlay reads the engine's slope field
+        gw.heightmap_layer.slope_field = state.engine.slope_field
+
+        # Fog of war: restyle only the hexes whose visibility changed
+        gw.fog_layer.visibility = getattr(state, "visibility", None)
+        ev.subscribe("visibility_changed",
+                     lambda _key, changed: gw.fog_layer.update_cells(changed))
+
+        # Risk overlay: Monte Carlo estimate refined in the background
+        self.risk_overlay = RiskOverlayController(state, gw)
+
+        # Hover route preview: searched on the job service
+        self.route_preview = RoutePreviewController(state, gw)
+
+        # Map loads and bulk repaints run in time slices so big maps don't
+        # block input; single edits repaint at once (coalesced per burst)
+        gw.tasks = getattr(state, "tasks", None)
+
+        ev.subscribe("grid_changed", lambda *_: gw.redraw_soon())
         ev.subscribe("party_moved", lambda pos: gw.set_party_positions([pos]))
         ev.subscribe("map_loaded", lambda *_: self._on_map_loaded())
 
+        # Hot-reloaded colors / trail widths: repaint only
+        ev.subscribe("library_changed", self._on_library_changed)
+
+    def _on_library_changed(self, name, fields):
+        if affects_drawing(name, fields):
+            self.view.grid_widget.redraw_sliced()
+
     # ---------------------------------------------------------
     # Reload handler
     # ---------------------------------------------------------
     def _on_map_loaded(self):
         gw = self.view.grid_widget
         gw.grid = self.state.grid
-        gw._compute_canvas_size()
\ No newline at end of file
+
+        visibility = getattr(self.state, "visibility", None)
+        if visibility is not None:
+            visibility.reset(self.state.grid)
+            visibility.update_party("party", self.state.party.position)
+
+        gw._compute_canvas_size()
+        gw.redraw_sliced()
\ No newline at end of file
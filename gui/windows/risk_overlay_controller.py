@@ -0,0 +1,114 @@
+# file: gui/windows/risk_overlay_controller.py
+from core.config_cache import affects_simulation
+from simulation.risk import RiskJob, RiskModel
+
+
+class RiskOverlayController:
+    """
+    Drives the RiskLayer from a background RiskJob.
+
+      - the job restarts whenever the inputs change (party moved, map or
+        weather edited, travel mode switched, a library reloaded with
+        more than cosmetic changes); a burst of changes (a paint drag)
+        restarts it once, `restart_ms` after the last, and a superseded
+        job is cancelled between batches
+      - the Tk thread only copies the compiled tables; the RiskModel is
+        built on the job's thread
+      - the Tk loop polls the job every `refresh_ms` at most and restyles
+        the layer only when a newer estimate exists, so the overlay
+        refreshes at a capped rate however fast the sampler runs
+      - nothing runs while the overlay is switched off
+    """
+
+    def __init__(self, state, grid_widget, refresh_ms: int = 500,
+                 total_walks: int = 20000, restart_ms: int = 150):
+        self.state = state
+        self.grid_widget = grid_widget
+        self.layer = grid_widget.risk_layer
+        self.refresh_ms = refresh_ms
+        self.total_walks = total_walks
+        self.restart_ms = restart_ms
+
+        self.job = None
+        self._shown_version = -1
+        self._after_id = None
+        self._restart_id = None
+
+        ev = state.events
+        for name in ("party_moved", "tile_changed", "trail_changed",
+                     "map_loaded", "time_changed"):
+            ev.subscribe(name, lambda *_: self._schedule_restart())
+        ev.subscribe("library_changed", self._on_library_changed)
+
+        mode_var = getattr(state, "travel_mode_var", None)
+        if mode_var is not None:
+            mode_var.trace_add("write", lambda *_: self._schedule_restart())
+
+    # ---------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------
+    def set_enabled(self, enabled: bool):
+        self.layer.enabled = enabled
+        if enabled:
+            self.restart()
+        else:
+            self._stop()
+            self.layer.estimate = {}
+        self.grid_widget.redraw()
+
+    def restart(self):
+        """Discard the current estimate and sample the new situation."""
+        if not self.layer.enabled:
+            return
+        self._stop()
+
+        state = self.state
+        mode_var = getattr(state, "travel_mode_var", None)
+        mode_id = mode_var.get() if mode_var is not None else "normal"
+
+        inputs = RiskModel.capture(state.engine, mode_id)
+        self.job = RiskJob(lambda: RiskModel.from_inputs(*inputs), state.party.position,
+                           total_walks=self.total_walks).start()
+        self._shown_version = -1
+        self._schedule_poll()
+
+    def _on_library_changed(self, name, fields):
+        if affects_simulation(name, fields):
+            self._schedule_restart()
+
+    def _schedule_restart(self):
+        if self.layer.enabled and self._restart_id is None:
+            self._restart_id = self.grid_widget.after(self.restart_ms, self.restart)
+
+    # ---------------------------------------------------------
+    # Polling (Tk thread only)
+    # ---------------------------------------------------------
+    def _schedule_poll(self):
+        if self._after_id is None:
+            self._after_id = self.grid_widget.after(self.refresh_ms, self._poll)
+
+    def _poll(self):
+        self._after_id = None
+        job = self.job
+        if job is None:
+            return
+
+        done = job.done   # read before latest() so the final batch is seen
+        version, estimate = job.latest()
+        if version != self._shown_version:
+            self._shown_version = version
+            self.layer.set_estimate(estimate)
+
+        if not done:
+            self._schedule_poll()
+
+    def _stop(self):
+        if self._restart_id is not None:
+            self.grid_widget.after_cancel(self._restart_id)
+            self._restart_id = None
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        if self._after_id is not None:
+            self.grid_widget.after_cancel(self._after_id)
+            self._after_id = None
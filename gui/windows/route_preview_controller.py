@@ -0,0 +1,102 @@
+# file: gui/windows/route_preview_controller.py
+from core.config_cache import affects_simulation
+from simulation.routes import RouteSnapshot
+
+
+class RoutePreviewController:
+    """
+    Cheapest route from the party to the hovered hex, searched on the
+    job service.
+
+      - hovers and edits are collapsed: a search starts `delay_ms` after
+        the last of them, under the "route_preview" key, so a newer one
+        supersedes the search still in flight
+      - the cost snapshot is reused until the map, weather, travel mode or
+        a cost-relevant library entry changes; an edit only drops it, and
+        the next search rebuilds it on the worker from cheap copies of
+        the compiled tables
+      - the answer arrives on the Tk thread as "route_preview"(goal, route)
+        (route None if unreachable)
+    """
+
+    KEY = "route_preview"
+
+    def __init__(self, state, grid_widget, delay_ms: int = 60):
+        self.state = state
+        self.grid_widget = grid_widget
+        self.delay_ms = delay_ms
+        self._snapshot = None
+        self._version = 0               # bumped whenever the snapshot goes stale
+        self._hovered = None
+        self._after_id = None
+
+        grid_widget.bind("<Motion>", self._on_motion, add="+")
+        grid_widget.bind("<Leave>", self._on_leave, add="+")
+
+        ev = state.events
+        for name in ("tile_changed", "trail_changed", "map_loaded", "time_changed"):
+            ev.subscribe(name, lambda *_: self._invalidate())
+        ev.subscribe("library_changed", self._on_library_changed)
+        ev.subscribe("party_moved", lambda *_: self._schedule())
+
+        mode_var = getattr(state, "travel_mode_var", None)
+        if mode_var is not None:
+            mode_var.trace_add("write", lambda *_: self._invalidate())
+
+    def _on_motion(self, event):
+        coord = self.grid_widget.pixel_to_hex(event.x, event.y)
+        if coord not in self.state.grid.tiles:
+            coord = None
+        if coord != self._hovered:
+            self._hovered = coord
+            self._schedule()
+
+    def _on_leave(self, _event):
+        self._hovered = None
+        self._refresh()
+
+    def _on_library_changed(self, name, fields):
+        if affects_simulation(name, fields):
+            self._invalidate()
+
+    def _invalidate(self):
+        self._snapshot = None
+        self._version += 1
+        self._schedule()
+
+    def _schedule(self):
+        if self._after_id is None:
+            self._after_id = self.grid_widget.after(self.delay_ms, self._refresh)
+
+    def _refresh(self):
+        if self._after_id is not None:
+            self.grid_widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        jobs = getattr(self.state, "jobs", None)
+        if jobs is None:
+            return
+        goal = self._hovered
+        if goal is None:
+            jobs.cancel(self.KEY)
+            self.state.events.publish(self.KEY, None, None)
+            return
+
+        snapshot, inputs = self._snapshot, None
+        if snapshot is None:
+            mode_var = getattr(self.state, "travel_mode_var", None)
+            mode_id = mode_var.get() if mode_var is not None else "normal"
+            inputs = RouteSnapshot.capture(self.state.engine, mode_id)
+        start, version = self.state.party.position, self._version
+
+        def search():
+            built = snapshot or RouteSnapshot.from_inputs(*inputs)
+            return built, goal, built.cheapest(start, goal)
+
+        jobs.submit(search, key=self.KEY,
+                    on_done=lambda result: self._on_found(version, *result))
+
+    def _on_found(self, version, snapshot, goal, route):
+        if version == self._version:
+            self._snapshot = snapshot
+        self.state.events.publish(self.KEY, goal, route)
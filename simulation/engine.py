@@ -1,20 +1,69 @@
 # file: simulation/engine.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import random
+from typing import (
+    Callable, Generator, Iterable, Iterator, List, NamedTuple, Optional, Sequence,
+    Tuple, Union,
+)
 
+from core.cost_model import CostModel, PathCost
+from core.cost_modifiers import ModifierLibrary
 from core.grid import HexGrid
 from core.party import Party
-from core.movement import AXIAL_DIRECTIONS, add
+from core.movement import AXIAL_DIRECTIONS, add, direction_between
+from core.slope import SlopeField
+from simulation.scheduler import (
+    Scheduler,
+    TICKS_PER_DAY,
+    days_to_ticks,
+    ticks_to_days,
+    tokens_to_ticks,
+)
+
+Coord = Tuple[int, int]
+
+# A journey route: explicit hex path, direction indices, or a policy
+# called as policy(engine) -> direction index (None = stop).
+Route = Union[Iterable[Coord], Iterable[int], Callable[["SimulationEngine"], Optional[int]]]
 
 
 @dataclass
-class Scheduler:
-    """Tracks world time in 'days'. 6 tokens == 1 daytime."""
-    time_days: float = 0.0
+class RestRules:
+    """When a travelling party makes camp, recovers, or gives up."""
+    rest_when_short: bool = True        # camp until dawn instead of overspending tokens
+    exhaustion_recovery: float = 1.0    # exhaustion removed at a dawn spent in camp
+    stop_exhaustion: float = 5.0        # stop once any member reaches this exhaustion
+
+
+class StepRecord(NamedTuple):
+    """One move of a streamed journey (see SimulationEngine.iter_steps)."""
+    index: int
+    day: float
+    src: Coord
+    position: Coord
+    direction: int
+    cost: int
+    mode_mod: float
+    biome_mod: float
+    trail_mod: float
+    slope: float
+    weather: float                       # cost added by active weather/season modifiers
+    tokens: Tuple[float, ...]            # per member, after paying
+    exhaustion: Tuple[float, ...]        # per member, after paying
+    stealth: Optional[Tuple[bool, int, int]]  # (success, roll, dc) or None
+
 
-    def advance(self, cost: float):
-        # 6 tokens = 1 day
-        self.time_days += (cost / 6.0)
+@dataclass
+class JourneyResult:
+    steps: int
+    days: float
+    position: Coord
+    stop_reason: str                    # "route_end", "until", "exhausted", "blocked"
+    tokens_spent: float
+    camps: int
+    # trails a trailblazing mode wants laid (coord, direction, old, new),
+    # for the caller to apply, e.g. through SetTrailCommand
+    trails: List[Tuple[Coord, int, str, str]] = field(default_factory=list)
 
 
 class SimulationEngine:
@@ -27,49 +76,77 @@ class SimulationEngine:
       - Provide a stealth-check helper for cautious travel
     """
 
-    def __init__(self, grid: HexGrid, party: Party, travel_modes):
+    def __init__(self, grid: HexGrid, party: Party, travel_modes, seed=None):
         self.grid = grid
         self.party = party
         self.travel_modes = travel_modes
         self.scheduler = Scheduler()
 
-    # ---------------------------------------------------------
-    # Trail modifier helper
-    # ---------------------------------------------------------
-    def _get_trail_mod(self, src, direction_index: int) -> float:
-        tile = self.grid.get(src)
-        if not tile:
-            return 0.0
+        # Dice: one seeded stream per engine so journeys can be replayed
+        self.seed = seed
+        self.rng = random.Random(seed)
 
-        trail_id = tile.trails[direction_index]
-        if not trail_id or trail_id == "none":
-            return 0.0
+        # Optional simulation.journal.Journal recording engine events
+        self.journal = None
 
-        if not getattr(self.grid, "trail_lib", None):
-            return 0.0
+        # Per-edge slope penalties, built lazily from tile elevations
+        self.slope_field = SlopeField(grid)
 
-        try:
-            tt = self.grid.trail_lib.get(trail_id)
-            return tt.cost_mod
-        except KeyError:
-            return 0.0
+        # Compiled cost tables; weather / seasonal modifiers are
+        # recompiled only when the active modifier set changes
+        self.cost_model = CostModel(
+            grid, travel_modes, party=party,
+            slope_field=self.slope_field, modifiers=ModifierLibrary(),
+        )
+
+    @property
+    def modifiers(self) -> ModifierLibrary:
+        return self.cost_model.modifiers
+
+    @modifiers.setter
+    def modifiers(self, library: ModifierLibrary):
+        self.cost_model.modifiers = library
 
     # ---------------------------------------------------------
     # Core movement cost calculation
     # ---------------------------------------------------------
+    def _move_cost(self, src, dst, mode, direction_index: int):
+        """
+        Quiet cost calculation (delegates to the compiled CostModel).
+        Returns (cost, env, trail_mod, raw_cost, slope, weather).
+        """
+        model = self.cost_model
+        model.ensure(self.grid)
+        model.set_day(self.scheduler.time_days)
+        b = model.breakdown(src, direction_index, mode.id)
+        terms = b.terms
+        return (b.cost, terms.get("biome", 0.0), terms.get("trail", 0.0),
+                b.raw + b.weather, terms.get("slope", 0.0), b.weather)
+
+    def cost_of_path(self, path: Sequence[Coord], mode_id: str = "normal") -> PathCost:
+        """
+        Cost a whole path (list of adjacent hexes, start included) from
+        anywhere on the map, without moving the party or printing.
+        Raises ValueError naming the first bad step.
+        """
+        model = self.cost_model
+        model.ensure(self.grid)
+        model.set_day(self.scheduler.time_days)
+        return model.path_cost(path, mode_id)
+
+    def cost_of_paths(self, paths: Iterable[Sequence[Coord]],
+                      mode_id: str = "normal") -> List[PathCost]:
+        """cost_of_path for many candidate routes (weather etc. resolved once)."""
+        model = self.cost_model
+        model.ensure(self.grid)
+        model.set_day(self.scheduler.time_days)
+        return model.paths_cost(paths, mode_id)
+
     def calculate_move_cost(self, src, dst, mode_id: str, direction_index: int) -> int:
         mode = self.travel_modes.get(mode_id)
-
-        # biome difficulty
-        tile = self.grid.get(dst)
-        biome = self.grid.biome_lib.get(tile.biome_id)
-        env = getattr(biome, "move_difficulty", 0.0)
-
-        # trail modifier
-        trail_mod = self._get_trail_mod(src, direction_index)
-
-        raw_cost = 2 + mode.speed_mod + env + trail_mod
-        cost = max(int(round(raw_cost)), 1)
+        cost, env, trail_mod, raw_cost, slope, weather = self._move_cost(
+            src, dst, mode, direction_index
+        )
 
         # ---------------------------------------------
         # DEBUG PRINT (movement cost breakdown)
@@ -80,6 +157,8 @@ class SimulationEngine:
         print(f"  Mode speed_mod:   {mode.speed_mod}")
         print(f"  Biome difficulty: {env}")
         print(f"  Trail modifier:   {trail_mod}")
+        print(f"  Slope penalty:    {slope}")
+        print(f"  Weather/season:   {weather:+.2f}")
         print(f"  → Raw cost:       {raw_cost:.2f}")
         print(f"  → Final cost:     {cost}")
         print("-------------------------")
@@ -114,28 +193,309 @@ class SimulationEngine:
         Apply cost to the entire party and advance world time.
         If a member lacks tokens, overflow becomes exhaustion (handled by Party).
         """
+        self._record("cost", cost=cost)
         self.party.apply_movement_cost(cost)
         self.scheduler.advance(cost)
+        self._settle()
 
     # ---------------------------------------------------------
-    # Stealth check helper (for cautious / stealthy travel)
+    # State snapshots (undo, journal checkpoints)
     # ---------------------------------------------------------
-    def perform_stealth_check(self, biome, mode_id: str):
+    def snapshot(self, include_rng: bool = True, include_position: bool = True) -> dict:
         """
-        Simple stealth check: 1d20 vs (biome.stealth_dc + mode.stealth_dc_mod).
+        Party tokens/exhaustion and world time, plus (optionally) party
+        position and dice state. restore() only touches what is present.
+        """
+        party = self.party
+        members = party.members
+        snap = {
+            "tokens": [m.tokens for m in members],
+            "exhaustion": [m.exhaustion for m in members],
+            "ticks": self.scheduler.ticks,
+        }
+        if include_position:
+            snap["position"] = list(party.position)
+        if include_rng:
+            version, internal, gauss = self.rng.getstate()
+            snap["rng"] = [version, list(internal), gauss]
+        return snap
+
+    def restore(self, snap: dict):
+        """Inverse of snapshot(). Pending scheduler events are kept."""
+        self._record("restore", state=snap)
+        self._apply_snapshot(snap)
+        self._settle()
+
+    def _apply_snapshot(self, snap: dict):
+        party = self.party
+        if "position" in snap:
+            party.position = tuple(snap["position"])
+        for m, tokens, exhaustion in zip(party.members, snap["tokens"], snap["exhaustion"]):
+            m.tokens = tokens
+            m.exhaustion = exhaustion
+        self.scheduler.events.now = snap["ticks"]
+        if "rng" in snap:
+            version, internal, gauss = snap["rng"]
+            self.rng.setstate((version, tuple(internal), gauss))
+
+    def _record(self, kind: str, **fields):
+        if self.journal is not None:
+            self.journal.record(kind, fields)
+
+    def _settle(self):
+        if self.journal is not None:
+            self.journal.settle()
 
-        Returns:
-            (success: bool, roll: int, dc: int)
+    # ---------------------------------------------------------
+    # Fast-forward journeys (headless: no events, no undo commands)
+    # ---------------------------------------------------------
+    def iter_steps(
+        self,
+        route: Route,
+        mode_id: str = "normal",
+        until: Optional[float] = None,
+        rest: Optional[RestRules] = None,
+        stealth_modes: Tuple[str, ...] = ("cautious",),
+        trail_grid: Optional[HexGrid] = None,
+        terms: bool = True,
+    ) -> Generator[StepRecord, None, JourneyResult]:
+        """
+        Lazily walk the party along `route`, yielding one StepRecord per
+        move. Nothing is kept between steps, so a consumer can stream
+        records to disk for arbitrarily long runs.
+
+        The generator only advances when the consumer asks for the next
+        record (natural backpressure). Call .close() to cancel early;
+        the party keeps the state reached so far. The JourneyResult is
+        returned as the generator's StopIteration value.
+
+        Stops when the route ends, `until` days of world time have
+        passed, the next hex is off the map, or exhaustion reaches
+        rest.stop_exhaustion. Tokens refill at every dawn (6 tokens ==
+        1 day); with rest.rest_when_short the party camps until dawn
+        rather than spend tokens it does not have. Trailblazing modes lay
+        trails only on `trail_grid` (a grid the caller owns, e.g. a
+        headless sweep's); otherwise the shared map is left alone and the
+        trails are returned in JourneyResult.trails. Stealth is rolled on
+        arrival for modes listed in `stealth_modes`. With terms=False the
+        records carry only the cost (biome/trail/slope/weather are 0),
+        which skips the per-step cost breakdown.
         """
+        rest = rest or RestRules()
         mode = self.travel_modes.get(mode_id)
+        grid = self.grid
+        biome_lib = grid.biome_lib
+        party = self.party
+        pop = party.population
+        row = party.row
+        members = pop.member_range(row)
+        tokens, max_tokens, exhaustion = pop.tokens, pop.max_tokens, pop.exhaustion
+        events = self.scheduler.events
+        roll_stealth = mode_id in stealth_modes
+        model = self.cost_model
+        model.ensure(grid)
+        clock = self.scheduler
+
+        end_tick = None if until is None else days_to_ticks(until)
+        camped = [False]
+
+        def dawn():
+            recovery = rest.exhaustion_recovery if camped[0] else 0.0
+            self._record("recover", exhaustion_recovery=recovery)
+            pop.recover_tokens((row,), recovery)
+            camped[0] = False
+
+        next_dawn = (events.now // TICKS_PER_DAY + 1) * TICKS_PER_DAY
+        dawn_event = events.every(TICKS_PER_DAY, dawn, start=next_dawn)
+
+        directions = self._route_directions(route)
+        pending = None
+        steps = camps = 0
+        spent = 0.0
+        start_tick = events.now
+        stop_reason = "route_end"
+        trails: List[Tuple[Coord, int, str, str]] = []
+
+        try:
+            while True:
+                if end_tick is not None and events.now >= end_tick:
+                    stop_reason = "until"
+                    break
+                if max(exhaustion[i] for i in members) >= rest.stop_exhaustion:
+                    stop_reason = "exhausted"
+                    break
+
+                if pending is None:
+                    pending = next(directions, None)
+                    if pending is None:
+                        stop_reason = "route_end"
+                        break
+
+                src = party.position
+                dq, dr = AXIAL_DIRECTIONS[pending]
+                dst = (src[0] + dq, src[1] + dr)
+                if not grid.has(dst):
+                    stop_reason = "blocked"
+                    break
+
+                model.set_day(clock.time_days)
+                cost = model.cost(src, pending, mode_id)
+
+                if rest.rest_when_short and any(tokens[i] < cost for i in members) \
+                        and any(tokens[i] < max_tokens[i] for i in members):
+                    # make camp until dawn (or until the deadline)
+                    camped[0] = True
+                    camps += 1
+                    wake = (events.now // TICKS_PER_DAY + 1) * TICKS_PER_DAY
+                    if end_tick is not None:
+                        wake = min(wake, end_tick)
+                    self._record("camp", until=wake)
+                    events.run_until(wake)
+                    self._settle()
+                    continue
+
+                env = trail_mod = slope = weather = 0.0
+                if terms:
+                    b = model.breakdown(src, pending, mode_id)
+                    env, trail_mod = b.terms.get("biome", 0.0), b.terms.get("trail", 0.0)
+                    slope, weather = b.terms.get("slope", 0.0), b.weather
+
+                self._record("cost", cost=cost)
+                pop.apply_cost_rows((row,), cost)
+                events.advance(tokens_to_ticks(cost))
+                self._record("move", to=list(dst))
+                party.position = dst
+                if mode.trail_type:
+                    self._blaze(trail_grid, trails, src, pending, mode.trail_type)
+
+                stealth = None
+                if roll_stealth:
+                    biome = biome_lib.get(grid.get(dst).biome_id)
+                    stealth = self._stealth_roll(biome, mode)
+                    self._record("stealth", biome=biome.id, mode=mode_id,
+                                 success=stealth[0], roll=stealth[1], dc=stealth[2])
+
+                self._settle()
+
+                spent += cost
+                steps += 1
+                direction, pending = pending, None
+
+                yield StepRecord(
+                    index=steps,
+                    day=ticks_to_days(events.now),
+                    src=src,
+                    position=dst,
+                    direction=direction,
+                    cost=cost,
+                    mode_mod=mode.speed_mod,
+                    biome_mod=env,
+                    trail_mod=trail_mod,
+                    slope=slope,
+                    weather=weather,
+                    tokens=tuple(tokens[i] for i in members),
+                    exhaustion=tuple(exhaustion[i] for i in members),
+                    stealth=stealth,
+                )
+        finally:
+            dawn_event.cancel()
+
+        return JourneyResult(
+            steps=steps,
+            days=ticks_to_days(events.now - start_tick),
+            position=party.position,
+            stop_reason=stop_reason,
+            tokens_spent=spent,
+            camps=camps,
+            trails=trails,
+        )
+
+    def simulate_journey(
+        self,
+        route: Route,
+        mode_id: str = "normal",
+        until: Optional[float] = None,
+        rest: Optional[RestRules] = None,
+        trail_grid: Optional[HexGrid] = None,
+    ) -> JourneyResult:
+        """
+        Fast-forward a whole journey and return only its summary.
+        See iter_steps for the rules.
+        """
+        steps = self.iter_steps(route, mode_id, until, rest, stealth_modes=(),
+                                trail_grid=trail_grid, terms=False)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def _blaze(self, trail_grid, trails, coord, direction_index: int, value: str):
+        tile = (self.grid if trail_grid is None else trail_grid).get(coord)
+        if tile is None or tile.trails[direction_index] == value:
+            return
+        if trail_grid is None:
+            trails.append((coord, direction_index, tile.trails[direction_index], value))
+            return
+        if trail_grid is self.grid:
+            self._record("trail", at=list(coord), dir=direction_index,
+                         old=tile.trails[direction_index], value=value)
+            self.cost_model.invalidate_tile(coord)
+        trail_grid.set_trail(coord, direction_index, value)
+
+    def _route_directions(self, route: Route) -> Iterator[int]:
+        """Normalise a path, direction list or policy into direction indices."""
+        if callable(route):
+            while True:
+                direction = route(self)
+                if direction is None:
+                    return
+                yield direction
+
+        prev = self.party.position
+        for item in route:
+            if isinstance(item, int):
+                yield item
+                prev = add(prev, AXIAL_DIRECTIONS[item])
+                continue
+
+            coord = tuple(item)
+            if coord == prev:
+                continue  # paths may include the starting hex
+            direction = direction_between(prev, coord)
+            if direction is None:
+                raise ValueError(f"path step {prev} -> {coord} is not adjacent")
+            yield direction
+            prev = coord
 
+    # ---------------------------------------------------------
+    # Stealth check helper (for cautious / stealthy travel)
+    # ---------------------------------------------------------
+    def _stealth_roll(self, biome, mode):
+        """Quiet stealth roll. Returns (success, roll, dc)."""
         base_dc = getattr(biome, "stealth_dc", 12.0)
         dc = base_dc + getattr(mode, "stealth_dc_mod", 0.0)
         dc_int = int(round(dc))
 
-        roll = random.randint(1, 20)
+        roll = self.rng.randint(1, 20)
 
         success = roll >= dc_int
+        return success, roll, dc_int
+
+    def perform_stealth_check(self, biome, mode_id: str):
+        """
+        Simple stealth check: 1d20 vs (biome.stealth_dc + mode.stealth_dc_mod).
+
+        Returns:
+            (success: bool, roll: int, dc: int)
+        """
+        mode = self.travel_modes.get(mode_id)
+
+        success, roll, dc_int = self._stealth_roll(biome, mode)
+        self._record("stealth", biome=biome.id, mode=mode_id,
+                     success=success, roll=roll, dc=dc_int)
+        self._settle()
+        base_dc = getattr(biome, "stealth_dc", 12.0)
 
         print("==== STEALTH CHECK DEBUG ====")
         print(f"Mode: {mode_id}")
@@ -149,9 +509,26 @@ class SimulationEngine:
 
         return success, roll, dc_int
 
+    # ---------------------------------------------------------
+    # Cost cache invalidation (map edits made outside the engine)
+    # ---------------------------------------------------------
+    def invalidate_costs(self, coord: Optional[Coord] = None):
+        """Recompile edge costs around `coord`, or all of them."""
+        if coord is None:
+            self.cost_model.invalidate()
+        else:
+            self.cost_model.invalidate_tile(coord)
+
+    def attach(self, events):
+        events.subscribe("tile_changed", self.invalidate_costs)
+        events.subscribe("trail_changed", lambda coord, _d: self.invalidate_costs(coord))
+        events.subscribe("map_loaded", lambda *_: self.invalidate_costs())
+        events.subscribe("library_changed",
+                         lambda name, fields: self.cost_model.library_changed(name, fields))
+
     # convenience
     def get_time(self):
         return self.scheduler.time_days
 
     def reset_time(self):
-        self.scheduler.time_days = 0.0
\ No newline at end of file
+        self.scheduler.reset()
\ No newline at end of file
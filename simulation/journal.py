@@ -0,0 +1,324 @@
+# file: simulation/journal.py
+"""
+Append-only journal of engine events with periodic state checkpoints.
+
+Every record is one JSON object per line:
+
+    {"seq": 12, "t": 840, "type": "cost", "cost": 3}
+
+Record types:
+    move        party position changed            {"to": [q, r]}
+    cost        tokens paid + time advanced       {"cost": c}
+    camp        clock moved to a wake-up tick     {"until": tick}
+    recover     dawn token refill                 {"exhaustion_recovery": x}
+    stealth     stealth roll                      {"biome", "mode", "success", "roll", "dc"}
+    trail       trail placed/erased on an edge    {"at": [q, r], "dir": d, "old", "value"}
+    restore     engine state set (e.g. undo)      {"state": snapshot}
+    checkpoint  full state for fast restores      {"state": snapshot, "trails": {...}}
+
+Records are appended as the engine works, some of them before the
+change they describe has finished (a dawn refill fires in the middle of
+a cost's time advance). Checkpoints are therefore only taken at settled
+points: once `checkpoint_every` records have accumulated, the next
+settle() call from the engine writes one. Restoring to any seq loads the
+nearest checkpoint at or before it and replays only the tail, never the
+whole journal.
+
+With a file attached only the records since the last checkpoint stay in
+memory (plus each checkpoint's file offset); older ones are read back
+from the file when a restore reaches them. Without a file every record
+is kept in memory.
+"""
+import bisect
+import json
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+Edge = Tuple[int, int, int]   # (q, r, direction)
+
+
+def _edge_key(edge: Edge) -> str:
+    return f"{edge[0]},{edge[1]},{edge[2]}"
+
+
+def _parse_edge(key: str) -> Edge:
+    q, r, d = key.split(",")
+    return int(q), int(r), int(d)
+
+
+def read_journal(path: str | Path) -> Iterator[dict]:
+    """Stream records from a journal file (for analytics)."""
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+class Journal:
+    """
+    Records SimulationEngine events. Journal(engine[, path]) installs
+    itself as engine.journal; GUI moves and trail edits (which happen
+    through commands, not the engine) are picked up via attach(state).
+    """
+
+    def __init__(self, engine, path: Optional[str | Path] = None,
+                 checkpoint_every: int = 500):
+        self.engine = engine
+        self.checkpoint_every = checkpoint_every
+
+        # records from seq _tail_start on (all of them without a file)
+        self._count = 0
+        self._tail: List[dict] = []
+        self._tail_start = 0
+
+        # seqs of checkpoint records, ascending, and (with a file) the
+        # byte offset of each in it
+        self._checkpoints: List[int] = []
+        self._offsets: List[int] = []
+        self._since_checkpoint = 0
+
+        # trail edges touched while journaling: value before the first
+        # touch, and current value
+        self._trail_origin: Dict[Edge, str] = {}
+        self._trail_now: Dict[Edge, str] = {}
+
+        self._replaying = False
+        self._path: Optional[Path] = None
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        if path is not None:
+            self._open(path)
+
+        engine.journal = self
+        self.checkpoint()
+
+    # ---------------------------------------------------------
+    # Recording
+    # ---------------------------------------------------------
+    def record(self, kind: str, fields: dict):
+        if self._replaying:
+            return
+
+        if kind == "trail":
+            edge = (fields["at"][0], fields["at"][1], fields["dir"])
+            self._trail_origin.setdefault(edge, fields["old"])
+            self._trail_now[edge] = fields["value"]
+
+        rec = {"seq": self._count, "t": self.engine.scheduler.ticks, "type": kind}
+        rec.update(fields)
+        self._append(rec)
+        self._since_checkpoint += 1
+
+    def settle(self):
+        """Engine state is consistent again: checkpoint if one is due."""
+        if self._since_checkpoint >= self.checkpoint_every and not self._replaying:
+            self.checkpoint()
+
+    def checkpoint(self):
+        rec = {
+            "seq": self._count,
+            "t": self.engine.scheduler.ticks,
+            "type": "checkpoint",
+            "state": self.engine.snapshot(include_rng=True),
+            "trails": {_edge_key(e): v for e, v in self._trail_now.items()},
+        }
+        self._append(rec)
+        self._checkpoints.append(rec["seq"])
+        self._since_checkpoint = 0
+
+    def _open(self, path):
+        self._path = Path(path)
+        self._file = self._path.open("ab")
+        self._size = self._file.seek(0, 2)
+
+    def _append(self, rec: dict):
+        if self._file is not None:
+            line = (json.dumps(rec, separators=(",", ":")) + "\n").encode("utf-8")
+            if rec["type"] == "checkpoint":
+                # everything before it can be read back from the file
+                self._offsets.append(self._size)
+                self._tail = []
+                self._tail_start = rec["seq"]
+            self._file.write(line)
+            self._size += len(line)
+        self._tail.append(rec)
+        self._count += 1
+
+    def _records(self, start: int, stop: int) -> Iterator[dict]:
+        """Records with seq in [start, stop), from memory or the file."""
+        if start >= self._tail_start:
+            yield from self._tail[start - self._tail_start:stop - self._tail_start]
+            return
+
+        i = bisect.bisect_right(self._checkpoints, start) - 1
+        seq = self._checkpoints[i]
+        self._file.flush()
+        with self._path.open("rb") as f:
+            f.seek(self._offsets[i])
+            for line in f:
+                if seq >= stop:
+                    return
+                if not line.strip():
+                    continue
+                if seq >= start:
+                    rec = json.loads(line)
+                    rec["seq"] = seq
+                    yield rec
+                seq += 1
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.engine.journal is self:
+            self.engine.journal = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ---------------------------------------------------------
+    # GUI wiring (moves and trail edits happen through commands)
+    # ---------------------------------------------------------
+    def attach(self, state):
+        def on_party_moved(pos):
+            self.record("move", {"to": list(pos)})
+            self.settle()
+
+        def on_trail_changed(coord, direction):
+            tile = state.grid.get(coord)
+            if tile is None:
+                return
+            edge = (coord[0], coord[1], direction)
+            value = tile.trails[direction]
+            old = self._trail_now.get(edge, self._trail_origin.get(edge))
+            if old == value:
+                return
+            self.record("trail", {
+                "at": list(coord), "dir": direction,
+                "old": value if old is None else old, "value": value,
+            })
+            self.settle()
+
+        state.events.subscribe("party_moved", on_party_moved)
+        state.events.subscribe("trail_changed", on_trail_changed)
+
+    # ---------------------------------------------------------
+    # Restore + replay
+    # ---------------------------------------------------------
+    def restore(self, seq: int):
+        """
+        Put the engine (party, time, dice) and journaled trails back to
+        the state right after record `seq`: load the nearest checkpoint
+        and replay the tail. A checkpoint is then appended so the
+        journal head matches the restored state.
+        """
+        if not 0 <= seq < self._count:
+            raise IndexError(f"seq {seq} outside journal (0..{self._count - 1})")
+
+        i = bisect.bisect_right(self._checkpoints, seq) - 1
+        cp_seq = self._checkpoints[i]
+        records = list(self._records(cp_seq, seq + 1))
+        cp = records[0]
+
+        self._replaying = True
+        try:
+            self.engine._apply_snapshot(cp["state"])
+
+            trails = {_parse_edge(k): v for k, v in cp["trails"].items()}
+            grid = self.engine.grid
+            for edge, origin in self._trail_origin.items():
+                value = trails.get(edge, origin)
+                grid.set_trail((edge[0], edge[1]), edge[2], value)
+                self.engine.invalidate_costs((edge[0], edge[1]))
+                self._trail_now[edge] = value
+
+            for rec in records[1:]:
+                self._apply(rec)
+        finally:
+            self._replaying = False
+
+        self.checkpoint()
+
+    def _apply(self, rec: dict):
+        engine = self.engine
+        kind = rec["type"]
+
+        if kind == "move":
+            engine.party.position = tuple(rec["to"])
+        elif kind == "cost":
+            engine.party.apply_movement_cost(rec["cost"])
+            engine.scheduler.advance(rec["cost"])
+        elif kind == "camp":
+            engine.scheduler.events.now = max(engine.scheduler.ticks, rec["until"])
+        elif kind == "recover":
+            party = engine.party
+            party.population.recover_tokens((party.row,), rec["exhaustion_recovery"])
+        elif kind == "stealth":
+            engine.rng.randint(1, 20)     # keep the dice stream in step
+        elif kind == "trail":
+            at = rec["at"]
+            engine.grid.set_trail((at[0], at[1]), rec["dir"], rec["value"])
+            engine.invalidate_costs((at[0], at[1]))
+            self._trail_now[(at[0], at[1], rec["dir"])] = rec["value"]
+        elif kind in ("restore", "checkpoint"):
+            engine._apply_snapshot(rec["state"])
+
+    # ---------------------------------------------------------
+    # Loading an existing journal file
+    # ---------------------------------------------------------
+    @classmethod
+    def load(cls, engine, path: str | Path, checkpoint_every: int = 500) -> "Journal":
+        """
+        Rebuild a journal from disk (new records are appended to the same
+        file). The engine is left at the journal head. The file is
+        streamed: only checkpoint offsets and the last tail are kept.
+        """
+        journal = cls.__new__(cls)
+        journal.engine = engine
+        journal.checkpoint_every = checkpoint_every
+        journal._count = 0
+        journal._tail = []
+        journal._tail_start = 0
+        journal._checkpoints = []
+        journal._offsets = []
+        journal._since_checkpoint = 0
+        journal._trail_origin = {}
+        journal._trail_now = {}
+        journal._replaying = False
+
+        offset = 0
+        with Path(path).open("rb") as f:
+            for line in f:
+                start, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                rec["seq"] = journal._count
+                journal._count += 1
+                if rec["type"] == "checkpoint":
+                    journal._checkpoints.append(rec["seq"])
+                    journal._offsets.append(start)
+                    journal._tail = [rec]
+                    journal._tail_start = rec["seq"]
+                    journal._since_checkpoint = 0
+                    continue
+                journal._tail.append(rec)
+                journal._since_checkpoint += 1
+                if rec["type"] == "trail":
+                    edge = (rec["at"][0], rec["at"][1], rec["dir"])
+                    journal._trail_origin.setdefault(edge, rec["old"])
+                    journal._trail_now[edge] = rec["value"]
+
+        if not journal._checkpoints:
+            raise ValueError(f"{path}: journal has no checkpoint")
+
+        journal._open(path)
+        engine.journal = journal
+        # appends (and persists) a checkpoint at the head
+        journal.restore(journal._count - 1)
+        return journal
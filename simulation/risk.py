@@ -0,0 +1,209 @@
+# file: simulation/risk.py
+"""
+Monte Carlo travel risk per hex.
+
+A RiskModel flattens everything a walk needs (edge costs, biome danger,
+stealth DCs) into arrays, so sampling never touches the live grid or
+engine and can run on a worker thread. MonteCarloRisk samples random
+journeys from the party's position; every hex entered rolls for an
+encounter (more likely the more dangerous the biome and the longer the
+crossing takes) and, on an encounter, a stealth check against the
+biome's DC. A hex's risk is the fraction of sampled crossings that
+ended in a failed check.
+
+RiskJob refines the estimate in batches on a background thread; the
+GUI polls latest() and redraws at its own pace. RiskModel.capture()
+copies only the compiled tables, so the GUI can leave building the
+model itself to the job's thread as well.
+"""
+import math
+import random
+import threading
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from core.cost_model import CostInputs
+from simulation.scheduler import TOKENS_PER_DAY
+
+Coord = Tuple[int, int]
+
+
+class RiskModel:
+    """Immutable flat snapshot of one world + travel mode for sampling."""
+
+    def __init__(self, coords: List[Coord], neighbors: array, edge_cost: array,
+                 danger: array, stealth_dc: array):
+        self.coords = coords
+        self.index: Dict[Coord, int] = {c: i for i, c in enumerate(coords)}
+        self.neighbors = neighbors      # i * 6 + d -> neighbour index or -1
+        self.edge_cost = edge_cost      # tokens to cross edge i * 6 + d
+        self.danger = danger            # encounters per day spent in hex i
+        self.stealth_dc = stealth_dc    # d20 target to stay unnoticed in hex i
+
+    @classmethod
+    def from_engine(cls, engine, mode_id: str) -> "RiskModel":
+        """Build from the engine's current grid, weather and cost rules."""
+        return cls.from_inputs(*cls.capture(engine, mode_id))
+
+    @staticmethod
+    def capture(engine, mode_id: str) -> Tuple[List[Coord], CostInputs, array,
+                                                List[float], List[float]]:
+        """
+        Copies of what a model is built from (cheap; Tk thread): coords,
+        cost inputs, interned biome per tile, and danger / stealth DC per
+        interned biome.
+        """
+        grid = engine.grid
+        biome_lib = grid.biome_lib
+        mode = engine.travel_modes.get(mode_id)
+        dc_mod = getattr(mode, "stealth_dc_mod", 0.0)
+
+        model = engine.cost_model
+        model.ensure(grid)
+        model.set_day(engine.scheduler.time_days)
+
+        biomes = [biome_lib.get(name) if name is not None else None
+                  for name in model.biome_ids.names]
+        danger = [getattr(b, "danger", 0.0) for b in biomes]
+        stealth_dc = [int(round(getattr(b, "stealth_dc", 12.0) + dc_mod)) for b in biomes]
+        return (list(model.coords), model.cost_inputs(mode_id),
+                array("l", model.biome_of), danger, stealth_dc)
+
+    @classmethod
+    def from_inputs(cls, coords: List[Coord], inputs: CostInputs, biome_of: array,
+                    danger: List[float], stealth_dc: List[float]) -> "RiskModel":
+        """Build from capture()'s copies (safe on a worker)."""
+        neighbors = inputs.neighbors
+        edge_cost = array("d", [c if n >= 0 else 0.0
+                                for c, n in zip(inputs.costs(), neighbors)])
+        return cls(coords, neighbors, edge_cost,
+                   array("d", [danger[b] for b in biome_of]),
+                   array("d", [stealth_dc[b] for b in biome_of]))
+
+
+class MonteCarloRisk:
+    """
+    Accumulates sampled crossings per hex. Each walk starts at `start`
+    and takes up to `walk_steps` random steps, never straight back.
+    """
+
+    def __init__(self, model: RiskModel, start: Coord, walk_steps: int = 40,
+                 seed: Optional[int] = None):
+        self.model = model
+        self.start = model.index.get(start, 0)
+        self.walk_steps = walk_steps
+        self.rng = random.Random(seed)
+
+        n = len(model.coords)
+        self.visits = array("l", bytes(n * array("l").itemsize))
+        self.incidents = array("l", bytes(n * array("l").itemsize))
+        self.walks = 0
+
+        # chance of at least one encounter while crossing edge i into
+        # hex n (Poisson with the destination's danger rate)
+        self._encounter = array("d", [
+            1.0 - math.exp(-model.danger[n] * model.edge_cost[i] / TOKENS_PER_DAY)
+            if n >= 0 else 0.0
+            for i, n in enumerate(model.neighbors)
+        ])
+
+    def run(self, walks: int):
+        m = self.model
+        neighbors = m.neighbors
+        stealth_dc = m.stealth_dc
+        encounter = self._encounter
+        visits, incidents = self.visits, self.incidents
+        rand, randint = self.rng.random, self.rng.randint
+        steps = self.walk_steps
+
+        if not m.coords:
+            return
+
+        for _ in range(walks):
+            here = self.start
+            back = -1
+            for _ in range(steps):
+                base = here * 6
+                options = [d for d in range(6)
+                           if neighbors[base + d] >= 0 and d != back]
+                if not options:
+                    break
+                d = options[int(rand() * len(options))]
+                edge = base + d
+                here = neighbors[edge]
+                back = (d + 3) % 6
+
+                visits[here] += 1
+                if rand() < encounter[edge] and randint(1, 20) < stealth_dc[here]:
+                    incidents[here] += 1
+        self.walks += walks
+
+    def estimate(self) -> Dict[Coord, float]:
+        """Risk 0..1 for every hex crossed at least once."""
+        coords = self.model.coords
+        return {
+            coords[i]: incidents / visits
+            for i, (visits, incidents) in enumerate(zip(self.visits, self.incidents))
+            if visits
+        }
+
+
+class RiskJob:
+    """
+    Runs MonteCarloRisk on a daemon thread in batches of `batch` walks
+    until `total_walks` or cancel(). latest() returns the most recent
+    estimate with a version number that increases per batch. `model` may
+    be a function building the RiskModel, called on the job's thread.
+    """
+
+    def __init__(self, model: Union[RiskModel, Callable[[], RiskModel]], start: Coord,
+                 total_walks: int = 20000, batch: int = 250, walk_steps: int = 40,
+                 seed: Optional[int] = None):
+        self.model = model
+        self.start_coord = start
+        self.walk_steps = walk_steps
+        self.seed = seed
+        self.sampler: Optional[MonteCarloRisk] = None
+        self.total_walks = total_walks
+        self.batch = batch
+
+        self.version = 0
+        self._estimate: Dict[Coord, float] = {}
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="risk-mc", daemon=True)
+
+    def start(self) -> "RiskJob":
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    @property
+    def walks(self) -> int:
+        return self.sampler.walks if self.sampler is not None else 0
+
+    def latest(self) -> Tuple[int, Dict[Coord, float]]:
+        with self._lock:
+            return self.version, self._estimate
+
+    def join(self, timeout: Optional[float] = None):
+        self._thread.join(timeout)
+
+    def _run(self):
+        model = self.model if isinstance(self.model, RiskModel) else self.model()
+        if self._cancelled.is_set():
+            return
+        sampler = self.sampler = MonteCarloRisk(model, self.start_coord,
+                                                self.walk_steps, self.seed)
+        while sampler.walks < self.total_walks and not self._cancelled.is_set():
+            sampler.run(min(self.batch, self.total_walks - sampler.walks))
+            estimate = sampler.estimate()
+            with self._lock:
+                self._estimate = estimate
+                self.version += 1
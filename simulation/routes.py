@@ -0,0 +1,89 @@
+# file: simulation/routes.py
+"""
+Cheapest routes between hexes.
+
+A RouteSnapshot copies the compiled edge costs for one travel mode, so
+searches never touch the live grid or engine and can run on a worker
+thread (see gui.job_service) while the map is being edited. capture()
+takes only copies of the compiled tables, so even building the snapshot
+(the per-edge cost pass) can happen on the worker.
+"""
+import heapq
+import math
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from core.cost_model import CostInputs
+
+Coord = Tuple[int, int]
+
+
+class Route(NamedTuple):
+    path: List[Coord]
+    cost: float
+
+
+class RouteSnapshot:
+    """Immutable copy of one world + travel mode for route searches."""
+
+    def __init__(self, coords: List[Coord], neighbors: array, edge_cost: array):
+        self.coords = coords
+        self.index: Dict[Coord, int] = {c: i for i, c in enumerate(coords)}
+        self.neighbors = neighbors      # i * 6 + d -> neighbour index or -1
+        self.edge_cost = edge_cost      # tokens to cross edge i * 6 + d
+
+    @classmethod
+    def from_engine(cls, engine, mode_id: str) -> "RouteSnapshot":
+        """Build from the engine's current grid, weather and cost rules."""
+        return cls.from_inputs(*cls.capture(engine, mode_id))
+
+    @staticmethod
+    def capture(engine, mode_id: str) -> Tuple[List[Coord], CostInputs]:
+        """Copies of what a snapshot is built from (cheap; Tk thread)."""
+        model = engine.cost_model
+        model.ensure(engine.grid)
+        model.set_day(engine.scheduler.time_days)
+        return list(model.coords), model.cost_inputs(mode_id)
+
+    @classmethod
+    def from_inputs(cls, coords: List[Coord], inputs: CostInputs) -> "RouteSnapshot":
+        """Build from capture()'s copies (safe on a worker)."""
+        return cls(coords, inputs.neighbors, inputs.costs())
+
+    def cheapest(self, start: Coord, goal: Coord) -> Optional[Route]:
+        """Dijkstra from start, stopping at goal. None if unreachable."""
+        index = self.index
+        s, g = index.get(start), index.get(goal)
+        if s is None or g is None:
+            return None
+
+        neighbors, edge_cost = self.neighbors, self.edge_cost
+        best = {s: 0.0}
+        came_from = {s: -1}
+        heap = [(0.0, s)]
+        while heap:
+            cost, i = heapq.heappop(heap)
+            if i == g:
+                break
+            if cost > best[i]:
+                continue
+            base = i * 6
+            for d in range(6):
+                n = neighbors[base + d]
+                if n < 0:
+                    continue
+                c = cost + edge_cost[base + d]
+                if c < best.get(n, math.inf):
+                    best[n] = c
+                    came_from[n] = i
+                    heapq.heappush(heap, (c, n))
+        else:
+            return None
+
+        path = []
+        i = g
+        while i >= 0:
+            path.append(self.coords[i])
+            i = came_from[i]
+        path.reverse()
+        return Route(path, best[g])
@@ -0,0 +1,198 @@
+# file: simulation/scheduler.py
+import heapq
+import itertools
+from typing import Any, Callable, List, Optional, Tuple
+
+# ---------------------------------------------------------
+# Time units
+# ---------------------------------------------------------
+# World time is kept as an integer tick count so that millions of
+# small advances never accumulate float error.
+# 6 tokens == 1 day (see Scheduler).
+TOKENS_PER_DAY = 6
+TICKS_PER_TOKEN = 60
+TICKS_PER_DAY = TOKENS_PER_DAY * TICKS_PER_TOKEN
+
+
+def tokens_to_ticks(tokens: float) -> int:
+    return int(round(tokens * TICKS_PER_TOKEN))
+
+
+def days_to_ticks(days: float) -> int:
+    return int(round(days * TICKS_PER_DAY))
+
+
+def ticks_to_days(ticks: int) -> float:
+    return ticks / TICKS_PER_DAY
+
+
+class ScheduledEvent:
+    """Handle returned by EventScheduler.schedule_*; use it to cancel."""
+
+    __slots__ = ("time", "callback", "args", "interval", "cancelled",
+                 "queued", "_owner")
+
+    def __init__(self, owner: "EventScheduler", time: int,
+                 callback: Callable[..., Any], args: tuple,
+                 interval: Optional[int]):
+        self._owner = owner
+        self.time = time
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+        self.queued = False
+
+    def cancel(self):
+        self._owner.cancel(self)
+
+
+class EventScheduler:
+    """
+    Priority-queue discrete-event scheduler with integer tick time.
+
+    - schedule_at(time, callback, *args)      absolute tick
+    - schedule_in(delay, callback, *args)     relative to now
+    - every(interval, callback, *args)        recurring event
+    - cancel(event) / event.cancel()          lazy removal
+    - run_until(time)                         fire everything due, move clock
+
+    Events at the same tick fire in the order they were scheduled.
+    Callbacks may schedule or cancel further events.
+    """
+
+    def __init__(self):
+        self.now: int = 0
+        self._queue: List[Tuple[int, int, ScheduledEvent]] = []
+        self._seq = itertools.count()
+        self._live = 0
+
+    def __len__(self) -> int:
+        """Number of pending (not cancelled) events."""
+        return self._live
+
+    # ---------------------------------------------------------
+    # Scheduling
+    # ---------------------------------------------------------
+    def schedule_at(self, time: int, callback: Callable[..., Any], *args,
+                    interval: Optional[int] = None) -> ScheduledEvent:
+        if time < self.now:
+            raise ValueError(f"cannot schedule in the past ({time} < {self.now})")
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be a positive number of ticks")
+
+        event = ScheduledEvent(self, time, callback, args, interval)
+        self._push(event)
+        return event
+
+    def schedule_in(self, delay: int, callback: Callable[..., Any], *args,
+                    interval: Optional[int] = None) -> ScheduledEvent:
+        return self.schedule_at(self.now + delay, callback, *args, interval=interval)
+
+    def every(self, interval: int, callback: Callable[..., Any], *args,
+              start: Optional[int] = None) -> ScheduledEvent:
+        """
+        Recurring event. First fires at `start` (default now + interval),
+        then every `interval` ticks until cancelled.
+        """
+        first = self.now + interval if start is None else start
+        return self.schedule_at(first, callback, *args, interval=interval)
+
+    def cancel(self, event: ScheduledEvent):
+        if event.cancelled:
+            return
+        event.cancelled = True
+        if event.queued:
+            # stays in the heap; skipped when popped
+            self._live -= 1
+
+    # ---------------------------------------------------------
+    # Running
+    # ---------------------------------------------------------
+    def peek_time(self) -> Optional[int]:
+        """Tick of the next live event, or None if the queue is empty."""
+        self._drop_cancelled()
+        return self._queue[0][0] if self._queue else None
+
+    def run_until(self, time: int) -> int:
+        """
+        Fire all events due at or before `time`, then set the clock to
+        `time`. Returns the number of events fired.
+        """
+        queue = self._queue
+        pop = heapq.heappop
+        fired = 0
+
+        while queue and queue[0][0] <= time:
+            t, _, event = pop(queue)
+            event.queued = False
+            if event.cancelled:
+                continue
+            self._live -= 1
+
+            self.now = t
+            event.callback(*event.args)
+            fired += 1
+
+            if event.interval is not None and not event.cancelled:
+                event.time = t + event.interval
+                self._push(event)
+
+        if time > self.now:
+            self.now = time
+        return fired
+
+    def advance(self, ticks: int) -> int:
+        return self.run_until(self.now + ticks)
+
+    def reset(self):
+        """Clear all pending events and rewind the clock to 0."""
+        for _, _, event in self._queue:
+            event.queued = False
+        self.now = 0
+        self._queue.clear()
+        self._live = 0
+
+    def _push(self, event: ScheduledEvent):
+        event.queued = True
+        self._live += 1
+        heapq.heappush(self._queue, (event.time, next(self._seq), event))
+
+    def _drop_cancelled(self):
+        queue = self._queue
+        while queue and queue[0][2].cancelled:
+            heapq.heappop(queue)[2].queued = False
+
+
+class Scheduler:
+    """
+    Tracks world time in 'days'. 6 tokens == 1 daytime.
+
+    Facade over an EventScheduler: advance(cost) moves the integer
+    clock forward by `cost` tokens and fires any world events that
+    fall due along the way.
+    """
+
+    def __init__(self, time_days: float = 0.0):
+        self.events = EventScheduler()
+        self.events.now = days_to_ticks(time_days)
+
+    @property
+    def ticks(self) -> int:
+        return self.events.now
+
+    @property
+    def time_days(self) -> float:
+        return ticks_to_days(self.events.now)
+
+    @time_days.setter
+    def time_days(self, value: float):
+        # Moves the clock only; pending events are left untouched.
+        self.events.now = days_to_ticks(value)
+
+    def advance(self, cost: float):
+        # 6 tokens = 1 day
+        self.events.advance(tokens_to_ticks(cost))
+
+    def reset(self):
+        self.events.reset()
@@ -0,0 +1,228 @@
+# file: simulation/session.py
+"""
+Session snapshots (.hexsession): everything needed to resume a campaign
+in one file, read in one go.
+
+Layout (integers little-endian):
+
+    header   b"HEXSESS" | version u16 | meta length u32 | rng length u32 |
+             grid length u32
+    meta     zlib-compressed JSON
+                 party          serializer.party_to_dict()
+                 ticks          world clock (scheduler)
+                 seed, rng_version, rng_gauss
+                 travel_mode    the selected travel mode id
+                 libraries      {name: fingerprint} of the loaded libraries
+    rng      Mersenne Twister state, uint32 * 625
+    grid     a complete .hexmap (core.map_format), palettes + RLE + zlib
+
+Library fingerprints are hashes of the library contents (not of the CSV
+files), so a session saved against other biome/trail/mode/modifier
+definitions is caught on resume even if the files only moved. Cosmetic
+fields (colors, names, descriptions; config_cache.cosmetic_fields) are
+left out: recoloring a biome doesn't change how the session plays.
+
+Pending scheduler events are callbacks and are not saved; the clock is.
+"""
+import hashlib
+import json
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import asdict, dataclass, field, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from core import map_format
+from core.config_cache import cosmetic_fields
+from core.grid import HexGrid
+from core.party import Party
+from core.serializer import party_from_dict, party_to_dict
+from simulation.scheduler import ticks_to_days
+
+MAGIC = b"HEXSESS"
+VERSION = 1
+
+SUFFIX = ".hexsession"
+
+_HEADER = struct.Struct("<7sHIII")
+
+_SWAP = sys.byteorder != "little"
+
+
+class LibraryMismatch(ValueError):
+    """The session was saved against different library definitions."""
+
+    def __init__(self, names: List[str]):
+        super().__init__("session libraries differ from the loaded ones: " + ", ".join(names))
+        self.names = names
+
+
+# ---------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------
+def _canonical(value):
+    if is_dataclass(value):
+        return _canonical(asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def fingerprint(entries: Dict[str, Any], ignore: FrozenSet[str] = frozenset()) -> str:
+    """Content hash of a library's {id: dataclass} table, without the `ignore` fields."""
+    table = {key: {f: v for f, v in _canonical(entry).items() if f not in ignore}
+             for key, entry in entries.items()}
+    text = json.dumps(table, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def library_fingerprints(engine) -> Dict[str, str]:
+    """Fingerprints of what the simulation reads from the engine's libraries."""
+    grid = engine.grid
+    tables = {
+        "travel_modes": engine.travel_modes.modes,
+        "modifiers": engine.modifiers.modifiers,
+    }
+    if grid.biome_lib is not None:
+        tables["biomes"] = grid.biome_lib.biomes
+    if grid.trail_lib is not None:
+        tables["trails"] = grid.trail_lib.types
+    return {name: fingerprint(entries, cosmetic_fields(name))
+            for name, entries in tables.items()}
+
+
+# ---------------------------------------------------------
+# Session
+# ---------------------------------------------------------
+@dataclass
+class Session:
+    grid: HexGrid
+    party: Party
+    ticks: int
+    rng_state: Tuple
+    travel_mode: str = "normal"
+    seed: Any = None
+    libraries: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def time_days(self) -> float:
+        return ticks_to_days(self.ticks)
+
+    def mismatched(self, engine) -> List[str]:
+        """Names of libraries whose fingerprint differs from the engine's."""
+        current = library_fingerprints(engine)
+        return sorted(name for name, value in self.libraries.items()
+                      if current.get(name) != value)
+
+    def restore(self, engine):
+        """
+        Put the engine in the saved state. The party is updated in place
+        when the roster matches (so views of it stay valid), otherwise
+        replaced. Pending scheduler events are kept; the clock is set.
+        """
+        grid = self.grid
+        grid.biome_lib = engine.grid.biome_lib
+        grid.trail_lib = engine.grid.trail_lib
+        engine.grid = grid
+
+        party, saved = engine.party, self.party
+        if [m.name for m in party.members] == [m.name for m in saved.members]:
+            for m, s in zip(party.members, saved.members):
+                m.tokens = s.tokens
+                m.exhaustion = s.exhaustion
+            party.leader_index = saved.leader_index
+            party.position = saved.position
+        else:
+            engine.party = saved
+            engine.cost_model.party = saved
+        engine.cost_model.invalidate_modes()
+
+        engine.scheduler.events.now = self.ticks
+        engine.seed = self.seed
+        engine.rng.setstate(self.rng_state)
+
+
+def save_session(path, engine, travel_mode: str = "normal", compression: str = "zlib") -> int:
+    """Write the engine's grid, party, clock and dice; returns bytes written."""
+    version, internal, gauss = engine.rng.getstate()
+    seed = engine.seed if isinstance(engine.seed, (int, str)) else None
+    meta = {
+        "party": party_to_dict(engine.party),
+        "ticks": engine.scheduler.ticks,
+        "seed": seed,
+        "rng_version": version,
+        "rng_gauss": gauss,
+        "travel_mode": travel_mode,
+        "libraries": library_fingerprints(engine),
+    }
+    meta_bytes = zlib.compress(json.dumps(meta, separators=(",", ":")).encode("utf-8"))
+    rng = array("I", internal)
+    if _SWAP:
+        rng.byteswap()
+    rng_bytes = rng.tobytes()
+    grid_bytes = map_format.encode(engine.grid.tiles.items(), compression)
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(meta_bytes), len(rng_bytes), len(grid_bytes)))
+        f.write(meta_bytes)
+        f.write(rng_bytes)
+        f.write(grid_bytes)
+    tmp.replace(path)
+    return _HEADER.size + len(meta_bytes) + len(rng_bytes) + len(grid_bytes)
+
+
+def load_session(path) -> Session:
+    """Read a session file; OSError if unreadable, ValueError if not a valid session."""
+    data = Path(path).read_bytes()
+    try:
+        return _parse(path, data)
+    except (struct.error, zlib.error, KeyError, TypeError, IndexError) as exc:
+        raise ValueError(f"{path}: damaged session file ({exc})") from exc
+
+
+def _parse(path, data: bytes) -> Session:
+    magic, version, meta_len, rng_len, grid_len = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a session file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported session version {version}")
+
+    pos = _HEADER.size
+    meta = json.loads(zlib.decompress(data[pos:pos + meta_len]))
+    pos += meta_len
+    rng = array("I", data[pos:pos + rng_len])
+    if _SWAP:
+        rng.byteswap()
+    pos += rng_len
+    grid = map_format.loads(data[pos:pos + grid_len])
+
+    return Session(
+        grid=grid,
+        party=party_from_dict(meta["party"]),
+        ticks=meta["ticks"],
+        rng_state=(meta["rng_version"], tuple(rng), meta["rng_gauss"]),
+        travel_mode=meta.get("travel_mode", "normal"),
+        seed=meta.get("seed"),
+        libraries=meta.get("libraries", {}),
+    )
+
+
+def resume(path, engine, strict: bool = True) -> Session:
+    """
+    load_session() + restore(). With `strict`, raises LibraryMismatch
+    (leaving the engine untouched) if the libraries changed since the save.
+    """
+    session = load_session(path)
+    mismatched = session.mismatched(engine)
+    if mismatched and strict:
+        raise LibraryMismatch(mismatched)
+    session.restore(engine)
+    return session
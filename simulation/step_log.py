@@ -0,0 +1,68 @@
+# file: simulation/step_log.py
+import csv
+from typing import Iterable, List, Optional, TextIO
+
+from simulation.engine import StepRecord
+
+
+def step_log_header(member_names: List[str]) -> List[str]:
+    header = [
+        "index", "day", "q", "r", "direction", "cost",
+        "mode_mod", "biome_mod", "trail_mod", "slope", "weather",
+    ]
+    for name in member_names:
+        header.append(f"{name}_tokens")
+        header.append(f"{name}_exhaustion")
+    header += ["stealth_success", "stealth_roll", "stealth_dc"]
+    return header
+
+
+def step_log_row(step: StepRecord) -> list:
+    row = [
+        step.index, f"{step.day:.4f}", step.position[0], step.position[1],
+        step.direction, step.cost,
+        step.mode_mod, step.biome_mod, step.trail_mod, step.slope, step.weather,
+    ]
+    for tokens, exhaustion in zip(step.tokens, step.exhaustion):
+        row.append(tokens)
+        row.append(exhaustion)
+    if step.stealth is None:
+        row += ["", "", ""]
+    else:
+        row += list(step.stealth)
+    return row
+
+
+def write_steps_csv(
+    steps: Iterable[StepRecord],
+    out: TextIO,
+    member_names: List[str],
+    limit: Optional[int] = None,
+    flush_every: int = 1000,
+) -> int:
+    """
+    Stream step records to a CSV file one row at a time.
+
+    Only the current record is held in memory, so this works for runs
+    of any length. Stops after `limit` rows if given (the generator is
+    closed, cancelling the journey). Returns the number of rows written.
+    """
+    writer = csv.writer(out)
+    writer.writerow(step_log_header(member_names))
+
+    written = 0
+    try:
+        for step in steps:
+            writer.writerow(step_log_row(step))
+            written += 1
+            if written % flush_every == 0:
+                out.flush()
+            if limit is not None and written >= limit:
+                break
+    finally:
+        close = getattr(steps, "close", None)
+        if close is not None:
+            close()
+
+    out.flush()
+    return written
@@ -0,0 +1,319 @@
+# file: simulation/sweep.py
+"""
+Parameter sweeps for balancing the CSV configs.
+
+Every combination of travel mode × party file × map × route is run
+through SimulationEngine.simulate_journey in a process pool. Each
+finished case is cached on disk under a hash of its full configuration
+(including the contents of the files it reads), so re-running a sweep
+skips finished cases and an interrupted sweep resumes where it stopped.
+All results are written to one CSV table, one column per field.
+
+    python -m simulation.sweep --maps radius:7 radius:12 \
+        --parties config/party.csv --route 0,0,1,2,3,3,4,5 \
+        --until 30 --out sweep.csv
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+Coord = Tuple[int, int]
+
+CONFIG_FILES = ("biomes.csv", "trails.csv", "travel_modes.csv", "modifiers.csv")
+
+RESULT_FIELDS = [
+    "steps", "days", "final_q", "final_r", "stop_reason",
+    "tokens_spent", "camps", "mean_exhaustion", "max_exhaustion",
+]
+
+
+@dataclass(frozen=True)
+class SweepCase:
+    mode_id: str
+    party_path: str
+    map_spec: str                  # path to a JSON map, or "radius:N"
+    route: Tuple[int, ...]         # direction indices, walked in a loop
+    until_days: float
+    start: Coord = (0, 0)
+    config_dir: str = "config"
+
+    def key(self) -> str:
+        """Hash of the case fields plus every input file's contents."""
+        h = hashlib.sha256()
+        h.update(json.dumps(asdict(self), sort_keys=True).encode("utf-8"))
+        for path in self._input_files():
+            h.update(path.name.encode("utf-8"))
+            h.update(_file_digest(path))
+        return h.hexdigest()[:32]
+
+    def _input_files(self) -> List[Path]:
+        files = [Path(self.config_dir) / name for name in CONFIG_FILES]
+        files.append(Path(self.party_path))
+        if not self.map_spec.startswith("radius:"):
+            files.append(Path(self.map_spec))
+        return files
+
+
+@dataclass
+class SweepReport:
+    total: int
+    cached: int
+    ran: int
+    out_path: Path
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+def _file_digest(path: Path) -> bytes:
+    if not path.exists():
+        return b"<missing>"
+    return hashlib.sha256(path.read_bytes()).digest()
+
+
+# ---------------------------------------------------------
+# Building the grid of configurations
+# ---------------------------------------------------------
+def build_cases(
+    party_paths: Sequence[str],
+    map_specs: Sequence[str],
+    routes: Sequence[Sequence[int]],
+    until_days: float,
+    mode_ids: Optional[Sequence[str]] = None,
+    config_dir: str = "config",
+) -> List[SweepCase]:
+    """
+    Cartesian product of modes × parties × maps × routes.
+    `mode_ids` defaults to every row of travel_modes.csv.
+    """
+    if mode_ids is None:
+        from core.travel_modes import TravelModeLibrary
+
+        lib = TravelModeLibrary()
+        lib.load_from_csv(Path(config_dir) / "travel_modes.csv")
+        mode_ids = lib.ids()
+
+    return [
+        SweepCase(mode_id, party_path, map_spec, tuple(route), until_days,
+                  config_dir=config_dir)
+        for mode_id, party_path, map_spec, route in itertools.product(
+            mode_ids, party_paths, map_specs, routes
+        )
+    ]
+
+
+# ---------------------------------------------------------
+# Running one case (executes inside a worker process)
+# ---------------------------------------------------------
+_library_memo: Dict[str, tuple] = {}
+
+
+def _load_libraries(config_dir: str):
+    # the parent compiles the library cache before starting the pool, so
+    # each worker unpickles it instead of parsing the CSVs again
+    libs = _library_memo.get(config_dir)
+    if libs is None:
+        from core.config_cache import load_libraries
+
+        libs = load_libraries(config_dir)
+        _library_memo[config_dir] = libs
+    return libs
+
+
+def _load_map(map_spec: str):
+    from core.grid import HexGrid
+
+    if map_spec.startswith("radius:"):
+        grid = HexGrid()
+        grid.generate_hex_radius(int(map_spec.split(":", 1)[1]))
+        return grid
+
+    with open(map_spec, encoding="utf-8") as f:
+        return HexGrid.from_dict(json.load(f))
+
+
+def run_case(case: SweepCase) -> Dict[str, object]:
+    from core.party import load_party_from_csv
+    from simulation.engine import SimulationEngine
+
+    biome_lib, trail_lib, travel_modes, modifiers = _load_libraries(case.config_dir)
+
+    grid = _load_map(case.map_spec)
+    grid.biome_lib = biome_lib
+    grid.trail_lib = trail_lib
+
+    party = load_party_from_csv(case.party_path, leader_index=0, start_pos=case.start)
+    engine = SimulationEngine(grid, party, travel_modes)
+    engine.modifiers = modifiers
+
+    # the case owns its grid, so trailblazing modes lay trails on it
+    result = engine.simulate_journey(
+        itertools.cycle(case.route), case.mode_id, until=case.until_days,
+        trail_grid=grid,
+    )
+
+    exhaustion = [m.exhaustion for m in party.members] or [0.0]
+    return {
+        "steps": result.steps,
+        "days": round(result.days, 6),
+        "final_q": result.position[0],
+        "final_r": result.position[1],
+        "stop_reason": result.stop_reason,
+        "tokens_spent": result.tokens_spent,
+        "camps": result.camps,
+        "mean_exhaustion": sum(exhaustion) / len(exhaustion),
+        "max_exhaustion": max(exhaustion),
+    }
+
+
+def _run_keyed(key: str, case: SweepCase):
+    return key, run_case(case)
+
+
+# ---------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------
+def _cache_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{key}.json"
+
+
+def _read_cached(cache_dir: Path, key: str) -> Optional[Dict[str, object]]:
+    path = _cache_path(cache_dir, key)
+    try:
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)["result"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        # missing or half-written by an interrupted run: recompute
+        return None
+
+
+def _write_cached(cache_dir: Path, key: str, case: SweepCase, result: Dict[str, object]):
+    path = _cache_path(cache_dir, key)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"case": asdict(case), "result": result}, f)
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------
+# Sweep driver
+# ---------------------------------------------------------
+def run_sweep(
+    cases: Iterable[SweepCase],
+    out_path: str | Path,
+    cache_dir: str | Path = ".sweep_cache",
+    workers: Optional[int] = None,
+) -> SweepReport:
+    """
+    Run every case not already cached, spreading work across processes.
+    Each result is cached as soon as it finishes, so interrupting and
+    re-running resumes the sweep. Writes all results to `out_path`.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    cases = list(cases)
+    keys = [c.key() for c in cases]
+    results: Dict[str, Dict[str, object]] = {}
+
+    todo = []
+    for key, case in zip(keys, cases):
+        cached = _read_cached(cache_dir, key)
+        if cached is not None:
+            results[key] = cached
+        elif key not in results:
+            todo.append((key, case))
+
+    # identical cases only need to run once
+    todo = list(dict(todo).items())
+    cached_count = len(cases) - len(todo)
+
+    failed: Dict[str, str] = {}
+    if todo:
+        from core.config_cache import load_libraries
+
+        for config_dir in {case.config_dir for _, case in todo}:
+            load_libraries(config_dir)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_keyed, key, case): (key, case) for key, case in todo}
+            for fut in as_completed(futures):
+                key, case = futures[fut]
+                try:
+                    _, result = fut.result()
+                except Exception as exc:  # keep the rest of the sweep going
+                    failed[key] = f"{type(exc).__name__}: {exc}"
+                    continue
+                _write_cached(cache_dir, key, case, result)
+                results[key] = result
+
+    out_path = Path(out_path)
+    write_results(out_path, cases, keys, results)
+
+    return SweepReport(
+        total=len(cases),
+        cached=cached_count,
+        ran=len(todo) - len(failed),
+        out_path=out_path,
+        failed=failed,
+    )
+
+
+def write_results(out_path: Path, cases: List[SweepCase], keys: List[str],
+                  results: Dict[str, Dict[str, object]]):
+    """One row per case, one column per configuration/result field."""
+    header = ["key", "mode_id", "party_path", "map_spec", "route", "until_days"]
+    header += RESULT_FIELDS
+
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    with tmp.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for key, case in zip(keys, cases):
+            result = results.get(key)
+            if result is None:
+                continue
+            writer.writerow(
+                [key, case.mode_id, case.party_path, case.map_spec,
+                 " ".join(map(str, case.route)), case.until_days]
+                + [result[name] for name in RESULT_FIELDS]
+            )
+    os.replace(tmp, out_path)
+
+
+# ---------------------------------------------------------
+# Command line
+# ---------------------------------------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run a travel parameter sweep.")
+    ap.add_argument("--modes", nargs="*", default=None,
+                    help="travel mode ids (default: all in travel_modes.csv)")
+    ap.add_argument("--parties", nargs="+", default=["config/party.csv"])
+    ap.add_argument("--maps", nargs="+", default=["radius:7"],
+                    help="JSON map files or radius:N")
+    ap.add_argument("--route", action="append", default=None,
+                    help="comma-separated direction indices; repeatable")
+    ap.add_argument("--until", type=float, default=30.0, help="days per run")
+    ap.add_argument("--config-dir", default="config")
+    ap.add_argument("--out", default="sweep.csv")
+    ap.add_argument("--cache", default=".sweep_cache")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    routes = [tuple(int(d) for d in r.split(",")) for r in (args.route or ["0,3"])]
+    cases = build_cases(args.parties, args.maps, routes, args.until,
+                        mode_ids=args.modes, config_dir=args.config_dir)
+
+    report = run_sweep(cases, args.out, cache_dir=args.cache, workers=args.workers)
+    print(f"{report.total} cases: {report.cached} cached, {report.ran} ran, "
+          f"{len(report.failed)} failed -> {report.out_path}")
+    for key, err in report.failed.items():
+        print(f"  {key}: {err}")
+
+
+if __name__ == "__main__":
+    main()